@@ -3,267 +3,2100 @@ Meeting Notes AI - AI Analysis Module
 Handles OpenAI API integration and transcript analysis.
 """
 
+import asyncio
+import json
 import os
 import re
+import threading
 import time
+import zlib
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, List
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from cache import ResponseCache, make_cache_key, DEFAULT_MAX_BYTES
+from latency import LatencyTracker, hedged_call
+from rate_limiter import RateLimiter
+from retry_policy import CircuitBreaker, RetryPolicy, RATE_LIMIT, CONNECTION, TIMEOUT, SERVER
+
+# The OpenAI SDK (with httpx and pydantic) takes hundreds of milliseconds to
+# import, so it is only imported inside the functions that issue requests.
+# Demo mode and --help never load it.
 
 # Constants
 MODEL = "gpt-4o-mini"
 MAX_TOKENS = 1500
 TEMPERATURE = 0.7
+PROMPT_VERSION = 1  # Bump whenever build_prompt changes, to invalidate cached responses
+
+# Response cache
+CACHE_DIR = os.getenv("MEETING_NOTES_CACHE_DIR",
+                      os.path.join(os.path.expanduser("~"), ".cache", "meeting-notes-ai"))
+CACHE_MAX_BYTES = int(os.getenv("MEETING_NOTES_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+# Chunking (map-reduce analysis of long transcripts)
+CHARS_PER_TOKEN = 4  # Rough average for English text
+CHUNK_TOKEN_LIMIT = 6000  # Max estimated transcript tokens per request
+MAX_CHUNK_WORKERS = 8
+
+# Content-defined chunk boundaries: an edit only changes the chunks around it,
+# so the other chunks' cached partial analyses are reused
+CDC_WINDOW_TURNS = 3  # Speaker turns covered by the rolling boundary hash
+CDC_TARGET_FRACTION = 0.5  # Average chunk size as a fraction of the token budget
+CDC_MIN_FRACTION = 0.25  # No boundary before a chunk reaches this fraction
+
+# Deadlines and hedged requests (both off unless configured)
+DEFAULT_DEADLINE = float(os.getenv("MEETING_NOTES_DEADLINE", "0")) or None  # Seconds per analysis
+HEDGE_ENABLED = os.getenv("OPENAI_HEDGE", "").lower() in ("1", "true", "yes")
+HEDGE_MODEL = os.getenv("OPENAI_HEDGE_MODEL") or MODEL  # Model for the backup request
+HEDGE_PERCENTILE = 95  # Send the backup once the primary is slower than this percentile
+HEDGE_DEFAULT_DELAY = 15.0  # Hedging delay until enough latencies have been recorded
+
+# Fan-out (per-section) requests and section subsets
+FAN_OUT_ENABLED = os.getenv("MEETING_NOTES_FAN_OUT", "").lower() in ("1", "true", "yes")
+# Default completion token budget per section, used when a subset of sections
+# is requested (including one at a time in fan-out mode)
+SECTION_MAX_TOKENS = {
+    'summary': 300,
+    'action_items': 500,
+    'decisions': 350,
+    'questions': 350,
+    'attendees': 150
+}
+
+# Completion sizing and truncated responses
+# Local estimate of each section's output, sizing the first request's
+# max_tokens: (base tokens, extra tokens per 1000 transcript tokens), capped
+# by the section's budget. A response cut off at max_tokens is continued,
+# so an underestimate costs one follow-up request, not missing sections.
+SECTION_OUTPUT_ESTIMATE = {
+    'summary': (160, 10),
+    'action_items': (60, 40),
+    'decisions': (40, 25),
+    'questions': (40, 25),
+    'attendees': (20, 10)
+}
+MAX_CONTINUATIONS = 2  # Follow-up requests after a response is truncated
+
+# Transcript compression before API requests (see compress_transcript)
+COMPRESS_ENABLED = os.getenv("MEETING_NOTES_COMPRESS", "1").lower() not in ("0", "false", "no")
+FILLER_WORDS = ['um', 'umm', 'uh', 'uhh', 'erm', 'er', 'hmm', 'hm']
+FILLER_PHRASES = ['you know', 'I mean']  # Only removed when set off by commas
+
+# Live (incremental) analysis
+LIVE_CONTEXT_ITEMS = 10  # Most recent items per section sent as context with each update
+
+# Async batch analysis
+DEFAULT_CONCURRENCY = 8  # Max in-flight API requests for analyze_many
+
+# Client-side rate limiting (disabled unless a budget is configured)
+RATE_LIMIT_RPM = int(os.getenv("OPENAI_RPM", "0")) or None
+RATE_LIMIT_TPM = int(os.getenv("OPENAI_TPM", "0")) or None
+
+# Shared HTTP connection pool (sized for batch jobs times chunk workers)
+HTTP_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "64"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "32"))
+HTTP_KEEPALIVE_EXPIRY = 60.0  # Keep idle connections warm between batch requests
+HTTP_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("OPENAI_READ_TIMEOUT", "120"))
+HTTP2_ENABLED = os.getenv("OPENAI_HTTP2", "").lower() in ("1", "true", "yes")
+
+SYSTEM_PROMPT = "You are a helpful assistant that analyzes meeting transcripts and extracts key information."
+
+# Structured (JSON schema) output mode
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "action_items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "task": {"type": "string"},
+                    "assignee": {"type": ["string", "null"]}
+                },
+                "required": ["task", "assignee"],
+                "additionalProperties": False
+            }
+        },
+        "decisions": {"type": "array", "items": {"type": "string"}},
+        "questions": {"type": "array", "items": {"type": "string"}},
+        "attendees": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["summary", "action_items", "decisions", "questions", "attendees"],
+    "additionalProperties": False
+}
+JSON_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "meeting_analysis", "strict": True, "schema": ANALYSIS_SCHEMA}
+}
+
+# Demo mode keyword matching
+ACTION_KEYWORDS = ['will', 'should', 'need to', 'must', 'have to', 'going to', 'can you']
+DECISION_KEYWORDS = ['decided', 'agreed', 'approved', 'confirmed', 'let\'s', 'we will']
+_ACTION_KEYWORDS_RE = re.compile('|'.join(re.escape(keyword) for keyword in ACTION_KEYWORDS))
+_DECISION_KEYWORDS_RE = re.compile('|'.join(re.escape(keyword) for keyword in DECISION_KEYWORDS))
+DEMO_MAX_ITEMS = 10
+DEMO_MAX_ATTENDEES = 20
+
+# Lines that open a new speaker turn, e.g. "Sarah:" or "John Smith: ..."
+_SPEAKER_TURN_RE = re.compile(r"^\s*[A-Z][\w .'-]{0,40}:")
 
-# Initialize OpenAI client
+# Transcript compression: WebVTT/SRT headers and cue timings, bracketed
+# timestamps anywhere ("[10:15 AM]", "(00:01:02)") and bare ones starting a
+# line, but only when a speaker label follows ("10:30 works for me" is speech)
+_CUE_TIMING_RE = re.compile(r'^\s*(?:WEBVTT\b.*|[\d:.,]+\s*-->\s*[\d:.,]+.*)$')
+_TIMESTAMP_RE = re.compile(
+    r'[\[(]\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?(?:\s*[AaPp][Mm])?[\])]'
+    r'|^\s*\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?(?:\s*[AaPp][Mm])?\s*(?:[-–]\s*)?'
+    r"(?=[A-Z][\w .'-]{0,40}:(?:\s|$))"
+)
+# Removed timestamps and filler leave this marker behind, so only the gaps
+# they created are tidied and the rest of the line's spacing is untouched
+_GAP = '\x00'
+_LEADING_GAP_RE = re.compile(r'^[\s\x00]*\x00[\s,;:]*')
+_GAP_BEFORE_PUNCT_RE = re.compile(r'[\s\x00]*\x00[\s\x00]*(?=[,.!?;:]|$)')
+_GAP_RE = re.compile(r'[\s\x00]*\x00[\s\x00]*')
+
+# Initialize OpenAI clients
 _client = None
+_async_clients = {}  # event loop -> AsyncOpenAI client; its connections belong to that loop
+_http_client = None
+_client_lock = threading.Lock()
+_http_settings = {}
+_cache = None
+_rate_limiter = None
+_retry_policy = None
+_circuit_breaker = None
+_latency = LatencyTracker()
+_structured_output_supported = True  # Cleared once the endpoint rejects response_format
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a structured (JSON) response cannot be decoded."""
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when an analysis cannot finish within its deadline."""
+
+def configure_http_client(max_connections: Optional[int] = None, max_keepalive: Optional[int] = None,
+                          connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                          http2: Optional[bool] = None) -> None:
+    """
+    Override HTTP pool settings for the shared clients, e.g. from command-line options.
+    
+    Existing clients are discarded, so the next get_client() call builds a
+    new pool with these settings. Arguments left as None keep their defaults.
+    
+    Args:
+        max_connections: Maximum open connections
+        max_keepalive: Maximum idle connections kept alive for reuse
+        connect_timeout: Seconds to wait for a connection to be established
+        read_timeout: Seconds to wait for response data
+        http2: If True, negotiate HTTP/2 (requires the h2 package)
+    """
+    global _client, _http_client
+    settings = {
+        'max_connections': max_connections,
+        'max_keepalive': max_keepalive,
+        'connect_timeout': connect_timeout,
+        'read_timeout': read_timeout,
+        'http2': http2
+    }
+    with _client_lock:
+        _http_settings.clear()
+        _http_settings.update({name: value for name, value in settings.items() if value is not None})
+        _client = None
+        _async_clients.clear()
+        _http_client = None
+
+
+def _http_client_options() -> Dict[str, any]:
+    """Build keyword arguments for the SDK's HTTP client from the pool settings."""
+    from openai import DEFAULT_CONNECTION_LIMITS, Timeout
+    
+    max_connections = _http_settings.get('max_connections', HTTP_MAX_CONNECTIONS)
+    max_keepalive = min(_http_settings.get('max_keepalive', HTTP_MAX_KEEPALIVE), max_connections)
+    read_timeout = _http_settings.get('read_timeout', HTTP_READ_TIMEOUT)
+    http2 = _http_settings.get('http2', HTTP2_ENABLED)
+    if http2 and find_spec("h2") is None:
+        print("\n\033[93mHTTP/2 requires the h2 package (pip install h2). Using HTTP/1.1.\033[0m")
+        http2 = False
+    # Build Limits from the SDK's own httpx flavour so it matches its transport
+    limits = type(DEFAULT_CONNECTION_LIMITS)(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+    )
+    return {
+        'limits': limits,
+        'timeout': Timeout(read_timeout, connect=_http_settings.get('connect_timeout', HTTP_CONNECT_TIMEOUT)),
+        'http2': http2
+    }
+
+
+def _get_api_key() -> str:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable is not set")
+    return api_key
+
 
 def get_client():
-    """Get or create OpenAI client instance."""
-    global _client
+    """Get or create the shared OpenAI client instance (thread-safe)."""
+    global _client, _http_client
     if _client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is not set")
-        _client = OpenAI(api_key=api_key)
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI, DefaultHttpxClient
+                api_key = _get_api_key()
+                _http_client = DefaultHttpxClient(**_http_client_options())
+                _client = OpenAI(api_key=api_key, http_client=_http_client)
     return _client
 
 
-def build_prompt(transcript: str) -> str:
+def prewarm_connection() -> bool:
+    """
+    Build the shared client and open a pooled connection to the API host.
+    
+    Meant to run in the background before the first analysis, so DNS, TLS
+    and client setup are already done when the user submits a transcript.
+    Sends an unauthenticated HEAD request, which costs no API quota.
+    
+    Returns:
+        True if a connection was opened, False if warming failed
+    """
+    try:
+        client = get_client()
+        _http_client.head(str(client.base_url))
+    except Exception:
+        return False
+    return True
+
+
+def get_async_client():
+    """
+    Get or create the async OpenAI client for the running event loop (thread-safe).
+    
+    An async connection pool can only be used from the loop that opened it,
+    so each loop (e.g. each asyncio.run call) gets its own client. Clients of
+    loops that have since closed are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+            for stale in [other for other in _async_clients if other.is_closed()]:
+                del _async_clients[stale]
+            client = AsyncOpenAI(api_key=_get_api_key(),
+                                 http_client=DefaultAsyncHttpxClient(**_http_client_options()))
+            _async_clients[loop] = client
+    return client
+
+
+def get_cache() -> ResponseCache:
+    """Get or create the shared response cache."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(CACHE_DIR, CACHE_MAX_BYTES)
+    return _cache
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the shared rate limiter, or None if no RPM/TPM budget is configured."""
+    global _rate_limiter
+    if _rate_limiter is None and (RATE_LIMIT_RPM or RATE_LIMIT_TPM):
+        _rate_limiter = RateLimiter(RATE_LIMIT_RPM, RATE_LIMIT_TPM, max_concurrency=DEFAULT_CONCURRENCY)
+    return _rate_limiter
+
+
+def configure_rate_limiter(rpm: Optional[int] = None, tpm: Optional[int] = None,
+                           max_concurrency: int = DEFAULT_CONCURRENCY) -> Optional[RateLimiter]:
+    """
+    Replace the shared rate limiter, e.g. from command-line options.
+    
+    Args:
+        rpm: Requests per minute budget (None for unlimited)
+        tpm: Tokens per minute budget (None for unlimited)
+        max_concurrency: Upper bound for adaptive concurrency
+        
+    Returns:
+        The new limiter, or None if both budgets are unset
+    """
+    global _rate_limiter
+    _rate_limiter = RateLimiter(rpm, tpm, max_concurrency=max_concurrency) if (rpm or tpm) else None
+    return _rate_limiter
+
+
+def _rate_limit(transcript: str, structured: bool = False, sections: Optional[Dict[str, int]] = None):
+    """Context manager reserving rate limit budget for one request."""
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return nullcontext()
+    return limiter.limit(estimate_request_tokens(transcript, structured, sections))
+
+
+def _rate_limit_async(transcript: str, structured: bool = False, sections: Optional[Dict[str, int]] = None):
+    """Async context manager reserving rate limit budget for one request."""
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return nullcontext()
+    return limiter.limit_async(estimate_request_tokens(transcript, structured, sections))
+
+
+def _on_rate_limited() -> None:
+    """Tell the shared limiter that the server returned HTTP 429."""
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        limiter.on_rate_limited()
+
+
+def classify_api_error(error: Exception) -> Optional[str]:
+    """
+    Map an OpenAI SDK error to a retry category.
+    
+    Args:
+        error: Exception raised by an API call
+        
+    Returns:
+        Retry category, or None if the error should not be retried
+    """
+    from openai import APIConnectionError, APIStatusError, APITimeoutError, RateLimitError
+    
+    if isinstance(error, RateLimitError):
+        return RATE_LIMIT
+    if isinstance(error, APITimeoutError):
+        return TIMEOUT
+    if isinstance(error, APIConnectionError):
+        return CONNECTION
+    if isinstance(error, APIStatusError) and getattr(error, 'status_code', 0) >= 500:
+        return SERVER
+    return None
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Get the retry policy used for API requests."""
+    global _retry_policy
+    if _retry_policy is None:
+        _retry_policy = RetryPolicy(classify=classify_api_error)
+    return _retry_policy
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """Replace the retry policy used for API requests."""
+    global _retry_policy
+    _retry_policy = policy
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the circuit breaker guarding the API endpoint."""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker()
+    return _circuit_breaker
+
+
+def _is_openai_error(error: Exception, name: str) -> bool:
+    """Check whether an error is the named OpenAI SDK exception type."""
+    import openai
+    return isinstance(error, getattr(openai, name))
+
+
+def _is_schema_rejection(error: Exception) -> bool:
+    """Check whether an error is the API rejecting the JSON schema response format itself."""
+    if not _is_openai_error(error, 'BadRequestError'):
+        return False
+    details = ' '.join(str(part) for part in (getattr(error, 'param', None), getattr(error, 'code', None),
+                                              getattr(error, 'message', None) or str(error)) if part)
+    return 'response_format' in details or 'json_schema' in details
+
+
+def _check_circuit() -> None:
+    """Fail fast if the circuit breaker is open."""
+    if not get_circuit_breaker().allow():
+        raise CircuitOpenError("OpenAI API is unavailable; skipping requests until it recovers.")
+
+
+def _may_retry(retries: int, retry_count: Optional[int]) -> bool:
+    """Check a caller's overall retry cap; the retry policy still applies its own budgets."""
+    return retry_count is None or retries < retry_count
+
+
+def _handle_api_error(error: Exception, attempts: Dict[str, int], can_retry: bool) -> float:
+    """
+    Decide what to do after a failed API request.
+    
+    Records the outcome with the circuit breaker (only for errors that came
+    from the endpoint) and the rate limiter, then asks the retry policy for
+    a delay.
+    
+    Args:
+        error: Exception raised by the request
+        attempts: Retries so far per error category; updated in place
+        can_retry: False if retrying is not allowed at all
+        
+    Returns:
+        Seconds to wait before retrying
+        
+    Raises:
+        Exception: User-facing error if the request should not be retried
+    """
+    policy = get_retry_policy()
+    category = policy.classify(error)
+    if category in (CONNECTION, TIMEOUT, SERVER):
+        get_circuit_breaker().record_failure()
+    elif _is_openai_error(error, 'APIStatusError'):
+        # The endpoint answered, so it is healthy even if this request failed
+        get_circuit_breaker().record_success()
+    else:
+        # A local error (e.g. a missing API key) says nothing about the
+        # endpoint; just let another call probe if this one was the probe
+        get_circuit_breaker().release()
+    if category == RATE_LIMIT:
+        _on_rate_limited()
+    
+    delay = policy.next_delay(error, attempts) if can_retry else None
+    if delay is not None:
+        if category == RATE_LIMIT:
+            print(f"\n\033[93mRate limit reached. Waiting {delay:.1f} seconds before retry...\033[0m")
+        elif category == SERVER:
+            print(f"\n\033[93mOpenAI server error. Retrying in {delay:.1f} seconds...\033[0m")
+        else:
+            print(f"\n\033[93mConnection error. Retrying in {delay:.1f} seconds...\033[0m")
+        return delay
+    
+    if category == RATE_LIMIT:
+        raise Exception("Rate limit exceeded. Please try again later.")
+    if category in (CONNECTION, TIMEOUT):
+        raise Exception("Failed to connect to OpenAI API. Please check your internet connection.")
+    if _is_openai_error(error, 'APIError'):
+        raise Exception(f"OpenAI API error: {str(error)}")
+    raise Exception(f"Failed to analyze transcript: {str(error)}")
+
+
+def configure_latency(deadline: Optional[float] = None, hedge: Optional[bool] = None,
+                      hedge_model: Optional[str] = None, fan_out: Optional[bool] = None) -> None:
+    """
+    Set the default deadline, hedging and fan-out behaviour, e.g. from command-line options.
+    
+    Args:
+        deadline: Seconds allowed per analysis, including retries (None keeps the default)
+        hedge: If True, send a backup request when the primary is slow
+        hedge_model: Model used for backup requests (e.g. a faster one)
+        fan_out: If True, request each section separately and in parallel
+    """
+    global DEFAULT_DEADLINE, HEDGE_ENABLED, HEDGE_MODEL, FAN_OUT_ENABLED
+    if deadline is not None:
+        DEFAULT_DEADLINE = deadline or None
+    if hedge is not None:
+        HEDGE_ENABLED = hedge
+    if hedge_model is not None:
+        HEDGE_MODEL = hedge_model
+    if fan_out is not None:
+        FAN_OUT_ENABLED = fan_out
+
+
+def _time_left(deadline_at: Optional[float]) -> Optional[float]:
+    """
+    Get the seconds remaining before a deadline.
+    
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    if deadline_at is None:
+        return None
+    remaining = deadline_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("Analysis did not finish within the deadline.")
+    return remaining
+
+
+def _create_completion(client, transcript: str, structured: bool, deadline_at: Optional[float],
+                       hedge: bool, sections: Optional[Dict[str, int]] = None) -> Tuple[any, str]:
+    """
+    Send one completion request within the deadline, hedging it if requested.
+    
+    Returns:
+        (response, model that produced it)
+    """
+    kwargs = _completion_kwargs(transcript, structured, sections)
+    timeout = _time_left(deadline_at)
+    if timeout is not None:
+        kwargs['timeout'] = timeout
+        
+    def call(model: str):
+        start = time.monotonic()
+        response = client.chat.completions.create(**dict(kwargs, model=model))
+        _latency.record(time.monotonic() - start)
+        return response
+    
+    def backup():
+        # The primary runs under the caller's rate limit reservation; the
+        # backup is a request of its own and must fit the budgets too
+        with _rate_limit(transcript, structured, sections):
+            return call(HEDGE_MODEL)
+    
+    if not hedge:
+        return call(MODEL), MODEL
+    try:
+        response, backup_won = hedged_call(lambda: call(MODEL), backup,
+                                           _latency.percentile(HEDGE_PERCENTILE, HEDGE_DEFAULT_DELAY),
+                                           timeout)
+    except TimeoutError:
+        # Neither call answered in time: as much a timeout as the client's own
+        get_circuit_breaker().record_failure()
+        raise DeadlineExceededError("Analysis did not finish within the deadline.")
+    return response, HEDGE_MODEL if backup_won else MODEL
+
+
+def cache_key_for(transcript: str, structured: bool = False, sections: Optional[Dict[str, int]] = None) -> str:
+    """Build the response cache key for a transcript under the current settings."""
+    return make_cache_key(transcript, MODEL, PROMPT_VERSION, _max_tokens(sections), TEMPERATURE,
+                          response_format='json_schema' if structured else 'text',
+                          sections=list(sections) if sections else None)
+
+
+def resolve_sections(sections: Optional[Union[Iterable[str], Dict[str, int]]]) -> Optional[Dict[str, int]]:
+    """
+    Validate a section selection and attach token budgets.
+    
+    Args:
+        sections: Analysis keys to request (e.g. ['action_items']), or a
+            mapping of key to its completion token budget; None for all
+            
+    Returns:
+        Mapping of section key to token budget in response order, or None
+        if every section is requested with the default budgets
+        
+    Raises:
+        ValueError: If a section is unknown or none are selected
+    """
+    if sections is None:
+        return None
+    budgets = sections if isinstance(sections, dict) else {key: SECTION_MAX_TOKENS.get(key) for key in sections}
+    unknown = [key for key in budgets if key not in SECTION_MAX_TOKENS]
+    if unknown:
+        raise ValueError(f"Unknown section(s): {', '.join(unknown)}. "
+                         f"Choose from: {', '.join(RESPONSE_SECTIONS.values())}")
+    if not budgets:
+        raise ValueError("No sections selected")
+    if any(not isinstance(tokens, int) or tokens <= 0 for tokens in budgets.values()):
+        raise ValueError("Section token budgets must be positive integers")
+    if not isinstance(sections, dict) and len(budgets) == len(SECTION_MAX_TOKENS):
+        return None
+    return {key: budgets[key] for key in RESPONSE_SECTIONS.values() if key in budgets}
+
+
+def _max_tokens(sections: Optional[Dict[str, int]]) -> int:
+    """Completion token limit for a request covering the given sections."""
+    return sum(sections.values()) if sections else MAX_TOKENS
+
+
+def _section_keys(sections: Optional[Dict[str, int]]) -> List[str]:
+    """Analysis keys covered by a section selection, in response order."""
+    return list(sections) if sections else list(RESPONSE_SECTIONS.values())
+
+
+def select_sections(analysis: Dict[str, any], sections: Optional[Dict[str, int]]) -> Dict[str, any]:
+    """
+    Drop the sections of an analysis that weren't requested.
+    
+    Args:
+        analysis: Full analysis dictionary
+        sections: Selection from resolve_sections (None keeps everything)
+        
+    Returns:
+        Analysis dictionary with only the requested sections and its timestamp
+    """
+    if not sections:
+        return analysis
+    return {key: value for key, value in analysis.items() if key in sections or key not in SECTION_MAX_TOKENS}
+
+
+# What the prompt asks for under each section header, in response order
+SECTION_INSTRUCTIONS = {
+    'SUMMARY:': 'Provide a concise 3-5 sentence summary of the meeting',
+    'ACTION ITEMS:': 'List each action item on a new line, prefixed with "- ". Include assigned person if mentioned',
+    'DECISIONS MADE:': 'List each decision on a new line, prefixed with "- "',
+    'OPEN QUESTIONS:': 'List each open question or follow-up on a new line, prefixed with "- "',
+    'ATTENDEES:': 'List each attendee on a new line, prefixed with "- ". Only include if explicitly mentioned'
+}
+
+
+def build_prompt(transcript: str, sections: Optional[Iterable[str]] = None) -> str:
     """
     Construct the AI prompt for meeting transcript analysis.
     
     Args:
         transcript: The meeting transcript text
+        sections: Analysis keys to ask for (default: all of them)
         
     Returns:
         Formatted prompt string for the AI
     """
+    wanted = set(sections or RESPONSE_SECTIONS.values())
+    layout = '\n\n'.join(f"{header}\n[{instruction}]" for header, instruction in SECTION_INSTRUCTIONS.items()
+                         if RESPONSE_SECTIONS[header] in wanted)
     prompt = f"""Analyze the following meeting transcript and extract key information.
 
 Please provide your analysis in the following structured format:
 
-SUMMARY:
-[Provide a concise 3-5 sentence summary of the meeting]
+{layout}
+
+Meeting Transcript:
+{transcript}
+"""
+    return prompt
 
-ACTION ITEMS:
-[List each action item on a new line, prefixed with "- ". Include assigned person if mentioned]
 
-DECISIONS MADE:
-[List each decision on a new line, prefixed with "- "]
+# What each field of the JSON schema should contain
+JSON_FIELD_INSTRUCTIONS = {
+    'summary': 'a concise 3-5 sentence summary of the meeting',
+    'action_items': 'each task, with the assigned person or null',
+    'decisions': 'each decision made',
+    'questions': 'each open question or follow-up',
+    'attendees': 'only attendees explicitly mentioned'
+}
 
-OPEN QUESTIONS:
-[List each open question or follow-up on a new line, prefixed with "- "]
 
-ATTENDEES:
-[List each attendee on a new line, prefixed with "- ". Only include if explicitly mentioned]
+def build_json_prompt(transcript: str, sections: Optional[Iterable[str]] = None) -> str:
+    """
+    Construct the AI prompt for structured (JSON schema) analysis.
+    
+    The response layout is enforced by ANALYSIS_SCHEMA, so the prompt only
+    describes what each field should contain.
+    
+    Args:
+        transcript: The meeting transcript text
+        sections: Analysis keys to ask for (default: all of them)
+        
+    Returns:
+        Formatted prompt string for the AI
+    """
+    wanted = set(sections or JSON_FIELD_INSTRUCTIONS)
+    fields = '\n'.join(f"- {key}: {instruction}" for key, instruction in JSON_FIELD_INSTRUCTIONS.items()
+                       if key in wanted)
+    return f"""Analyze the following meeting transcript.
+
+{fields}
 
 Meeting Transcript:
 {transcript}
 """
-    return prompt
 
 
-def parse_response(response: str) -> Dict[str, any]:
+def json_response_format(sections: Optional[Iterable[str]] = None) -> Dict[str, any]:
     """
-    Parse AI response into structured data.
+    Build the response_format for a structured request.
     
     Args:
-        response: Raw response text from AI
+        sections: Analysis keys to ask for (default: all of them)
         
     Returns:
-        Dictionary containing parsed sections
+        JSON_RESPONSE_FORMAT, or a copy whose schema covers only the given sections
     """
-    result = {
-        'summary': '',
-        'action_items': [],
-        'decisions': [],
-        'questions': [],
-        'attendees': [],
-        'timestamp': datetime.now()
+    keys = [key for key in ANALYSIS_SCHEMA['required'] if not sections or key in set(sections)]
+    if keys == ANALYSIS_SCHEMA['required']:
+        return JSON_RESPONSE_FORMAT
+    schema = dict(ANALYSIS_SCHEMA, properties={key: ANALYSIS_SCHEMA['properties'][key] for key in keys},
+                  required=keys)
+    return {
+        "type": "json_schema",
+        "json_schema": dict(JSON_RESPONSE_FORMAT["json_schema"], schema=schema)
     }
+
+
+def build_messages(transcript: str, structured: bool = False,
+                   sections: Optional[Iterable[str]] = None) -> List[Dict[str, str]]:
+    """
+    Build the chat messages for a transcript analysis request.
     
-    # Split response into sections
-    sections = {
-        'SUMMARY:': 'summary',
-        'ACTION ITEMS:': 'action_items',
-        'DECISIONS MADE:': 'decisions',
-        'OPEN QUESTIONS:': 'questions',
-        'ATTENDEES:': 'attendees'
+    Args:
+        transcript: The meeting transcript text
+        structured: If True, use the JSON schema prompt
+        sections: Analysis keys to ask for (default: all of them)
+        
+    Returns:
+        List of chat messages for the completions API
+    """
+    prompt = build_json_prompt(transcript, sections) if structured else build_prompt(transcript, sections)
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _completion_kwargs(transcript: str, structured: bool = False,
+                       sections: Optional[Dict[str, int]] = None) -> Dict[str, any]:
+    """Build the keyword arguments for a chat completion request."""
+    kwargs = {
+        'model': MODEL,
+        'messages': build_messages(transcript, structured, sections),
+        'max_tokens': _max_tokens(sections),
+        'temperature': TEMPERATURE
     }
+    if structured:
+        kwargs['response_format'] = json_response_format(sections)
+    return kwargs
+
+
+# Section headers in the order the prompt requests them
+RESPONSE_SECTIONS = {
+    'SUMMARY:': 'summary',
+    'ACTION ITEMS:': 'action_items',
+    'DECISIONS MADE:': 'decisions',
+    'OPEN QUESTIONS:': 'questions',
+    'ATTENDEES:': 'attendees'
+}
+
+# A header must start the line, optionally decorated with markdown
+# ("## SUMMARY:", "**Action Items:**", "1. ATTENDEES:"); a body line that
+# merely mentions "summary:" is content, not a header
+_HEADER_RE = re.compile(
+    r'^[#>*_\s]*(?:\d+[.)]\s*)?[*_]*(' +
+    '|'.join(re.escape(header[:-1]) for header in RESPONSE_SECTIONS) +
+    r')[*_]*\s*:[*_]*\s*',
+    re.IGNORECASE
+)
+_HEADER_KEYS = {header[:-1]: key for header, key in RESPONSE_SECTIONS.items()}
+_BULLET_RE = re.compile(r'^[-•*]\s*')
+_EMPTY_ITEMS = frozenset(['none', 'n/a', 'not mentioned', 'not mentioned in transcript'])
+
+
+class ResponseParser:
+    """
+    Incremental parser for AI responses.
     
-    current_section = None
-    lines = response.strip().split('\n')
+    Feed response text as it streams in; a section is reported as complete
+    as soon as the next section header arrives (or the response ends).
+    Parsing is a single linear pass: each line is tested against one
+    anchored header pattern and summary lines are joined once at the end.
     
-    for line in lines:
+    Only the requested sections appear in the result; anything the model
+    writes under another header is skipped.
+    """
+    
+    def __init__(self, sections: Optional[Iterable[str]] = None):
+        self._keys = list(sections or RESPONSE_SECTIONS.values())
+        self.result = {key: '' if key == 'summary' else [] for key in self._keys}
+        self.result['timestamp'] = datetime.now()
+        self._pending = []  # Fragments of the current, unfinished line
+        self._summary_lines = []
+        self._current_section = None
+        self._completed = set()
+        
+    def feed(self, text: str) -> List[Tuple[str, any]]:
+        """
+        Consume a piece of response text.
+        
+        Args:
+            text: Next fragment of the response
+            
+        Returns:
+            List of (section_key, value) pairs completed by this fragment
+        """
+        completed = []
+        if '\n' not in text:
+            if text:
+                self._pending.append(text)
+            return completed
+        
+        lines = text.split('\n')
+        if self._pending:
+            self._pending.append(lines[0])
+            lines[0] = ''.join(self._pending)
+        self._pending = [lines.pop()]
+        for line in lines:
+            self._process_line(line, completed)
+        return completed
+        
+    def close(self) -> List[Tuple[str, any]]:
+        """
+        Finish parsing once the response is complete.
+        
+        Returns:
+            List of (section_key, value) pairs for the final section and for
+            any sections the response never mentioned
+        """
+        completed = []
+        self._process_line(''.join(self._pending), completed)
+        self._pending = []
+        if self._current_section in self.result:
+            completed.append(self._complete(self._current_section))
+        self._current_section = None
+        for key in self._keys:
+            if key not in self._completed:
+                completed.append(self._complete(key))
+        if 'summary' in self.result:
+            self.result['summary'] = ' '.join(self._summary_lines)
+        return completed
+        
+    def _complete(self, key: str) -> Tuple[str, any]:
+        self._completed.add(key)
+        if key == 'summary':
+            self.result['summary'] = ' '.join(self._summary_lines)
+        return key, self.result[key]
+        
+    def _process_line(self, line: str, completed: List[Tuple[str, any]]) -> None:
         line = line.strip()
         if not line:
-            continue
-            
+            return
+        
         # Check if this line is a section header
-        section_found = False
-        for header, key in sections.items():
-            if header in line.upper():
-                current_section = key
-                section_found = True
-                break
-        
-        if section_found:
-            continue
-            
+        match = _HEADER_RE.match(line)
+        if match:
+            key = _HEADER_KEYS[match.group(1).upper()]
+            if self._current_section in self.result and self._current_section != key:
+                completed.append(self._complete(self._current_section))
+            self._current_section = key
+            # Content may follow the header on the same line
+            line = line[match.end():]
+            if not line:
+                return
+        
         # Add content to current section
-        if current_section:
-            if current_section == 'summary':
-                if result['summary']:
-                    result['summary'] += ' ' + line
-                else:
-                    result['summary'] = line
-            else:
-                # Remove bullet points and dashes
-                cleaned_line = re.sub(r'^[-•*]\s*', '', line)
-                if cleaned_line and cleaned_line.lower() not in ['none', 'n/a', 'not mentioned', 'not mentioned in transcript']:
-                    result[current_section].append(cleaned_line)
-    
-    return result
+        if self._current_section not in self.result:
+            return
+        if self._current_section == 'summary':
+            self._summary_lines.append(line)
+        else:
+            # Remove bullet points and dashes
+            cleaned_line = _BULLET_RE.sub('', line)
+            if cleaned_line and cleaned_line.lower() not in _EMPTY_ITEMS:
+                self.result[self._current_section].append(cleaned_line)
 
 
-def analyze_transcript_demo(transcript: str) -> Dict[str, any]:
+def parse_response(response: str, sections: Optional[Iterable[str]] = None) -> Dict[str, any]:
     """
-    Demo mode: Analyze transcript using pattern matching (no API call).
-    Provides a working demo without requiring an API key.
+    Parse AI response into structured data.
     
     Args:
-        transcript: The meeting transcript text
+        response: Raw response text from AI
+        sections: Analysis keys that were requested (default: all of them)
         
     Returns:
-        Dictionary containing structured analysis results
+        Dictionary containing parsed sections
     """
-    lines = transcript.split('\n')
+    parser = ResponseParser(sections)
+    parser.feed(response)
+    parser.close()
+    return parser.result
+
+
+def _clean_items(values: any) -> List[str]:
+    """Validate a JSON list of strings and drop empty or placeholder entries."""
+    if not isinstance(values, list):
+        raise StructuredOutputError("expected a list")
+    items = []
+    for value in values:
+        if not isinstance(value, str):
+            raise StructuredOutputError("expected a list of strings")
+        value = value.strip()
+        if value and value.lower() not in _EMPTY_ITEMS:
+            items.append(value)
+    return items
+
+
+def decode_json_response(response: str, sections: Optional[Iterable[str]] = None) -> Dict[str, any]:
+    """
+    Decode a structured (JSON schema) AI response into the analysis dict.
     
-    # Extract potential attendees (names followed by colon)
-    attendees = []
-    for line in lines:
-        if ':' in line:
-            name = line.split(':')[0].strip()
-            if name and len(name.split()) <= 3 and name[0].isupper():
-                if name not in attendees:
-                    attendees.append(name)
+    Action items are rendered as "task (assignee)" so structured and text
+    results share the same shape.
     
-    # Generate demo summary
-    summary = f"Demo analysis of meeting transcript with {len(attendees)} participants. " \
-              f"The transcript contains {len(lines)} lines of discussion. " \
-              f"This is a demonstration mode - connect an OpenAI API key for AI-powered analysis."
+    Args:
+        response: Raw JSON text from AI
+        sections: Analysis keys that were requested (default: all of them)
+        
+    Returns:
+        Dictionary containing parsed sections
+        
+    Raises:
+        StructuredOutputError: If the response is not valid analysis JSON
+    """
+    try:
+        data = json.loads(response)
+    except (TypeError, ValueError) as e:
+        raise StructuredOutputError(f"invalid JSON: {str(e)}")
+    keys = list(sections or RESPONSE_SECTIONS.values())
+    if not isinstance(data, dict):
+        raise StructuredOutputError("not an object")
+    if 'summary' in keys and not isinstance(data.get('summary'), str):
+        raise StructuredOutputError("missing summary")
     
-    # Extract action items (lines with "will", "should", "need to", etc.)
-    action_keywords = ['will', 'should', 'need to', 'must', 'have to', 'going to', 'can you']
     action_items = []
-    for line in lines:
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in action_keywords):
-            # Clean up the line
-            if ':' in line:
-                line = line.split(':', 1)[1].strip()
-            if line and len(line) > 10:
-                action_items.append(line[:100])
-    
-    # Extract decisions (lines with "decided", "agreed", "approved", etc.)
-    decision_keywords = ['decided', 'agreed', 'approved', 'confirmed', 'let\'s', 'we will']
-    decisions = []
-    for line in lines:
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in decision_keywords):
-            if ':' in line:
-                line = line.split(':', 1)[1].strip()
-            if line and len(line) > 10:
-                decisions.append(line[:100])
-    
-    # Extract questions (lines with "?")
-    questions = []
-    for line in lines:
-        if '?' in line:
-            if ':' in line:
-                line = line.split(':', 1)[1].strip()
-            if line:
-                questions.append(line[:100])
+    for item in data.get('action_items', []):
+        if isinstance(item, str):
+            item = {'task': item, 'assignee': None}
+        if not isinstance(item, dict) or not isinstance(item.get('task'), str):
+            raise StructuredOutputError("invalid action item")
+        task = item['task'].strip()
+        assignee = item.get('assignee')
+        if not task or task.lower() in _EMPTY_ITEMS:
+            continue
+        if isinstance(assignee, str) and assignee.strip() and assignee.strip().lower() not in task.lower():
+            task = f"{task} ({assignee.strip()})"
+        action_items.append(task)
     
-    return {
-        'summary': summary,
-        'action_items': action_items[:10],  # Limit to 10
-        'decisions': decisions[:10],
-        'questions': questions[:10],
-        'attendees': attendees[:20],
-        'timestamp': datetime.now()
+    result = {
+        'summary': data['summary'].strip() if 'summary' in keys else '',
+        'action_items': action_items,
+        'decisions': _clean_items(data.get('decisions', [])),
+        'questions': _clean_items(data.get('questions', [])),
+        'attendees': _clean_items(data.get('attendees', [])),
     }
+    result = {key: result[key] for key in keys}
+    result['timestamp'] = datetime.now()
+    return result
 
 
-def analyze_transcript(transcript: str, retry_count: int = 2, use_demo: bool = False) -> Dict[str, any]:
+def analyze_transcript_demo(transcript: str) -> Dict[str, any]:
     """
-    Analyze meeting transcript using OpenAI API or demo mode.
+    Demo mode: Analyze transcript using pattern matching (no API call).
+    Provides a working demo without requiring an API key.
     
     Args:
         transcript: The meeting transcript text
-        retry_count: Number of retries for transient failures
-        use_demo: If True, use demo mode without API calls
         
     Returns:
         Dictionary containing structured analysis results
-        
-    Raises:
-        Exception: If API call fails after retries (when not in demo mode)
     """
-    # Use demo mode if requested or if API key is not available
-    if use_demo:
-        return analyze_transcript_demo(transcript)
+    return analyze_lines_demo(transcript.split('\n'))
+
+
+def analyze_lines_demo(lines: Iterable[str]) -> Dict[str, any]:
+    """
+    Demo mode over any iterable of lines, such as an open file or stdin.
+    
+    Every line is classified in a single pass: it is lowercased once and
+    matched against precompiled keyword patterns. Lines are consumed one at
+    a time, so memory is bounded by the output caps (plus the set of
+    distinct speaker names) rather than by the size of the input.
+    
+    Args:
+        lines: Transcript lines, with or without trailing newlines
+        
+    Returns:
+        Dictionary containing structured analysis results, identical to
+        analyze_transcript_demo on the same text
+    """
+    attendees = []
+    seen_attendees = set()
+    action_items = []
+    decisions = []
+    questions = []
+    line_count = 0
+    ends_with_newline = True  # An empty input still counts as one empty line
+    
+    for line in lines:
+        line_count += 1
+        ends_with_newline = line.endswith('\n')
+        if ends_with_newline:
+            line = line[:-1]
+        
+        # Potential attendees are names followed by a colon; the text after
+        # the speaker's name is what gets reported as an item
+        if ':' in line:
+            name, _, content = line.partition(':')
+            name = name.strip()
+            if name and len(name.split()) <= 3 and name[0].isupper():
+                if name not in seen_attendees:
+                    seen_attendees.add(name)
+                    if len(attendees) < DEMO_MAX_ATTENDEES:
+                        attendees.append(name)
+            content = content.strip()
+        else:
+            content = line
+        
+        # Action items and decisions need a keyword and a meaningful length
+        if len(content) > 10:
+            want_action = len(action_items) < DEMO_MAX_ITEMS
+            want_decision = len(decisions) < DEMO_MAX_ITEMS
+            if want_action or want_decision:
+                line_lower = line.lower()
+                if want_action and _ACTION_KEYWORDS_RE.search(line_lower):
+                    action_items.append(content[:100])
+                if want_decision and _DECISION_KEYWORDS_RE.search(line_lower):
+                    decisions.append(content[:100])
+        
+        # Questions are lines with "?"
+        if content and len(questions) < DEMO_MAX_ITEMS and '?' in line:
+            questions.append(content[:100])
+    
+    # Text ending in a newline has a final empty line, as with str.split('\n')
+    if ends_with_newline:
+        line_count += 1
+    
+    # Generate demo summary
+    summary = f"Demo analysis of meeting transcript with {len(seen_attendees)} participants. " \
+              f"The transcript contains {line_count} lines of discussion. " \
+              f"This is a demonstration mode - connect an OpenAI API key for AI-powered analysis."
+    
+    return {
+        'summary': summary,
+        'action_items': action_items,
+        'decisions': decisions,
+        'questions': questions,
+        'attendees': attendees,
+        'timestamp': datetime.now()
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheaply estimate the number of tokens in a piece of text.
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Approximate token count (at least 1 for non-empty text)
+    """
+    if not text:
+        return 0
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def estimate_request_tokens(transcript: str, structured: bool = False,
+                            sections: Optional[Dict[str, int]] = None) -> int:
+    """
+    Estimate the tokens a request will consume against a TPM budget.
+    
+    Args:
+        transcript: Transcript text sent in the request
+        structured: If True, estimate for the JSON schema prompt
+        sections: Requested sections and their token budgets (default: all)
+        
+    Returns:
+        Estimated prompt tokens plus the completion token limit
+    """
+    messages = build_messages(transcript, structured, sections)
+    prompt_tokens = sum(estimate_tokens(message['content']) for message in messages)
+    return prompt_tokens + _max_tokens(sections)
+
+
+def estimate_output_tokens(transcript: str, sections: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    Cheaply estimate the completion tokens each requested section will need.
+    
+    Args:
+        transcript: Transcript text sent in the request
+        sections: Requested sections and their token budgets (default: all)
+        
+    Returns:
+        Mapping of section key to estimated tokens, capped by its budget
+    """
+    thousands = estimate_tokens(transcript) / 1000
+    budgets = sections or SECTION_MAX_TOKENS
+    return {key: min(budgets[key], base + int(growth * thousands))
+            for key, (base, growth) in SECTION_OUTPUT_ESTIMATE.items() if key in budgets}
+
+
+def _filler_alternation(fillers: Iterable[str]) -> str:
+    """Build a regex alternation of fillers as written and capitalized, but never in capitals."""
+    variants = {variant for filler in fillers for variant in (filler, filler[:1].upper() + filler[1:])}
+    return '|'.join(re.escape(variant) for variant in sorted(variants, key=len, reverse=True))
+
+
+def _filler_patterns(words: Iterable[str], phrases: Iterable[str]) -> List[re.Pattern]:
+    """
+    Compile filler removal patterns; each also consumes the commas around the filler.
     
-    # Try to use API, fall back to demo if it fails
-    last_error = None
+    Matching is case-sensitive, so "um" and a sentence-initial "Um" are
+    filler while acronyms such as "ER" or "HM" are kept.
+    """
+    patterns = []
+    if words:
+        word_re = _filler_alternation(words)
+        patterns.append(re.compile(r'(?:,\s*)?\b(?:' + word_re + r')\b(?:\s*,)?'))
+    if phrases:
+        phrase_re = _filler_alternation(phrases)
+        # "you know, ..." or "..., you know" but not "you know the answer"
+        patterns.append(re.compile(r'(?:,\s*)?\b(?:' + phrase_re + r')\b\s*,'
+                                   r'|,\s*\b(?:' + phrase_re + r')\b(?=\s*(?:[.!?;]|$))'))
+    return patterns
+
+
+_filler_res = _filler_patterns(FILLER_WORDS, FILLER_PHRASES)
+_compression_stats = {'transcripts': 0, 'tokens_before': 0, 'tokens_saved': 0}
+_compression_lock = threading.Lock()
+
+
+def configure_compression(enabled: Optional[bool] = None, filler_words: Optional[Iterable[str]] = None,
+                          filler_phrases: Optional[Iterable[str]] = None) -> None:
+    """
+    Set the default transcript compression behaviour.
     
-    for attempt in range(retry_count + 1):
+    Args:
+        enabled: If False, send transcripts to the API unchanged
+        filler_words: Words removed wherever they appear as whole words
+        filler_phrases: Phrases removed when set off by commas
+    """
+    global COMPRESS_ENABLED, FILLER_WORDS, FILLER_PHRASES, _filler_res
+    if enabled is not None:
+        COMPRESS_ENABLED = enabled
+    if filler_words is not None:
+        FILLER_WORDS = list(filler_words)
+    if filler_phrases is not None:
+        FILLER_PHRASES = list(filler_phrases)
+    _filler_res = _filler_patterns(FILLER_WORDS, FILLER_PHRASES)
+
+
+def _clean_text(text: str) -> str:
+    """Close the gaps left by removals and collapse whitespace."""
+    if _GAP in text:
+        text = _LEADING_GAP_RE.sub('', text)
+        text = _GAP_BEFORE_PUNCT_RE.sub('', text)
+        text = _GAP_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def compress_transcript(transcript: str, strip_filler: bool = True, strip_timestamps: bool = True,
+                        merge_turns: bool = True) -> Tuple[str, Dict[str, int]]:
+    """
+    Shrink a transcript before it is sent to the API.
+    
+    Normalizes whitespace, then optionally removes timestamps and filler
+    (FILLER_WORDS, and FILLER_PHRASES set off by commas), drops a turn that
+    exactly repeats the one before it (crosstalk duplicates), and joins
+    consecutive turns by the same speaker into one, dropping the repeated
+    labels. Joined turns keep their line breaks so that split_transcript can
+    still cut a long turn between lines. Lines without a speaker label, and
+    lines that are only a label such as "Agenda:", are kept as they are.
+    
+    Args:
+        transcript: The meeting transcript text
+        strip_filler: If True, remove filler words and phrases
+        strip_timestamps: If True, remove timestamps and subtitle cue timings
+        merge_turns: If True, join consecutive turns by the same speaker
+        
+    Returns:
+        (compressed transcript, {'tokens_before', 'tokens_after', 'tokens_saved'})
+    """
+    turns = []  # [speaker or None, text]
+    previous = None
+    lines = transcript.split('\n')
+    for index, line in enumerate(lines):
+        if strip_timestamps:
+            if _CUE_TIMING_RE.match(line):
+                continue
+            if line.strip().isdigit() and index + 1 < len(lines) and _CUE_TIMING_RE.match(lines[index + 1]):
+                continue  # SRT cue number
+            line = _TIMESTAMP_RE.sub(_GAP, line)
+        line = _clean_text(line)
+        if not line:
+            continue
+        
+        match = _SPEAKER_TURN_RE.match(line)
+        # "Let's meet at 3:30" is not a turn by "Let's meet at 3", and a
+        # heading like "Action items:" has no text to attribute
+        if match and line[match.end():match.end() + 1] == ' ':
+            speaker, text = line[:match.end() - 1].strip(), line[match.end():]
+        else:
+            speaker, text = None, line
+        if strip_filler:
+            for pattern in _filler_res:
+                text = pattern.sub(_GAP, text)
+        text = _clean_text(text)
+        if not text or (speaker, text) == previous:
+            continue
+        previous = (speaker, text)
+        
+        if merge_turns and speaker and turns and turns[-1][0] == speaker:
+            turns[-1][1] += '\n' + text
+        else:
+            turns.append([speaker, text])
+    
+    compressed = '\n'.join(f"{speaker}: {text}" if speaker else text for speaker, text in turns)
+    before = estimate_tokens(transcript)
+    after = estimate_tokens(compressed)
+    stats = {'tokens_before': before, 'tokens_after': after, 'tokens_saved': max(0, before - after)}
+    with _compression_lock:
+        _compression_stats['transcripts'] += 1
+        _compression_stats['tokens_before'] += before
+        _compression_stats['tokens_saved'] += stats['tokens_saved']
+    return compressed, stats
+
+
+def get_compression_stats() -> Dict[str, int]:
+    """Get totals for every transcript compressed by this process."""
+    with _compression_lock:
+        return dict(_compression_stats)
+
+
+def _split_turns(transcript: str) -> List[str]:
+    """Split a transcript into speaker turns, keeping each turn's lines together."""
+    turns = []
+    current = []
+    for line in transcript.split('\n'):
+        if current and _SPEAKER_TURN_RE.match(line):
+            turns.append('\n'.join(current))
+            current = []
+        current.append(line)
+    if current:
+        turns.append('\n'.join(current))
+    return turns
+
+
+def _split_oversized(text: str, max_chars: int) -> List[str]:
+    """
+    Hard-split a single turn that does not fit in one chunk, preferring line breaks.
+    
+    Pieces after the first repeat the turn's speaker label, so a chunk that
+    starts inside a merged turn still says who is talking.
+    """
+    match = _SPEAKER_TURN_RE.match(text)
+    label = text[:match.end()].strip() + ' ' if match else ''
+    if len(label) * 2 > max_chars:
+        label = ''
+    max_chars -= len(label)
+    pieces = []
+    current = []
+    size = 0
+    for line in text.split('\n'):
+        while len(line) > max_chars:
+            if current:
+                pieces.append('\n'.join(current))
+                current, size = [], 0
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and size + len(line) + 1 > max_chars:
+            pieces.append('\n'.join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        pieces.append('\n'.join(current))
+    return pieces[:1] + [label + piece for piece in pieces[1:]]
+
+
+def _turn_fingerprint(turn: str) -> int:
+    """Hash a speaker turn, ignoring trailing whitespace on its lines."""
+    normalized = '\n'.join(line.rstrip() for line in turn.split('\n'))
+    return zlib.crc32(normalized.encode('utf-8'))
+
+
+def split_transcript(transcript: str, max_tokens: int = CHUNK_TOKEN_LIMIT) -> List[str]:
+    """
+    Split a transcript into chunks that each fit within a token budget.
+    
+    Chunks break on speaker turns so a single utterance is never cut in half,
+    unless that one turn is itself larger than the budget. Boundaries are
+    content-defined: a rolling hash over the last CDC_WINDOW_TURNS turns
+    decides where to cut, so editing one part of a transcript leaves the
+    other chunks (and their cached analyses) unchanged.
+    
+    Args:
+        transcript: The meeting transcript text
+        max_tokens: Maximum estimated tokens per chunk
+        
+    Returns:
+        List of transcript chunks, in order
+    """
+    if estimate_tokens(transcript) <= max_tokens:
+        return [transcript]
+    
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    target_chars = max(1, int(max_chars * CDC_TARGET_FRACTION))
+    min_chars = int(max_chars * CDC_MIN_FRACTION)
+    chunks = []
+    current = []
+    size = 0
+    window = []
+    rolling = 0
+    for turn in _split_turns(transcript):
+        turn_size = len(turn) + 1
+        if turn_size > max_chars:
+            if current:
+                chunks.append('\n'.join(current))
+                current, size = [], 0
+            chunks.extend(_split_oversized(turn, max_chars))
+            continue
+        if current and size + turn_size > max_chars:
+            chunks.append('\n'.join(current))
+            current, size = [], 0
+        current.append(turn)
+        size += turn_size
+        
+        fingerprint = _turn_fingerprint(turn)
+        window.append(fingerprint)
+        rolling = (rolling + fingerprint) & 0xFFFFFFFF
+        if len(window) > CDC_WINDOW_TURNS:
+            rolling = (rolling - window.pop(0)) & 0xFFFFFFFF
+        # Cut with probability proportional to the turn's length, so chunks
+        # average target_chars however long the turns are
+        if size >= min_chars and rolling < (turn_size << 32) // target_chars:
+            chunks.append('\n'.join(current))
+            current, size = [], 0
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
+
+
+def _dedupe(items: List[str]) -> List[str]:
+    """Remove case-insensitive duplicates while preserving first-seen order."""
+    seen = set()
+    unique = []
+    for item in items:
+        key = item.strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def merge_analyses(analyses: List[Dict[str, any]]) -> Dict[str, any]:
+    """
+    Reduce several partial analyses into a single analysis dictionary.
+    
+    Args:
+        analyses: Parsed analyses, one per transcript chunk, in order
+        
+    Returns:
+        Dictionary containing the merged analysis results
+    """
+    merged = {
+        'summary': ' '.join(a['summary'] for a in analyses if a.get('summary')),
+        'action_items': _dedupe([i for a in analyses for i in a.get('action_items', [])]),
+        'decisions': _dedupe([i for a in analyses for i in a.get('decisions', [])]),
+        'questions': _dedupe([i for a in analyses for i in a.get('questions', [])]),
+        'attendees': _dedupe([i for a in analyses for i in a.get('attendees', [])]),
+    }
+    if analyses:
+        # Keep only the sections that were requested
+        merged = {key: value for key, value in merged.items() if any(key in a for a in analyses)}
+    merged['timestamp'] = datetime.now()
+    return merged
+
+
+def render_response(analysis: Dict[str, any]) -> str:
+    """
+    Render an analysis in the text response format, e.g. to cache a result
+    assembled from several requests.
+    
+    Args:
+        analysis: Analysis dictionary
+        
+    Returns:
+        Response text that parse_response turns back into the same sections
+    """
+    parts = []
+    for header, key in RESPONSE_SECTIONS.items():
+        if key in analysis:
+            value = analysis[key]
+            body = value if key == 'summary' else '\n'.join(f"- {item}" for item in value)
+            parts.append(f"{header}\n{body}".rstrip())
+    return '\n\n'.join(parts) + '\n'
+
+
+def _completed_sections(response: str, sections: Optional[Dict[str, int]]) -> Dict[str, any]:
+    """Parse a truncated response, keeping only sections followed by another header."""
+    return dict(ResponseParser(_section_keys(sections)).feed(response))
+
+
+def _continuation_sections(response: str, sections: Optional[Dict[str, int]],
+                           requested: Dict[str, int]) -> Optional[Dict[str, int]]:
+    """
+    Work out what to ask for after a response was cut off at max_tokens.
+    
+    Args:
+        response: The truncated response text
+        sections: Sections the caller asked for and their budgets (None for all)
+        requested: Sections and budgets the truncated request was sent with
+        
+    Returns:
+        Unfinished sections with their full budgets, or None if asking again
+        couldn't get further
+    """
+    complete = _completed_sections(response, sections)
+    budgets = sections or SECTION_MAX_TOKENS
+    remaining = {key: budgets[key] for key in _section_keys(sections) if key not in complete}
+    if not remaining or (not complete and remaining == requested):
+        return None
+    return remaining
+
+
+SectionCallback = Callable[[str, any], None]
+
+
+def _emit_sections(analysis: Dict[str, any], on_section: Optional[SectionCallback]) -> None:
+    """Report every section of a finished analysis to a section callback."""
+    if on_section:
+        for key in RESPONSE_SECTIONS.values():
+            if key in analysis:
+                on_section(key, analysis[key])
+
+
+def _stream_response(client, transcript: str, parser: ResponseParser,
+                     on_section: SectionCallback, progress: Dict[str, bool],
+                     deadline_at: Optional[float] = None,
+                     sections: Optional[Dict[str, int]] = None) -> Tuple[str, Optional[str]]:
+    """
+    Stream a completion, reporting each section as soon as it is complete.
+    
+    The parser is left open: the caller closes it once it knows whether the
+    response was complete or cut off at max_tokens.
+    
+    Args:
+        client: OpenAI client
+        transcript: Transcript text that fits in a single request
+        parser: Incremental parser receiving the streamed text
+        on_section: Callback(section_key, value) for each completed section
+        progress: Set to {'started': True} once any section has been reported
+        deadline_at: Optional time.monotonic() deadline for the whole stream
+        sections: Requested sections and their token budgets (default: all)
+        
+    Returns:
+        (full response text, finish reason)
+        
+    Raises:
+        DeadlineExceededError: If the deadline passes before the stream ends
+    """
+    kwargs = _completion_kwargs(transcript, sections=sections)
+    timeout = _time_left(deadline_at)
+    if timeout is not None:
+        # Only bounds each read; a stream that keeps sending is checked below
+        kwargs['timeout'] = timeout
+    stream = client.chat.completions.create(**kwargs, stream=True)
+    
+    parts = []
+    finish_reason = None
+    for chunk in stream:
+        if deadline_at is not None and time.monotonic() >= deadline_at:
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+            raise DeadlineExceededError("Analysis did not finish within the deadline.")
+        if not chunk.choices:
+            continue
+        finish_reason = chunk.choices[0].finish_reason or finish_reason
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        for key, value in parser.feed(delta):
+            progress['started'] = True
+            on_section(key, value)
+    return ''.join(parts), finish_reason
+
+
+def _mark_truncated(outcome: Optional[Dict[str, bool]]) -> None:
+    if outcome is not None:
+        outcome['truncated'] = True
+
+
+def _request_analysis(transcript: str, retry_count: Optional[int], use_cache: bool = True,
+                      on_section: Optional[SectionCallback] = None,
+                      structured: bool = False, deadline_at: Optional[float] = None,
+                      hedge: bool = False, sections: Optional[Dict[str, int]] = None,
+                      continuation: int = 0, outcome: Optional[Dict[str, bool]] = None) -> Dict[str, any]:
+    """
+    Send one transcript (or chunk) to the API and parse the response.
+    
+    The first request's max_tokens is sized by estimate_output_tokens. If
+    the response is cut off at max_tokens anyway, the sections it finished
+    are kept and the rest are requested again with their full budgets.
+    
+    Args:
+        transcript: Transcript text that fits in a single request
+        retry_count: Maximum retries in total for transient failures (None
+            leaves it to the retry policy's per-error-class budgets)
+        use_cache: If False, bypass the response cache
+        on_section: If given, stream the completion and call
+            on_section(section_key, value) as each section completes
+        structured: If True, request a JSON schema response and decode it
+            directly, falling back to the text format if unsupported
+        deadline_at: Monotonic time by which every attempt, including
+            retries and backoff, must have finished
+        hedge: If True, send a backup request when the primary is slow
+            (not used when streaming)
+        sections: Sections to request and their token budgets (default: all)
+        continuation: Number of follow-up requests made for a truncated response
+        outcome: Set to {'truncated': True} if the result is still missing
+            sections cut off at max_tokens (such results are never cached)
+        
+    Returns:
+        Dictionary containing structured analysis results
+        
+    Raises:
+        DeadlineExceededError: If the deadline passes first
+        Exception: If API call fails after retries
+    """
+    global _structured_output_supported
+    structured = structured and _structured_output_supported
+    if structured:
+        on_section = None
+    
+    def parse(text: str) -> Dict[str, any]:
+        return decode_json_response(text, sections) if structured else parse_response(text, sections)
+    
+    if use_cache:
+        key = cache_key_for(transcript, structured, sections)
+        cached = get_cache().get(key)
+        if cached is not None:
+            try:
+                result = parse(cached)
+            except StructuredOutputError:
+                result = None
+            if result is not None:
+                _emit_sections(result, on_section)
+                return result
+    
+    # Cache keys use the full budgets; the request itself asks for what the
+    # estimate says it needs, and follow-ups for truncated answers get it all.
+    # Truncated JSON can't be continued, so structured requests get it all too.
+    can_continue = not structured and continuation < MAX_CONTINUATIONS
+    requested = estimate_output_tokens(transcript, sections) if can_continue and not continuation else sections
+    remaining = None
+    
+    # Once sections have been shown, a retry would show them twice
+    progress = {'started': False}
+    attempts = {}
+    retries = 0
+    
+    while True:
+        _check_circuit()
         try:
             client = get_client()
-            prompt = build_prompt(transcript)
             
-            response = client.chat.completions.create(
-                model=MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that analyzes meeting transcripts and extracts key information."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE
-            )
+            if on_section:
+                parser = ResponseParser(sections)
+                with _rate_limit(transcript, sections=requested):
+                    response_text, finish_reason = _stream_response(client, transcript, parser, on_section,
+                                                                    progress, deadline_at, requested)
+                get_circuit_breaker().record_success()
+                model = MODEL
+                if finish_reason == 'length' and can_continue:
+                    remaining = _continuation_sections(response_text, sections, requested)
+                    if remaining:
+                        break
+                for section_key, value in parser.close():
+                    on_section(section_key, value)
+                if finish_reason == 'length':
+                    _mark_truncated(outcome)
+                elif use_cache and response_text:
+                    get_cache().put(key, response_text)
+                return parser.result
+            
+            with _rate_limit(transcript, structured, requested):
+                response, model = _create_completion(client, transcript, structured, deadline_at, hedge,
+                                                     requested)
+            get_circuit_breaker().record_success()
             
-            # Extract the response text
+            # Extract the response text and parse it into structured data
             response_text = response.choices[0].message.content
+            truncated = response.choices[0].finish_reason == 'length'
+            if truncated and can_continue:
+                remaining = _continuation_sections(response_text, sections, requested)
+                if remaining:
+                    break
+            result = parse(response_text)
+            if truncated:
+                # Out of follow-ups (or they stopped helping): return what
+                # there is, but never replay the gaps from the cache
+                _mark_truncated(outcome)
+            elif use_cache and response_text and model == MODEL:
+                # A fallback model's answer must not be replayed as the primary model's
+                get_cache().put(key, response_text)
+            return result
+            
+        except StructuredOutputError:
+            # Malformed JSON: fall back to the text format for this transcript
+            return _request_analysis(transcript, retry_count, use_cache, deadline_at=deadline_at, hedge=hedge,
+                                     sections=sections)
+            
+        except DeadlineExceededError:
+            # Out of time before (or while) sending: if this call was the
+            # half-open probe, let another call probe instead
+            get_circuit_breaker().release()
+            raise
+            
+        except Exception as e:
+            if structured and _is_schema_rejection(e):
+                # The model or endpoint does not support JSON schemas
+                get_circuit_breaker().record_success()
+                _structured_output_supported = False
+                return _request_analysis(transcript, retry_count, use_cache, deadline_at=deadline_at, hedge=hedge,
+                                     sections=sections)
+            can_retry = _may_retry(retries, retry_count) and not progress['started']
+            delay = _handle_api_error(e, attempts, can_retry)
+            time_left = _time_left(deadline_at)
+            if time_left is not None and delay >= time_left:
+                raise DeadlineExceededError("Analysis did not finish within the deadline.") from e
+            time.sleep(delay)
+            retries += 1
+    
+    # Cut off at max_tokens: keep the finished sections and ask for the rest.
+    # This is outside the retry loop, so a failed follow-up isn't retried as
+    # the original request.
+    result = _completed_sections(response_text, sections)
+    follow_up = {'truncated': False}
+    result.update(_request_analysis(transcript, retry_count, use_cache, on_section, deadline_at=deadline_at,
+                                    hedge=hedge, sections=remaining, continuation=continuation + 1,
+                                    outcome=follow_up))
+    result = {section_key: result[section_key] for section_key in _section_keys(sections) + ['timestamp']}
+    if follow_up['truncated']:
+        _mark_truncated(outcome)
+    elif use_cache and model == MODEL:
+        get_cache().put(key, render_response(result))
+    return result
+
+
+def _request_sections(transcript: str, retry_count: Optional[int], use_cache: bool = True,
+                      on_section: Optional[SectionCallback] = None, structured: bool = False,
+                      deadline_at: Optional[float] = None, hedge: bool = False,
+                      sections: Optional[Dict[str, int]] = None) -> Dict[str, any]:
+    """
+    Request each section of one transcript (or chunk) in parallel and combine them.
+    
+    Each section gets its own narrower request with its own token budget,
+    so the wall-clock time is that of the slowest section rather than the
+    sum of all of them. The transcript is sent once per section.
+    
+    Args:
+        transcript: Transcript text that fits in a single request
+        retry_count: Maximum retries in total per section (None leaves it
+            to the retry policy's budgets)
+        use_cache: If False, bypass the response cache
+        on_section: Optional callback(section_key, value), called in section
+            order as soon as each section and those before it have arrived
+        structured: If True, request a JSON schema response per section
+        deadline_at: Monotonic time by which every section must have finished
+        hedge: If True, hedge slow section requests
+        sections: Sections to request and their token budgets (default: all
+            of them with SECTION_MAX_TOKENS)
+        
+    Returns:
+        Dictionary containing structured analysis results
+    """
+    budgets = sections or SECTION_MAX_TOKENS
+    keys = _section_keys(sections)
+    result = {}
+    with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        futures = [executor.submit(_request_analysis, transcript, retry_count, use_cache, structured=structured,
+                                   deadline_at=deadline_at, hedge=hedge, sections={key: budgets[key]})
+                   for key in keys]
+        for key, future in zip(keys, futures):
+            result[key] = future.result()[key]
+            if on_section:
+                on_section(key, result[key])
+    result['timestamp'] = datetime.now()
+    return result
+
+
+def analyze_transcript(transcript: str, retry_count: Optional[int] = None, use_demo: bool = False,
+                       use_cache: bool = True, stream: bool = False,
+                       on_section: Optional[SectionCallback] = None,
+                       structured: bool = False, fallback_to_demo: bool = False,
+                       deadline: Optional[float] = None, hedge: Optional[bool] = None,
+                       fan_out: Optional[bool] = None,
+                       sections: Optional[Union[Iterable[str], Dict[str, int]]] = None,
+                       compress: Optional[bool] = None,
+                       on_compressed: Optional[Callable[[Dict[str, int]], None]] = None) -> Dict[str, any]:
+    """
+    Analyze meeting transcript using OpenAI API or demo mode.
+    
+    Transcripts larger than CHUNK_TOKEN_LIMIT are split on speaker turns,
+    the chunks are analyzed concurrently, and the partial results are merged.
+    Raw responses are cached on disk, so repeat analyses skip the API.
+    
+    Args:
+        transcript: The meeting transcript text
+        retry_count: Maximum retries in total for transient failures (None
+            leaves it to the retry policy's per-error-class budgets)
+        use_demo: If True, use demo mode without API calls
+        use_cache: If False, bypass the response cache
+        stream: If True, stream the completion so sections are reported
+            through on_section as soon as each one is complete (only for
+            transcripts that fit in a single request)
+        on_section: Optional callback(section_key, value), called once per
+            section in order
+        structured: If True, request JSON schema output and decode it
+            directly instead of parsing free text; falls back to the text
+            format when the model or endpoint doesn't support schemas
+        fallback_to_demo: If True, use demo mode instead of failing while
+            the circuit breaker reports the API as unavailable or when the
+            deadline passes
+        deadline: Seconds allowed for the whole analysis, including every
+            retry and backoff (defaults to DEFAULT_DEADLINE; None for no limit)
+        hedge: If True, send a backup request (to HEDGE_MODEL) when a
+            request is slower than the HEDGE_PERCENTILE of recent ones, and
+            use whichever answers first (defaults to HEDGE_ENABLED)
+        fan_out: If True, request each section separately and in parallel
+            with its own token limit, trading extra prompt tokens for lower
+            latency (defaults to FAN_OUT_ENABLED)
+        sections: Only request these analysis keys, e.g. ['action_items'],
+            or a mapping of key to completion token budget; the prompt, the
+            token limit and the result shrink to match (default: all, with
+            the MAX_TOKENS limit)
+        compress: If True, shrink the transcript with compress_transcript
+            before sending it (defaults to COMPRESS_ENABLED)
+        on_compressed: Optional callback receiving this transcript's
+            compress_transcript stats ('tokens_before', 'tokens_after',
+            'tokens_saved'); get_compression_stats has the process totals
+        
+    Returns:
+        Dictionary containing structured analysis results
+        
+    Raises:
+        ValueError: If sections names an unknown section
+        CircuitOpenError: If the API is failing and fallback_to_demo is False
+        DeadlineExceededError: If the deadline passes and fallback_to_demo is False
+        Exception: If API call fails after retries (when not in demo mode)
+    """
+    sections = resolve_sections(sections)
+    
+    # Use demo mode if requested or if API key is not available
+    if use_demo:
+        result = select_sections(analyze_transcript_demo(transcript), sections)
+        _emit_sections(result, on_section)
+        return result
+    
+    if deadline is None:
+        deadline = DEFAULT_DEADLINE
+    deadline_at = time.monotonic() + deadline if deadline else None
+    if hedge is None:
+        hedge = HEDGE_ENABLED
+    if fan_out is None:
+        fan_out = FAN_OUT_ENABLED
+    if compress is None:
+        compress = COMPRESS_ENABLED
+    
+    try:
+        if compress:
+            transcript_to_send, stats = compress_transcript(transcript)
+            if on_compressed:
+                on_compressed(stats)
+        else:
+            transcript_to_send = transcript
+        return _analyze_with_api(transcript_to_send, retry_count, use_cache, stream, on_section, structured,
+                                 deadline_at, hedge, fan_out, sections)
+    except (CircuitOpenError, DeadlineExceededError) as e:
+        if not fallback_to_demo:
+            raise
+        print(f"\n\033[93m{str(e)} Falling back to demo mode.\033[0m")
+        result = select_sections(analyze_transcript_demo(transcript), sections)
+        _emit_sections(result, on_section)
+        return result
+
+
+def _analyze_with_api(transcript: str, retry_count: Optional[int], use_cache: bool, stream: bool,
+                      on_section: Optional[SectionCallback], structured: bool,
+                      deadline_at: Optional[float] = None, hedge: bool = False,
+                      fan_out: bool = False, sections: Optional[Dict[str, int]] = None) -> Dict[str, any]:
+    """Chunk, analyze and merge a transcript through the API."""
+    chunks = split_transcript(transcript, CHUNK_TOKEN_LIMIT)
+    if fan_out:
+        if len(chunks) == 1:
+            return _request_sections(chunks[0], retry_count, use_cache, on_section, structured, deadline_at,
+                                     hedge, sections)
+                                     
+        def analyze_chunk(chunk):
+            return _request_sections(chunk, retry_count, use_cache, structured=structured,
+                                     deadline_at=deadline_at, hedge=hedge, sections=sections)
+    else:
+        if len(chunks) == 1:
+            if stream and on_section and not structured:
+                return _request_analysis(chunks[0], retry_count, use_cache, on_section, deadline_at=deadline_at,
+                                         sections=sections)
+            result = _request_analysis(chunks[0], retry_count, use_cache, structured=structured,
+                                       deadline_at=deadline_at, hedge=hedge, sections=sections)
+            _emit_sections(result, on_section)
+            return result
+            
+        def analyze_chunk(chunk):
+            return _request_analysis(chunk, retry_count, use_cache, structured=structured,
+                                     deadline_at=deadline_at, hedge=hedge, sections=sections)
+    
+    # Map: analyze chunks concurrently; Reduce: merge the partial results
+    with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_CHUNK_WORKERS)) as executor:
+        partials = list(executor.map(analyze_chunk, chunks))
+    
+    result = merge_analyses(partials)
+    _emit_sections(result, on_section)
+    return result
+
+
+def build_live_context(prior: Dict[str, any]) -> str:
+    """
+    Describe the running analysis as context for the next transcript segment.
+    
+    Only the summary and the most recent LIVE_CONTEXT_ITEMS items per section
+    are included, so the context stays the same size however long the
+    meeting runs.
+    
+    Args:
+        prior: Running analysis of the meeting so far
+        
+    Returns:
+        Context block to place before the new transcript segment
+    """
+    lines = ["[Notes from earlier in this meeting, for context only. Summarize the whole meeting "
+             "so far, but list only action items, decisions, questions and attendees that are "
+             "new in the segment below.]",
+             f"Summary so far: {prior.get('summary') or 'None'}"]
+    for key, title in (('action_items', 'Action items'), ('decisions', 'Decisions'),
+                       ('questions', 'Open questions'), ('attendees', 'Attendees')):
+        items = prior.get(key) or []
+        if items:
+            lines.append(f"{title} already noted: " + "; ".join(items[-LIVE_CONTEXT_ITEMS:]))
+    lines.append("[New transcript since the last update]")
+    return "\n".join(lines) + "\n"
+
+
+def merge_live_analysis(prior: Dict[str, any], update: Dict[str, any]) -> Dict[str, any]:
+    """
+    Merge the analysis of a new transcript segment into the running analysis.
+    
+    The update's summary replaces the old one, since it was written with
+    the old summary as context; item lists are appended and de-duplicated.
+    
+    Args:
+        prior: Running analysis of the meeting so far
+        update: Analysis of the newly appended segment
+        
+    Returns:
+        Dictionary containing the updated running analysis
+    """
+    merged = merge_analyses([prior, update])
+    merged['summary'] = update.get('summary') or prior.get('summary', '')
+    return merged
+
+
+def analyze_transcript_update(segment: str, prior: Optional[Dict[str, any]] = None,
+                              retry_count: Optional[int] = None, use_demo: bool = False,
+                              use_cache: bool = True) -> Dict[str, any]:
+    """
+    Analyze newly appended transcript text of a meeting in progress.
+    
+    Only the new segment is sent, together with a fixed-size summary of the
+    prior analysis, so each update costs about the same however long the
+    meeting has been running.
+    
+    Args:
+        segment: Transcript text appended since the last update
+        prior: Running analysis so far, or None for the first segment
+        retry_count: Maximum retries in total for transient failures (None
+            leaves it to the retry policy's per-error-class budgets)
+        use_demo: If True, use demo mode without API calls
+        use_cache: If False, bypass the response cache
+        
+    Returns:
+        Dictionary containing the updated running analysis
+    """
+    if prior is None:
+        return analyze_transcript(segment, retry_count, use_demo, use_cache)
+    if use_demo:
+        update = analyze_transcript_demo(segment)
+    else:
+        update = analyze_transcript(build_live_context(prior) + segment, retry_count, use_cache=use_cache)
+    return merge_live_analysis(prior, update)
+
+
+async def _request_analysis_async(transcript: str, retry_count: Optional[int],
+                                  semaphore: Optional[asyncio.Semaphore] = None,
+                                  use_cache: bool = True, structured: bool = False,
+                                  sections: Optional[Dict[str, int]] = None, continuation: int = 0,
+                                  outcome: Optional[Dict[str, bool]] = None) -> Dict[str, any]:
+    """
+    Async counterpart of _request_analysis.
+    
+    The semaphore is held only while a request is in flight, never while
+    backing off, so waiting retries don't starve other requests. Responses
+    cut off at max_tokens are continued the same way as in the sync path.
+    
+    Args:
+        transcript: Transcript text that fits in a single request
+        retry_count: Maximum retries in total for transient failures (None
+            leaves it to the retry policy's per-error-class budgets)
+        semaphore: Optional semaphore bounding concurrent API requests
+        use_cache: If False, bypass the response cache
+        structured: If True, request a JSON schema response and decode it
+            directly, falling back to the text format if unsupported
+        sections: Sections to request and their token budgets (default: all)
+        continuation: Number of follow-up requests made for a truncated response
+        outcome: Set to {'truncated': True} if the result is still missing
+            sections cut off at max_tokens (such results are never cached)
+        
+    Returns:
+        Dictionary containing structured analysis results
+        
+    Raises:
+        Exception: If API call fails after retries
+    """
+    global _structured_output_supported
+    structured = structured and _structured_output_supported
+    
+    def parse(text: str) -> Dict[str, any]:
+        return decode_json_response(text, sections) if structured else parse_response(text, sections)
+    
+    if use_cache:
+        key = cache_key_for(transcript, structured, sections)
+        cached = get_cache().get(key)
+        if cached is not None:
+            try:
+                return parse(cached)
+            except StructuredOutputError:
+                pass
+    
+    # Sized from the local estimate, as in _request_analysis
+    can_continue = not structured and continuation < MAX_CONTINUATIONS
+    requested = estimate_output_tokens(transcript, sections) if can_continue and not continuation else sections
+    remaining = None
+    attempts = {}
+    retries = 0
+    
+    while True:
+        _check_circuit()
+        try:
+            client = get_async_client()
             
-            # Parse and return structured data
-            return parse_response(response_text)
+            async with (semaphore if semaphore is not None else nullcontext()):
+                async with _rate_limit_async(transcript, structured, requested):
+                    response = await client.chat.completions.create(
+                        **_completion_kwargs(transcript, structured, requested)
+                    )
+            get_circuit_breaker().record_success()
+            
+            response_text = response.choices[0].message.content
+            truncated = response.choices[0].finish_reason == 'length'
+            if truncated and can_continue:
+                remaining = _continuation_sections(response_text, sections, requested)
+                if remaining:
+                    break
+            result = parse(response_text)
+            if truncated:
+                _mark_truncated(outcome)
+            elif use_cache and response_text:
+                get_cache().put(key, response_text)
+            return result
             
-        except RateLimitError as e:
-            last_error = e
-            if attempt < retry_count:
-                wait_time = (attempt + 1) * 2  # Exponential backoff
-                print(f"\n\033[93mRate limit reached. Waiting {wait_time} seconds before retry...\033[0m")
-                time.sleep(wait_time)
-            else:
-                raise Exception("Rate limit exceeded. Please try again later.")
-                
-        except APIConnectionError as e:
-            last_error = e
-            if attempt < retry_count:
-                wait_time = (attempt + 1) * 2
-                print(f"\n\033[93mConnection error. Retrying in {wait_time} seconds...\033[0m")
-                time.sleep(wait_time)
-            else:
-                raise Exception("Failed to connect to OpenAI API. Please check your internet connection.")
-                
-        except APIError as e:
-            last_error = e
-            raise Exception(f"OpenAI API error: {str(e)}")
+        except StructuredOutputError:
+            return await _request_analysis_async(transcript, retry_count, semaphore, use_cache, sections=sections)
             
         except Exception as e:
-            last_error = e
-            raise Exception(f"Failed to analyze transcript: {str(e)}")
+            if structured and _is_schema_rejection(e):
+                get_circuit_breaker().record_success()
+                _structured_output_supported = False
+                return await _request_analysis_async(transcript, retry_count, semaphore, use_cache,
+                                                     sections=sections)
+            delay = _handle_api_error(e, attempts, can_retry=_may_retry(retries, retry_count))
+            await asyncio.sleep(delay)
+            retries += 1
+    
+    # Cut off at max_tokens: keep the finished sections and ask for the rest
+    result = _completed_sections(response_text, sections)
+    follow_up = {'truncated': False}
+    result.update(await _request_analysis_async(transcript, retry_count, semaphore, use_cache,
+                                                sections=remaining, continuation=continuation + 1,
+                                                outcome=follow_up))
+    result = {section_key: result[section_key] for section_key in _section_keys(sections) + ['timestamp']}
+    if follow_up['truncated']:
+        _mark_truncated(outcome)
+    elif use_cache:
+        get_cache().put(key, render_response(result))
+    return result
+
+
+async def analyze_transcript_async(transcript: str, retry_count: Optional[int] = None, use_demo: bool = False,
+                                   semaphore: Optional[asyncio.Semaphore] = None,
+                                   use_cache: bool = True, structured: bool = False,
+                                   compress: Optional[bool] = None) -> Dict[str, any]:
+    """
+    Analyze meeting transcript without blocking the event loop.
+    
+    Args:
+        transcript: The meeting transcript text
+        retry_count: Maximum retries in total for transient failures (None
+            leaves it to the retry policy's per-error-class budgets)
+        use_demo: If True, use demo mode without API calls
+        semaphore: Optional semaphore bounding concurrent API requests
+        use_cache: If False, bypass the response cache
+        structured: If True, request JSON schema output (see analyze_transcript)
+        compress: If True, shrink the transcript with compress_transcript
+            before sending it (defaults to COMPRESS_ENABLED)
+        
+    Returns:
+        Dictionary containing structured analysis results
+        
+    Raises:
+        Exception: If API call fails after retries (when not in demo mode)
+    """
+    if use_demo:
+        return analyze_transcript_demo(transcript)
+    
+    if compress is None:
+        compress = COMPRESS_ENABLED
+    if compress:
+        transcript, _ = compress_transcript(transcript)
+    chunks = split_transcript(transcript, CHUNK_TOKEN_LIMIT)
+    if len(chunks) == 1:
+        return await _request_analysis_async(chunks[0], retry_count, semaphore, use_cache, structured)
+    
+    partials = await asyncio.gather(
+        *(_request_analysis_async(chunk, retry_count, semaphore, use_cache, structured) for chunk in chunks)
+    )
+    return merge_analyses(list(partials))
+
+
+async def analyze_many(transcripts: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY,
+                       retry_count: Optional[int] = None, use_demo: bool = False,
+                       use_cache: bool = True, structured: bool = False, compress: Optional[bool] = None
+                       ) -> AsyncIterator[Tuple[int, Union[Dict[str, any], Exception]]]:
+    """
+    Analyze many transcripts concurrently, yielding results as they finish.
+    
+    At most `concurrency` API requests are in flight at once, and transcripts
+    are pulled from the iterable lazily so large batches stay cheap.
+    
+    Args:
+        transcripts: Iterable of transcript texts
+        concurrency: Maximum number of concurrent API requests
+        retry_count: Maximum retries in total for transient failures (None
+            leaves it to the retry policy's per-error-class budgets)
+        use_demo: If True, use demo mode without API calls
+        use_cache: If False, bypass the response cache
+        structured: If True, request JSON schema output (see analyze_transcript)
+        compress: If True, compress each transcript before sending it
+            (defaults to COMPRESS_ENABLED)
+        
+    Yields:
+        (index, result) tuples in completion order, where result is the
+        analysis dictionary or the Exception raised for that transcript
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = {}
+    source = iter(enumerate(transcripts))
+    
+    def schedule_next() -> bool:
+        try:
+            index, transcript = next(source)
+        except StopIteration:
+            return False
+        task = asyncio.ensure_future(
+            analyze_transcript_async(transcript, retry_count, use_demo, semaphore, use_cache, structured, compress)
+        )
+        pending[task] = index
+        return True
+    
+    for _ in range(concurrency):
+        if not schedule_next():
+            break
     
-    # If we get here, all retries failed
-    raise Exception(f"Failed to analyze transcript after {retry_count} retries: {str(last_error)}")
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            index = pending.pop(task)
+            try:
+                result = task.result()
+            except Exception as e:
+                result = e
+            schedule_next()
+            yield index, result
@@ -0,0 +1,246 @@
+"""
+Meeting Notes AI - Batch Processing Module
+Handles non-interactive analysis of many transcript files.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+
+# File extensions picked up when a directory is given
+TRANSCRIPT_EXTENSIONS = ('.txt',)
+
+# Futures kept in flight per worker, so huge directories are streamed
+# into the pool instead of being submitted all at once
+INFLIGHT_PER_WORKER = 2
+
+
+def iter_transcript_files(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Expand files and directories into transcript file paths.
+    
+    Args:
+        paths: File or directory paths; directories are walked recursively
+        
+    Yields:
+        Paths of transcript files, in sorted order per directory
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(TRANSCRIPT_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def output_root(paths: Iterable[str]) -> Optional[str]:
+    """
+    Find the directory that batch outputs are laid out relative to.
+    
+    Args:
+        paths: File or directory paths given to the batch
+        
+    Returns:
+        The deepest directory containing every input, or None if they share none
+    """
+    dirs = [os.path.abspath(path if os.path.isdir(path) else os.path.dirname(path)) for path in paths]
+    if not dirs:
+        return None
+    try:
+        return os.path.commonpath(dirs)
+    except ValueError:
+        return None  # e.g. different drives on Windows
+
+
+def output_path_for(path: str, out_dir: str, root: Optional[str] = None) -> str:
+    """
+    Build the markdown output path for a transcript file.
+    
+    Args:
+        path: Transcript file path
+        out_dir: Directory where results are written
+        root: If given, mirror the transcript's directories below root under
+            out_dir, so a/standup.txt and b/standup.txt don't collide
+        
+    Returns:
+        Path of the markdown file for this transcript
+    """
+    if root is None:
+        relative = os.path.basename(path)
+    else:
+        relative = os.path.relpath(os.path.abspath(path), root)
+    stem = os.path.splitext(relative)[0]
+    return os.path.join(out_dir, f"{stem}.md")
+
+
+def _is_blank(f, block_size: int = 64 * 1024) -> bool:
+    """Check whether a text file contains only whitespace, reading it in blocks."""
+    while True:
+        block = f.read(block_size)
+        if not block:
+            return True
+        if not block.isspace():
+            return False
+
+
+def analyze_file(path: str, out_dir: str, use_demo: bool = False, use_cache: bool = True,
+                 structured: bool = False, sections: Optional[Union[Iterable[str], Dict[str, int]]] = None,
+                 root: Optional[str] = None) -> Tuple[str, Optional[int]]:
+    """
+    Analyze one transcript file and save the result as markdown.
+    
+    Args:
+        path: Transcript file path
+        out_dir: Directory where results are written
+        use_demo: If True, use demo mode without API calls
+        use_cache: If False, bypass the response cache
+        structured: If True, request JSON schema output from the API
+        sections: Only include these sections (see analyzer.analyze_transcript)
+        root: Directory whose layout is mirrored under out_dir (see output_path_for)
+        
+    Returns:
+        (path to the saved markdown file, estimated input tokens saved by
+        compression, or None if the transcript wasn't compressed)
+        
+    Raises:
+        ValueError: If the transcript is empty
+        Exception: If reading, analysis or saving fails
+    """
+    from analyzer import analyze_transcript, analyze_lines_demo, resolve_sections, select_sections
+    from file_handler import save_to_file
+    
+    compression = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        if use_demo:
+            # Stream the file so huge logs are never held in memory
+            if _is_blank(f):
+                raise ValueError("Empty transcript")
+            f.seek(0)
+            analysis = select_sections(analyze_lines_demo(f), resolve_sections(sections))
+        else:
+            transcript = f.read().strip()
+            if not transcript:
+                raise ValueError("Empty transcript")
+            analysis = analyze_transcript(transcript, use_demo=use_demo, use_cache=use_cache,
+                                          structured=structured, sections=sections,
+                                          on_compressed=compression.update)
+    
+    output_path = output_path_for(path, out_dir, root)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    return save_to_file(analysis, output_path), compression.get('tokens_saved')
+
+
+def run_batch(paths: Iterable[str], out_dir: str, jobs: int = 4, use_demo: bool = False,
+              use_cache: bool = True, structured: bool = False,
+              sections: Optional[Union[Iterable[str], Dict[str, int]]] = None,
+              on_result: Optional[Callable[[str, Optional[str], Optional[Exception], Optional[int]], None]] = None
+              ) -> Dict[str, any]:
+    """
+    Analyze transcript files in parallel and save each result.
+    
+    API mode is I/O bound and uses threads; demo mode is CPU bound and uses
+    processes. Files are fed to the pool lazily with a bounded window.
+    Results mirror the input directory layout under out_dir.
+    
+    Args:
+        paths: Files or directories to analyze
+        out_dir: Directory where results are written (created if missing)
+        jobs: Number of parallel workers
+        use_demo: If True, use demo mode without API calls
+        use_cache: If False, bypass the response cache
+        structured: If True, request JSON schema output from the API
+        sections: Only include these sections (see analyzer.analyze_transcript)
+        on_result: Optional callback(path, output_path, error, tokens_saved)
+            per finished file; tokens_saved is None unless it was compressed
+        
+    Returns:
+        Dictionary with 'succeeded', 'failed' (list of (path, error) pairs)
+        and 'elapsed' seconds
+    """
+    paths = list(paths)
+    root = output_root(paths)
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = max(1, jobs)
+    executor_class = ProcessPoolExecutor if use_demo else ThreadPoolExecutor
+    
+    succeeded = 0
+    failed = []
+    start = time.perf_counter()
+    
+    def collect(done) -> None:
+        nonlocal succeeded
+        for future in done:
+            path = pending.pop(future)
+            try:
+                output, tokens_saved = future.result()
+            except Exception as e:
+                failed.append((path, e))
+                if on_result:
+                    on_result(path, None, e, None)
+            else:
+                succeeded += 1
+                if on_result:
+                    on_result(path, output, None, tokens_saved)
+    
+    pending = {}
+    with executor_class(max_workers=jobs) as executor:
+        for path in iter_transcript_files(paths):
+            if len(pending) >= jobs * INFLIGHT_PER_WORKER:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = executor.submit(analyze_file, path, out_dir, use_demo, use_cache, structured, sections,
+                                     root)
+            pending[future] = path
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+    
+    return {
+        'succeeded': succeeded,
+        'failed': failed,
+        'elapsed': time.perf_counter() - start
+    }
+
+
+def format_file_result(path: str, output: Optional[str], error: Optional[Exception],
+                       tokens_saved: Optional[int] = None) -> str:
+    """
+    Format one finished file for the batch and watch progress output.
+    
+    Args:
+        path: Transcript file path
+        output: Saved markdown path, or None if the file failed
+        error: Exception raised for the file, or None on success
+        tokens_saved: Estimated input tokens saved by compression, if any
+        
+    Returns:
+        Formatted line for terminal display
+    """
+    if error is not None:
+        return f"\033[91m✗ {path}: {str(error)}\033[0m"
+    saving = f" \033[96m(compression saved ~{tokens_saved} token(s))\033[0m" if tokens_saved else ""
+    return f"\033[92m✓ {path} → {output}\033[0m{saving}"
+
+
+def format_batch_summary(report: Dict[str, any]) -> str:
+    """
+    Format a batch report as a throughput summary.
+    
+    Args:
+        report: Dictionary returned by run_batch
+        
+    Returns:
+        Formatted summary string for terminal display
+    """
+    total = report['succeeded'] + len(report['failed'])
+    elapsed = report['elapsed']
+    rate = total / elapsed if elapsed > 0 else 0.0
+    color = "\033[91m" if report['failed'] else "\033[92m"
+    return (f"\n{color}Processed {total} file(s) in {elapsed:.2f}s "
+            f"({rate:.2f} files/s): {report['succeeded']} succeeded, "
+            f"{len(report['failed'])} failed\033[0m")
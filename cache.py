@@ -0,0 +1,188 @@
+"""
+Meeting Notes AI - Response Cache Module
+Handles on-disk, content-addressed caching of raw AI responses.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional
+
+
+# Default size budget for the cache directory
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+CACHE_SUFFIX = '.txt'
+
+
+def normalize_transcript(transcript: str) -> str:
+    """
+    Normalize a transcript so cosmetic differences share a cache entry.
+    
+    Line endings, trailing whitespace and leading/trailing blank lines are
+    ignored; everything else is significant.
+    
+    Args:
+        transcript: The meeting transcript text
+        
+    Returns:
+        Normalized transcript text
+    """
+    return '\n'.join(line.rstrip() for line in transcript.strip().splitlines())
+
+
+def make_cache_key(transcript: str, model: str, prompt_version: int,
+                   max_tokens: int, temperature: float, response_format: str = 'text',
+                   sections: Optional[Iterable[str]] = None) -> str:
+    """
+    Build a content-addressed cache key for one analysis request.
+    
+    Args:
+        transcript: The meeting transcript text
+        model: Model name used for the request
+        prompt_version: Version of the prompt template
+        max_tokens: Completion token limit
+        temperature: Sampling temperature
+        response_format: Requested output format ('text' or 'json_schema')
+        sections: Analysis sections requested, if not all of them
+        
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    fields = [normalize_transcript(transcript), model, prompt_version, max_tokens, temperature, response_format]
+    if sections is not None:
+        # Appended only when set, so full-analysis keys stay the same
+        fields.append(list(sections))
+    payload = json.dumps(fields, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of raw response text, stored one file per key.
+    
+    Recency is tracked with file modification times, so the LRU order
+    survives restarts and is shared by every process using the directory.
+    """
+    
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+        self._lock = threading.Lock()
+        
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + CACHE_SUFFIX)
+        
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response and mark it as recently used.
+        
+        Args:
+            key: Cache key from make_cache_key
+            
+        Returns:
+            The cached response text, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        return text
+        
+    def put(self, key: str, text: str) -> None:
+        """
+        Store a response, evicting least recently used entries if needed.
+        
+        Cache write failures are ignored; the cache is only an optimization.
+        
+        Args:
+            key: Cache key from make_cache_key
+            text: Raw response text
+        """
+        path = self._path(key)
+        data = text.encode('utf-8')
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+                
+    def _entries(self):
+        """List (mtime, size, path) for every cache entry."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(CACHE_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+        
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+        
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits its budget."""
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+        
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size = 0
+            
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with 'hits', 'misses' and 'size_bytes'
+        """
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            return {'hits': self.hits, 'misses': self.misses, 'size_bytes': self._size}
@@ -0,0 +1,20 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+import analyzer
+from cache import ResponseCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path, monkeypatch):
+    """Give every test its own empty response cache instead of the user's."""
+    monkeypatch.setattr(analyzer, '_cache', ResponseCache(str(tmp_path / "response_cache")))
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuit_breaker(monkeypatch):
+    """Keep failures recorded by one test from opening the circuit for the next."""
+    monkeypatch.setattr(analyzer, '_circuit_breaker', None)
+    monkeypatch.setattr(analyzer, '_retry_policy', None)
@@ -73,6 +73,24 @@ def add_to_history(analysis: Dict[str, any]) -> None:
     _session_history.append(analysis)
 
 
+def replace_in_history(old: Dict[str, any], new: Dict[str, any]) -> bool:
+    """
+    Replace an analysis in session history, keeping its position.
+    
+    Args:
+        old: Analysis previously passed to add_to_history
+        new: Analysis to store in its place
+        
+    Returns:
+        True if the old analysis was found and replaced
+    """
+    for idx, analysis in enumerate(_session_history):
+        if analysis is old:
+            _session_history[idx] = new
+            return True
+    return False
+
+
 def get_history() -> List[Dict]:
     """
     Retrieve session history.
@@ -99,7 +117,8 @@ def format_history_display() -> str:
         timestamp = analysis.get('timestamp', datetime.now())
         summary = analysis.get('summary', 'No summary available')
         
-        output.append(f"\033[1m{idx}. Meeting at {timestamp.strftime('%H:%M:%S')}\033[0m")
+        label = " \033[93m(preview, AI analysis pending)\033[0m" if analysis.get('is_preview') else ""
+        output.append(f"\033[1m{idx}. Meeting at {timestamp.strftime('%H:%M:%S')}\033[0m{label}")
         output.append(f"   {summary[:100]}{'...' if len(summary) > 100 else ''}")
         output.append("")
     
@@ -7,57 +7,68 @@ from typing import Dict
 from datetime import datetime
 
 
-def format_terminal_output(analysis: Dict[str, any]) -> str:
+# Terminal section titles and empty-section messages, in display order.
+# Sections missing from an analysis weren't requested and are left out.
+TERMINAL_SECTIONS = [
+    ('summary', "📝 SUMMARY", "No summary available"),
+    ('action_items', "✅ ACTION ITEMS", "  No action items identified"),
+    ('decisions', "📅 DECISIONS MADE", "  No decisions identified"),
+    ('questions', "❓ OPEN QUESTIONS / FOLLOW-UPS", "  No open questions identified"),
+    ('attendees', "👥 ATTENDEES", "  Not mentioned in transcript"),
+]
+
+
+# Markdown section headings and empty-section lines, in document order
+MARKDOWN_SECTIONS = [
+    ('summary', "## 📝 Summary", "No summary available"),
+    ('action_items', "## ✅ Action Items", "- No action items identified"),
+    ('decisions', "## 📅 Decisions Made", "- No decisions identified"),
+    ('questions', "## ❓ Open Questions / Follow-ups", "- No open questions identified"),
+    ('attendees', "## 👥 Attendees", "- Not mentioned in transcript"),
+]
+
+
+def format_terminal_section(key: str, value: any) -> str:
     """
-    Format analysis results for colored terminal display.
+    Format a single analysis section for colored terminal display.
+    
+    Used to print sections one at a time as a streamed analysis arrives.
     
     Args:
-        analysis: Dictionary containing analysis results
+        key: Analysis dictionary key (e.g. 'summary', 'action_items')
+        value: Section content (string for summary, list otherwise)
         
     Returns:
         Formatted string with ANSI color codes and emojis
     """
-    output = []
-    
-    # Summary section
-    output.append("\n\033[96m\033[1m📝 SUMMARY\033[0m")
-    output.append(analysis.get('summary', 'No summary available'))
+    title, empty_message = next((t, m) for k, t, m in TERMINAL_SECTIONS if k == key)
+    output = [f"\n\033[96m\033[1m{title}\033[0m"]
     
-    # Action Items section
-    output.append("\n\033[96m\033[1m✅ ACTION ITEMS\033[0m")
-    action_items = analysis.get('action_items', [])
-    if action_items:
-        for item in action_items:
+    if key == 'summary':
+        output.append(value)
+    elif value:
+        for item in value:
             output.append(f"  • {item}")
     else:
-        output.append("  No action items identified")
+        output.append(empty_message)
     
-    # Decisions section
-    output.append("\n\033[96m\033[1m📅 DECISIONS MADE\033[0m")
-    decisions = analysis.get('decisions', [])
-    if decisions:
-        for decision in decisions:
-            output.append(f"  • {decision}")
-    else:
-        output.append("  No decisions identified")
-    
-    # Open Questions section
-    output.append("\n\033[96m\033[1m❓ OPEN QUESTIONS / FOLLOW-UPS\033[0m")
-    questions = analysis.get('questions', [])
-    if questions:
-        for question in questions:
-            output.append(f"  • {question}")
-    else:
-        output.append("  No open questions identified")
+    return "\n".join(output)
+
+
+def format_terminal_output(analysis: Dict[str, any]) -> str:
+    """
+    Format analysis results for colored terminal display.
     
-    # Attendees section
-    output.append("\n\033[96m\033[1m👥 ATTENDEES\033[0m")
-    attendees = analysis.get('attendees', [])
-    if attendees:
-        for attendee in attendees:
-            output.append(f"  • {attendee}")
-    else:
-        output.append("  Not mentioned in transcript")
+    Args:
+        analysis: Dictionary containing analysis results
+        
+    Returns:
+        Formatted string with ANSI color codes and emojis
+    """
+    output = []
+    for key, _, _ in TERMINAL_SECTIONS:
+        if key in analysis:
+            output.append(format_terminal_section(key, analysis[key]))
     
     return "\n".join(output)
 
@@ -79,48 +90,18 @@ def format_markdown_output(analysis: Dict[str, any]) -> str:
     output.append(f"# Meeting Notes - {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
     output.append("")
     
-    # Summary section
-    output.append("## 📝 Summary")
-    output.append(analysis.get('summary', 'No summary available'))
-    output.append("")
-    
-    # Action Items section
-    output.append("## ✅ Action Items")
-    action_items = analysis.get('action_items', [])
-    if action_items:
-        for item in action_items:
-            output.append(f"- {item}")
-    else:
-        output.append("- No action items identified")
-    output.append("")
-    
-    # Decisions section
-    output.append("## 📅 Decisions Made")
-    decisions = analysis.get('decisions', [])
-    if decisions:
-        for decision in decisions:
-            output.append(f"- {decision}")
-    else:
-        output.append("- No decisions identified")
-    output.append("")
-    
-    # Open Questions section
-    output.append("## ❓ Open Questions / Follow-ups")
-    questions = analysis.get('questions', [])
-    if questions:
-        for question in questions:
-            output.append(f"- {question}")
-    else:
-        output.append("- No open questions identified")
-    output.append("")
-    
-    # Attendees section
-    output.append("## 👥 Attendees")
-    attendees = analysis.get('attendees', [])
-    if attendees:
-        for attendee in attendees:
-            output.append(f"- {attendee}")
-    else:
-        output.append("- Not mentioned in transcript")
+    sections = []
+    for key, title, empty_message in MARKDOWN_SECTIONS:
+        if key not in analysis:
+            continue
+        lines = [title]
+        if key == 'summary':
+            lines.append(analysis[key])
+        elif analysis[key]:
+            lines.extend(f"- {item}" for item in analysis[key])
+        else:
+            lines.append(empty_message)
+        sections.append("\n".join(lines))
+    output.append("\n\n".join(sections))
     
     return "\n".join(output)
@@ -0,0 +1,165 @@
+"""
+Meeting Notes AI - Job Queue Module
+Handles background analysis jobs for the interactive CLI.
+"""
+
+import itertools
+import queue
+import threading
+from concurrent.futures import Future, wait
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+PREVIEW_LENGTH = 40
+
+
+class AnalysisJob:
+    """One transcript analysis submitted to an AnalysisQueue."""
+    
+    def __init__(self, job_id: int, transcript: str):
+        self.id = job_id
+        self.transcript = transcript
+        self.status = PENDING
+        self.result = None
+        self.error = None
+        self.submitted_at = datetime.now()
+        first_line = transcript.strip().split('\n', 1)[0]
+        self.preview = first_line[:PREVIEW_LENGTH] + ('...' if len(first_line) > PREVIEW_LENGTH else '')
+        self._future = None
+        
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+class AnalysisQueue:
+    """
+    Runs transcript analyses on background worker threads.
+    
+    Jobs start in submission order. If on_section is given, analyze is
+    called as analyze(transcript, on_section) and on_section(job, key,
+    value) receives each section as it arrives; on_complete(job) is called
+    as soon as each job finishes or fails. Both run on the worker thread, so
+    callers must make their own output thread-safe. Workers are daemon
+    threads, so an abandoned job (e.g. after Ctrl+C) doesn't keep the
+    process alive.
+    """
+    
+    def __init__(self, analyze: Callable[..., Dict[str, any]], workers: int = 2,
+                 on_complete: Optional[Callable[[AnalysisJob], None]] = None,
+                 on_section: Optional[Callable[[AnalysisJob, str, any], None]] = None):
+        self._analyze = analyze
+        self._on_complete = on_complete
+        self._on_section = on_section
+        self._work = queue.Queue()
+        self._jobs = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._closed = False
+        # Not a ThreadPoolExecutor: its workers are joined at interpreter exit
+        self._threads = [threading.Thread(target=self._worker, name=f'analysis_{index}', daemon=True)
+                         for index in range(max(1, workers))]
+        for thread in self._threads:
+            thread.start()
+        
+    def submit(self, transcript: str) -> AnalysisJob:
+        """
+        Queue a transcript for analysis and return immediately.
+        
+        Args:
+            transcript: The meeting transcript text
+            
+        Returns:
+            The queued job
+            
+        Raises:
+            RuntimeError: If the queue has been shut down
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot submit jobs after shutdown")
+            job = AnalysisJob(next(self._ids), transcript)
+            job._future = Future()
+            self._jobs.append(job)
+            self._work.put(job)
+        return job
+        
+    def _worker(self) -> None:
+        while True:
+            job = self._work.get()
+            if job is None:
+                return
+            if not job._future.set_running_or_notify_cancel():
+                continue
+            try:
+                self._run(job)
+            except BaseException as e:
+                job._future.set_exception(e)
+            else:
+                job._future.set_result(None)
+                
+                
+    def _run(self, job: AnalysisJob) -> None:
+        job.status = RUNNING
+        try:
+            if self._on_section:
+                job.result = self._analyze(job.transcript,
+                                           lambda key, value: self._on_section(job, key, value))
+            else:
+                job.result = self._analyze(job.transcript)
+            job.status = DONE
+        except Exception as e:
+            job.error = e
+            job.status = FAILED
+        # The transcript is no longer needed; don't hold a day's worth in memory
+        job.transcript = None
+        if self._on_complete:
+            self._on_complete(job)
+            
+    def jobs(self) -> List[AnalysisJob]:
+        """Get all submitted jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs)
+            
+    def pending(self) -> List[AnalysisJob]:
+        """Get jobs that are queued or running, oldest first."""
+        return [job for job in self.jobs() if not job.finished]
+        
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every submitted job to finish.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if all jobs finished, False on timeout
+        """
+        _, not_done = wait([job._future for job in self.jobs()], timeout=timeout)
+        return not not_done
+        
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """
+        Stop the workers.
+        
+        Args:
+            cancel_pending: If True, drop jobs that haven't started yet and
+                return without waiting for running ones
+        """
+        with self._lock:
+            self._closed = True
+            if cancel_pending:
+                for job in self._jobs:
+                    job._future.cancel()
+            for _ in self._threads:
+                self._work.put(None)
+        if not cancel_pending:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,120 @@
+"""
+Meeting Notes AI - Latency Module
+Handles request latency tracking and hedged (backup) requests.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+def _start(call: Callable[[], T], name: str) -> Future:
+    """
+    Run a call on its own daemon thread.
+    
+    Not a shared pool: a bounded pool caps how many hedged requests can be
+    in flight, and time spent queued for a worker would count towards the
+    hedge delay and trigger needless backups. Callers already bound their
+    own concurrency, and each hedged call needs at most two threads.
+    """
+    future = Future()
+    
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+    
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent request latencies.
+    
+    Used to pick the hedging delay: a backup request is only sent once the
+    primary is slower than, say, 95% of recent requests.
+    """
+    
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        
+    def record(self, seconds: float) -> None:
+        """Record the latency of one successful request."""
+        with self._lock:
+            self._samples.append(seconds)
+            
+    def percentile(self, pct: float, default: float) -> float:
+        """
+        Get a latency percentile of the recorded window.
+        
+        Args:
+            pct: Percentile between 0 and 100
+            default: Value returned until min_samples latencies are recorded
+            
+        Returns:
+            Latency in seconds
+        """
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return default
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index]
+
+
+def hedged_call(primary: Callable[[], T], backup: Callable[[], T], hedge_delay: float,
+                timeout: Optional[float] = None) -> Tuple[T, bool]:
+    """
+    Run `primary`, and also `backup` if primary hasn't answered after `hedge_delay`.
+    
+    Whichever succeeds first wins; the other call is left to finish in the
+    background and its result is discarded. Once both are in flight, a
+    failure of one still waits for the other.
+    
+    Args:
+        primary: Call to make first
+        backup: Call to make if the primary is slow
+        hedge_delay: Seconds to wait for the primary before sending the backup
+        timeout: Overall seconds to wait for an answer (None waits indefinitely)
+        
+    Returns:
+        (result, True if the backup call produced it)
+        
+    Raises:
+        TimeoutError: If neither call answers within `timeout`
+        Exception: The primary's error if both calls fail
+    """
+    end = None if timeout is None else time.monotonic() + timeout
+    futures = {_start(primary, 'hedge-primary'): False}
+    if timeout is not None:
+        hedge_delay = min(hedge_delay, timeout)
+    done, _ = wait(futures, timeout=hedge_delay)
+    if done:
+        # Answered (or failed) in time; errors go to the caller's retry policy
+        return next(iter(done)).result(), False
+    futures[_start(backup, 'hedge-backup')] = True
+    
+    pending = set(futures)
+    errors = {}
+    while pending:
+        remaining = None if end is None else max(0.0, end - time.monotonic())
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            raise TimeoutError("Request did not complete before the deadline")
+        for future in done:
+            if future.exception() is None:
+                return future.result(), futures[future]
+            errors[futures[future]] = future.exception()
+    raise errors.get(False, errors.get(True))
@@ -0,0 +1,180 @@
+"""
+Meeting Notes AI - Live Meeting Module
+Handles rolling notes for a transcript file that grows during a meeting.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+# Refresh once the transcript has been quiet for this many seconds...
+DEFAULT_DEBOUNCE_SECONDS = 5.0
+
+# ...but at least this often while it keeps growing
+DEFAULT_MAX_WAIT_SECONDS = 30.0
+
+
+class TranscriptTail:
+    """
+    Reads complete lines appended to a file since the previous read.
+    
+    A trailing partial line is held back until its newline arrives. If the
+    file shrinks (truncated or replaced), reading starts over from the top.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.offset = 0
+        self._partial = b''
+        
+    def read_new(self) -> str:
+        """
+        Read text appended since the last call.
+        
+        Returns:
+            Newly completed lines (empty string if nothing new)
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return ''
+        if size < self.offset:
+            self.offset = 0
+            self._partial = b''
+        if size == self.offset:
+            return ''
+        
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = self._partial + f.read()
+            self.offset = f.tell()
+        
+        end = data.rfind(b'\n') + 1
+        self._partial = data[end:]
+        return data[:end].decode('utf-8', errors='replace')
+        
+    def read_remaining(self) -> str:
+        """Read new text, including a final line that has no newline yet."""
+        text = self.read_new()
+        rest, self._partial = self._partial, b''
+        return text + rest.decode('utf-8', errors='replace')
+
+
+class LiveSession:
+    """
+    Keeps a running analysis of a transcript file while it is being written.
+    
+    New text is buffered and analyzed once the file has been quiet for
+    `debounce` seconds, or after `max_wait` seconds of continuous growth.
+    Each refresh sends only the new segment plus a fixed-size summary of
+    the notes so far (see analyzer.analyze_transcript_update).
+    """
+    
+    def __init__(self, path: str, use_demo: bool = False, use_cache: bool = True,
+                 debounce: float = DEFAULT_DEBOUNCE_SECONDS, max_wait: float = DEFAULT_MAX_WAIT_SECONDS,
+                 on_update: Optional[Callable[[Dict[str, any]], None]] = None):
+        self.tail = TranscriptTail(path)
+        self.use_demo = use_demo
+        self.use_cache = use_cache
+        self.debounce = debounce
+        self.max_wait = max_wait
+        self.on_update = on_update
+        self.analysis = None
+        self.updates = 0
+        self._pending = []
+        self._first_pending = None
+        self._last_growth = None
+        
+    def poll(self, now: Optional[float] = None) -> bool:
+        """
+        Read new text and refresh the analysis if it is due.
+        
+        Args:
+            now: Current monotonic time (defaults to time.monotonic())
+            
+        Returns:
+            True if the analysis was refreshed
+        """
+        if now is None:
+            now = time.monotonic()
+        text = self.tail.read_new()
+        if text.strip():
+            if not self._pending:
+                self._first_pending = now
+            self._pending.append(text)
+            self._last_growth = now
+        
+        if not self._pending:
+            return False
+        if now - self._last_growth >= self.debounce or now - self._first_pending >= self.max_wait:
+            self.flush()
+            return True
+        return False
+        
+    def flush(self) -> Optional[Dict[str, any]]:
+        """
+        Analyze any buffered text immediately.
+        
+        Returns:
+            The updated running analysis (None if nothing was ever analyzed)
+            
+        Raises:
+            Exception: If analysis fails; the buffered text is kept for the next try
+        """
+        if not self._pending:
+            return self.analysis
+        
+        from analyzer import analyze_transcript_update
+        
+        segment = ''.join(self._pending)
+        self._pending = []
+        try:
+            self.analysis = analyze_transcript_update(segment, self.analysis, use_demo=self.use_demo,
+                                                      use_cache=self.use_cache)
+        except Exception:
+            # Keep the text and wait a full debounce period before retrying
+            self._pending = [segment]
+            self._first_pending = self._last_growth = time.monotonic()
+            raise
+        self.updates += 1
+        if self.on_update:
+            self.on_update(self.analysis)
+        return self.analysis
+        
+    def run(self, stop: Optional[threading.Event] = None, poll_interval: float = 1.0,
+            on_error: Optional[Callable[[Exception], None]] = None) -> Optional[Dict[str, any]]:
+        """
+        Follow the file until `stop` is set or the process is interrupted.
+        
+        Args:
+            stop: Optional event that ends the loop when set
+            poll_interval: Seconds between checks for new text
+            on_error: Optional callback for failed refreshes (default: raise)
+            
+        Returns:
+            The final running analysis, including any text still buffered
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+            stop.wait(poll_interval)
+        return self.finish()
+        
+    def finish(self) -> Optional[Dict[str, any]]:
+        """
+        Analyze everything written since the last refresh, e.g. when the meeting ends.
+        
+        Returns:
+            The final running analysis
+        """
+        text = self.tail.read_remaining()
+        if text.strip():
+            self._pending.append(text)
+        return self.flush()
@@ -3,8 +3,10 @@ Meeting Notes AI - Main CLI Interface
 Entry point for the interactive CLI application.
 """
 
+import argparse
 import os
 import sys
+import threading
 
 # Load environment variables from .env file if it exists
 try:
@@ -14,6 +16,15 @@ except ImportError:
     # python-dotenv not installed, skip
     pass
 
+# Background workers for interactive analyses
+ANALYSIS_WORKERS = 2
+
+PROMPT = "\033[1mEnter command (or paste transcript):\033[0m"
+
+# Piped (non-TTY) transcripts are read in blocks, up to a size cap
+STDIN_CHUNK_CHARS = 1024 * 1024
+STDIN_MAX_CHARS = 64 * 1024 * 1024
+
 
 def validate_api_key():
     """Check if OpenAI API key is set in environment variables."""
@@ -32,6 +43,232 @@ def validate_api_key():
     return api_key
 
 
+def has_api_key() -> bool:
+    """Check for a usable OpenAI API key without printing anything."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    return bool(api_key) and api_key != "your-api-key-here"
+
+
+def parse_sections(value: str):
+    """
+    Parse a --sections value such as "action_items,decisions" or "action_items=800,summary".
+    
+    Args:
+        value: Comma-separated section keys, each optionally with "=tokens"
+        
+    Returns:
+        List of section keys, or a mapping of key to token budget if any budget was given
+        
+    Raises:
+        argparse.ArgumentTypeError: If a section or budget is invalid
+    """
+    from analyzer import SECTION_MAX_TOKENS, resolve_sections
+    
+    budgets = {}
+    for part in value.split(','):
+        key, _, tokens = part.strip().partition('=')
+        if not key:
+            continue
+        try:
+            budgets[key] = int(tokens) if tokens else SECTION_MAX_TOKENS.get(key, 0)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid token budget for {key}: {tokens}")
+    sections = budgets if '=' in value else list(budgets)
+    try:
+        resolve_sections(sections)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return sections
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for non-interactive subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Meeting Notes AI. Run without arguments for the interactive CLI."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    analyze = subparsers.add_parser("analyze", help="Analyze transcript files or directories")
+    analyze.add_argument("paths", nargs="+", help="Transcript files or directories of .txt files")
+    analyze.add_argument("--jobs", "-j", type=int, default=4, help="Number of parallel workers (default: 4)")
+    analyze.add_argument("--out", "-o", default=".", help="Output directory for markdown files (default: .)")
+    analyze.add_argument("--demo", action="store_true", help="Force demo mode (no API calls)")
+    analyze.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    analyze.add_argument("--structured", action="store_true",
+                         help="Request JSON schema output instead of parsing free text")
+    analyze.add_argument("--sections", type=parse_sections,
+                         help="Only extract these sections, e.g. action_items,decisions=400 (default: all)")
+    analyze.add_argument("--no-compress", action="store_true",
+                         help="Send transcripts as-is, without removing filler, timestamps and repeated turns")
+    analyze.add_argument("--rpm", type=int, help="Client-side requests-per-minute budget")
+    analyze.add_argument("--tpm", type=int, help="Client-side tokens-per-minute budget")
+    analyze.add_argument("--http2", action="store_true", help="Use HTTP/2 for API requests (requires h2)")
+    analyze.add_argument("--deadline", type=float,
+                         help="Seconds allowed per transcript, including retries")
+    analyze.add_argument("--hedge", action="store_true",
+                         help="Send a backup request when the first one is unusually slow")
+    analyze.add_argument("--hedge-model", help="Model for backup requests (default: the main model)")
+    analyze.add_argument("--fan-out", action="store_true",
+                         help="Request each section in parallel for lower latency (more prompt tokens)")
+    
+    watch = subparsers.add_parser("watch", help="Watch a folder and analyze new transcripts as they arrive")
+    watch.add_argument("directory", help="Directory to watch for .txt transcripts")
+    watch.add_argument("--jobs", "-j", type=int, default=4, help="Number of parallel workers (default: 4)")
+    watch.add_argument("--out", "-o", default=".", help="Output directory for markdown files (default: .)")
+    watch.add_argument("--demo", action="store_true", help="Force demo mode (no API calls)")
+    watch.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    watch.add_argument("--structured", action="store_true",
+                       help="Request JSON schema output instead of parsing free text")
+    watch.add_argument("--sections", type=parse_sections,
+                       help="Only extract these sections, e.g. action_items,decisions=400 (default: all)")
+    watch.add_argument("--no-compress", action="store_true",
+                       help="Send transcripts as-is, without removing filler, timestamps and repeated turns")
+    watch.add_argument("--settle", type=float, default=2.0,
+                       help="Seconds a file must stay unchanged before it is analyzed (default: 2)")
+    watch.add_argument("--interval", type=float, default=1.0,
+                       help="Polling interval in seconds when inotify is unavailable (default: 1)")
+    
+    live = subparsers.add_parser("live", help="Keep rolling notes for a transcript file that is still growing")
+    live.add_argument("path", help="Transcript file being written during the meeting")
+    live.add_argument("--out", "-o", help="Save the final notes to this markdown file when stopped")
+    live.add_argument("--demo", action="store_true", help="Force demo mode (no API calls)")
+    live.add_argument("--debounce", type=float, default=5.0,
+                      help="Refresh after the transcript is quiet for this many seconds (default: 5)")
+    live.add_argument("--max-wait", type=float, default=30.0,
+                      help="Refresh at least this often while the transcript keeps growing (default: 30)")
+    
+    return parser
+
+
+def run_analyze_command(args: argparse.Namespace) -> int:
+    """
+    Run the batch 'analyze' subcommand.
+    
+    Returns:
+        Process exit code (non-zero if any file failed)
+    """
+    from batch import run_batch, format_batch_summary, format_file_result
+    
+    use_demo = args.demo or not has_api_key()
+    if use_demo and not args.demo:
+        print("\033[93mNo OpenAI API key found. Running in DEMO mode.\033[0m")
+        
+    if args.rpm or args.tpm:
+        from analyzer import configure_rate_limiter
+        configure_rate_limiter(args.rpm, args.tpm, max_concurrency=args.jobs)
+    
+    if args.no_compress:
+        from analyzer import configure_compression
+        configure_compression(enabled=False)
+    
+    if not use_demo:
+        from analyzer import configure_http_client, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE
+        # Keep at least one warm connection per worker between requests
+        configure_http_client(max_connections=max(HTTP_MAX_CONNECTIONS, args.jobs),
+                              max_keepalive=max(HTTP_MAX_KEEPALIVE, args.jobs),
+                              http2=args.http2 or None)
+        if args.deadline is not None or args.hedge or args.hedge_model or args.fan_out:
+            from analyzer import configure_latency
+            configure_latency(deadline=args.deadline, hedge=args.hedge or None, hedge_model=args.hedge_model,
+                              fan_out=args.fan_out or None)
+        
+    def on_result(path, output, error, tokens_saved):
+        print(format_file_result(path, output, error, tokens_saved))
+    
+    report = run_batch(args.paths, args.out, jobs=args.jobs, use_demo=use_demo,
+                       use_cache=not args.no_cache, structured=args.structured, sections=args.sections,
+                       on_result=on_result)
+    print(format_batch_summary(report))
+    if not use_demo and not args.no_cache:
+        from analyzer import get_cache
+        stats = get_cache().stats()
+        print(f"\033[96mCache: {stats['hits']} hit(s), {stats['misses']} miss(es)\033[0m")
+    if not use_demo and not args.no_compress:
+        from analyzer import get_compression_stats
+        stats = get_compression_stats()
+        if stats['transcripts']:
+            percent = 100 * stats['tokens_saved'] / max(1, stats['tokens_before'])
+            print(f"\033[96mCompression: saved ~{stats['tokens_saved']} input token(s) "
+                  f"({percent:.0f}%) across {stats['transcripts']} transcript(s)\033[0m")
+    return 1 if report['failed'] else 0
+
+
+def run_watch_command(args: argparse.Namespace) -> int:
+    """
+    Run the 'watch' subcommand until interrupted.
+    
+    Returns:
+        Process exit code
+    """
+    from batch import format_file_result
+    from watcher import FolderWatcher
+    
+    if not os.path.isdir(args.directory):
+        print(f"\033[91m✗ Not a directory: {args.directory}\033[0m")
+        return 1
+    
+    use_demo = args.demo or not has_api_key()
+    if use_demo and not args.demo:
+        print("\033[93mNo OpenAI API key found. Running in DEMO mode.\033[0m")
+    if args.no_compress:
+        from analyzer import configure_compression
+        configure_compression(enabled=False)
+        
+    def on_result(path, output, error, tokens_saved):
+        print(format_file_result(path, output, error, tokens_saved), flush=True)
+    
+    watcher = FolderWatcher(args.directory, args.out, jobs=args.jobs, use_demo=use_demo,
+                            use_cache=not args.no_cache, structured=args.structured, sections=args.sections,
+                            settle=args.settle, poll_interval=args.interval, on_result=on_result)
+    print(f"\033[96m👀 Watching {args.directory} (Ctrl+C to stop)\033[0m", flush=True)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("\n\033[92mStopped watching.\033[0m")
+    return 0
+
+
+def run_live_command(args: argparse.Namespace) -> int:
+    """
+    Run the 'live' subcommand until interrupted.
+    
+    Returns:
+        Process exit code
+    """
+    from formatter import format_terminal_output
+    from live import LiveSession
+    
+    use_demo = args.demo or not has_api_key()
+    if use_demo and not args.demo:
+        print("\033[93mNo OpenAI API key found. Running in DEMO mode.\033[0m")
+        
+    def on_update(analysis):
+        print(f"\n\033[96m🔄 Notes updated at {analysis['timestamp'].strftime('%H:%M:%S')}\033[0m")
+        print(format_terminal_output(analysis), flush=True)
+    
+    session = LiveSession(args.path, use_demo=use_demo, debounce=args.debounce,
+                          max_wait=args.max_wait, on_update=on_update)
+    print(f"\033[96m🎙 Following {args.path} (Ctrl+C when the meeting ends)\033[0m", flush=True)
+    try:
+        session.run(on_error=lambda e: print(f"\033[91m✗ Update failed: {str(e)}\033[0m", flush=True))
+    except KeyboardInterrupt:
+        print("\n\033[96mMeeting ended. Finishing notes...\033[0m")
+    
+    try:
+        analysis = session.finish()
+    except Exception as e:
+        print(f"\033[91m✗ Error: {str(e)}\033[0m")
+        return 1
+    if analysis is None:
+        print("\033[93m⚠ No transcript text was written.\033[0m")
+        return 0
+    if args.out:
+        from file_handler import save_to_file
+        print(f"\033[92m✓ Notes saved to: {save_to_file(analysis, args.out)}\033[0m")
+    return 0
+
+
 def display_help():
     """Display available commands and usage instructions."""
     help_text = """
@@ -41,7 +278,8 @@ def display_help():
 
   📝 Paste transcript  → Analyze meeting and extract insights
   💾 save             → Save last analysis to markdown file
-  📚 history          → Show summaries from current session
+  📚 history          → Show summaries and pending analyses
+  ⚡ preview          → Toggle instant previews while AI analysis runs
   ❓ help             → Show this help message
   🚪 q                → Quit application
 
@@ -52,8 +290,42 @@ def display_help():
     print(help_text)
 
 
+def read_stdin_bulk(stream, max_chars: int = STDIN_MAX_CHARS,
+                    chunk_size: int = STDIN_CHUNK_CHARS) -> str:
+    """
+    Read the rest of a non-interactive stream in large blocks.
+    
+    Args:
+        stream: Text stream to read, e.g. sys.stdin when input is piped
+        max_chars: Maximum characters to read; the rest is discarded
+        chunk_size: Characters per read call
+        
+    Returns:
+        The text read, at most max_chars long
+    """
+    chunks = []
+    total = 0
+    while total < max_chars:
+        chunk = stream.read(min(chunk_size, max_chars - total))
+        if not chunk:
+            return "".join(chunks)
+        chunks.append(chunk)
+        total += len(chunk)
+    
+    if stream.read(1):
+        print(f"\n\033[93m⚠ Transcript truncated to the first {max_chars:,} characters.\033[0m")
+        # Drain the rest so it isn't read back as the next transcript
+        while stream.read(chunk_size):
+            pass
+    return "".join(chunks)
+
+
 def get_multiline_input():
     """Get multi-line input from user until EOF signal."""
+    if not sys.stdin.isatty():
+        # Piped input: one buffered read instead of an input() call per line
+        return read_stdin_bulk(sys.stdin).strip()
+    
     print("\n\033[93m📝 Paste your meeting transcript (Ctrl+D or Ctrl+Z when done):\033[0m")
     lines = []
     try:
@@ -67,11 +339,55 @@ def get_multiline_input():
     return transcript
 
 
-def main():
+def format_pending_jobs(jobs) -> str:
+    """Format queued and running analyses for the history command."""
+    if not jobs:
+        return ""
+    lines = ["\033[96m\033[1m⏳ PENDING ANALYSES\033[0m\n"]
+    for job in jobs:
+        lines.append(f"\033[1m#{job.id}\033[0m [{job.status}] {job.preview}")
+    return "\n".join(lines)
+
+
+def wait_for_jobs(queue) -> None:
+    """Let pending background analyses finish before exiting."""
+    pending = queue.pending()
+    if pending:
+        print(f"\n\033[96m⏳ Waiting for {len(pending)} pending analysis job(s)... "
+              f"(Ctrl+C to abandon)\033[0m")
+        queue.wait()
+
+
+def start_prewarm() -> threading.Thread:
+    """Warm up the API client and connection in the background."""
+    def warm():
+        from analyzer import prewarm_connection
+        prewarm_connection()
+    
+    thread = threading.Thread(target=warm, name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def main(argv=None):
     """Main entry point for the CLI application."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv:
+        args = build_parser().parse_args(argv)
+        if args.command == "analyze":
+            return run_analyze_command(args)
+        if args.command == "watch":
+            return run_watch_command(args)
+        if args.command == "live":
+            return run_live_command(args)
+    
     # Validate API key on startup (returns None if not found, enabling demo mode)
     api_key = validate_api_key()
     use_demo_mode = (api_key is None)
+    if not use_demo_mode:
+        # Connect while the banner prints and the user pastes a transcript
+        start_prewarm()
     
     # Display welcome message
     print("\033[96m")
@@ -89,45 +405,128 @@ def main():
     display_help()
     
     # Import required modules
-    from analyzer import analyze_transcript
-    from formatter import format_terminal_output
-    from file_handler import save_to_file, add_to_history, format_history_display
+    from analyzer import analyze_transcript, analyze_transcript_demo
+    from formatter import format_terminal_output, format_terminal_section
+    from file_handler import save_to_file, add_to_history, replace_in_history, format_history_display
+    from job_queue import AnalysisQueue
     
     # Store last analysis for save command
     last_analysis = None
+    output_lock = threading.Lock()
+    
+    # In AI mode, show an instant pattern-matching preview until the AI result arrives
+    show_previews = not use_demo_mode
+    previews = {}  # job id -> preview analysis shown and stored in history
+    streamed = {}  # job id -> keys of the sections already printed
+    
+    def on_section(job, key, value):
+        """Print each section of a background analysis as soon as it has been generated."""
+        with output_lock:
+            if job.id not in streamed:
+                streamed[job.id] = set()
+                kind = "AI analysis" if job.id in previews else "Analysis"
+                print(f"\n\n\033[96m⏳ {kind} #{job.id} ({job.preview}):\033[0m")
+            streamed[job.id].add(key)
+            print(format_terminal_section(key, value), flush=True)
+    
+    def on_complete(job):
+        """Report a finished background analysis without waiting for the prompt."""
+        nonlocal last_analysis
+        with output_lock:
+            preview = previews.pop(job.id, None)
+            shown = streamed.pop(job.id, set())
+            if job.error is None:
+                if preview is None:
+                    add_to_history(job.result)
+                    print(f"\n\n\033[92m✓ Analysis #{job.id} complete\033[0m ({job.preview})")
+                else:
+                    replace_in_history(preview, job.result)
+                    print(f"\n\n\033[92m✓ AI analysis #{job.id} complete, replacing the preview\033[0m "
+                          f"({job.preview})")
+                if last_analysis is None or last_analysis is preview or preview is None:
+                    last_analysis = job.result
+                # Sections streamed while the job ran have already been printed
+                remaining = format_terminal_output({key: value for key, value in job.result.items()
+                                                    if key not in shown})
+                if remaining:
+                    print(remaining)
+                tokens_saved = getattr(compression, 'tokens_saved', None)
+                if tokens_saved:
+                    print(f"\033[96m✂ Compression saved ~{tokens_saved} input token(s)\033[0m")
+                print("\033[93mTip: Type 'save' to save this analysis to a file\033[0m")
+            elif preview is not None:
+                print(f"\n\n\033[91m✗ AI analysis #{job.id} failed: {str(job.error)}\033[0m")
+                print("\033[93mKeeping the pattern-matching preview.\033[0m")
+                preview['is_preview'] = False
+            else:
+                print(f"\n\n\033[91m✗ Analysis #{job.id} failed: {str(job.error)}\033[0m")
+            print("\n" + PROMPT, end=" ", flush=True)
+    
+    # Per worker thread: on_complete runs on the thread that ran the analysis
+    compression = threading.local()
+    
+    def analyze(transcript, on_section):
+        compression.tokens_saved = None
+        return analyze_transcript(transcript, use_demo=use_demo_mode, stream=True, on_section=on_section,
+                                  on_compressed=lambda stats: setattr(compression, 'tokens_saved',
+                                                                      stats['tokens_saved']))
+    
+    queue = AnalysisQueue(analyze, workers=ANALYSIS_WORKERS, on_complete=on_complete, on_section=on_section)
     
     # Main interactive loop
     try:
         while True:
-            print("\n\033[93m" + "="*60 + "\033[0m")
-            print("\033[1mEnter command (or paste transcript):\033[0m", end=" ")
+            with output_lock:
+                print("\n\033[93m" + "="*60 + "\033[0m")
+                print(PROMPT, end=" ", flush=True)
             
             try:
-                command = input().strip().lower()
+                line = input().strip()
+                command = line.lower()
             except EOFError:
+                wait_for_jobs(queue)
                 print("\n\n\033[92mThank you for using Meeting Notes AI!\033[0m")
                 break
             
             # Handle commands
             if command == 'q' or command == 'quit':
+                wait_for_jobs(queue)
                 print("\n\033[92mThank you for using Meeting Notes AI!\033[0m")
                 break
                 
             elif command == 'help' or command == '?':
                 display_help()
                 
+            elif command == 'preview':
+                if use_demo_mode:
+                    print("\n\033[93mPreviews are only used in AI mode.\033[0m")
+                else:
+                    show_previews = not show_previews
+                    state = "on" if show_previews else "off"
+                    print(f"\n\033[92m✓ Instant pattern-matching previews turned {state}\033[0m")
+                    
             elif command == 'save':
+                pending = queue.pending()
                 if last_analysis:
                     try:
                         filename = save_to_file(last_analysis)
                         print(f"\n\033[92m✓ Analysis saved to: {filename}\033[0m")
+                        if last_analysis.get('is_preview'):
+                            print("\033[93m(This is the pattern-matching preview; save again once "
+                                  "the AI analysis completes)\033[0m")
                     except Exception as e:
                         print(f"\n\033[91m✗ Error saving file: {str(e)}\033[0m")
+                    if pending:
+                        print(f"\033[93m({len(pending)} analysis job(s) still running; "
+                              f"saved the latest finished one)\033[0m")
+                elif pending:
+                    print("\n\033[93m⏳ Analysis still running. Type 'save' again once it completes.\033[0m")
                 else:
                     print("\n\033[93m⚠ No analysis to save. Please analyze a transcript first.\033[0m")
                     
             elif command == 'history':
                 print(format_history_display())
+                print(format_pending_jobs(queue.pending()))
                 
             elif command == '':
                 # Empty input, prompt again
@@ -136,42 +535,43 @@ def main():
             else:
                 # Treat as start of transcript input
                 # Get the rest of the transcript
-                transcript_lines = [command]
+                transcript_lines = [line]
                 transcript = get_multiline_input()
                 
                 if transcript:
                     transcript_lines.append(transcript)
                     full_transcript = '\n'.join(transcript_lines).strip()
                 else:
-                    full_transcript = command
+                    full_transcript = line
                 
                 # Validate input
                 if not full_transcript or full_transcript.isspace():
                     print("\n\033[91m✗ Error: Empty transcript. Please provide meeting content.\033[0m")
                     continue
                 
-                # Analyze transcript
-                print("\n\033[96m⏳ Analyzing transcript...\033[0m")
-                if use_demo_mode:
-                    print("\033[93m(Using demo mode - pattern matching)\033[0m")
-                try:
-                    analysis = analyze_transcript(full_transcript, use_demo=use_demo_mode)
-                    last_analysis = analysis
-                    add_to_history(analysis)
-                    
-                    # Display results
-                    print(format_terminal_output(analysis))
-                    print("\n\033[92m✓ Analysis complete!\033[0m")
-                    print("\033[93mTip: Type 'save' to save this analysis to a file\033[0m")
-                    
-                except Exception as e:
-                    print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
+                # Analyze in the background so the prompt comes back immediately
+                with output_lock:
+                    job = queue.submit(full_transcript)
+                    mode = " (demo mode - pattern matching)" if use_demo_mode else ""
+                    print(f"\n\033[96m⏳ Analysis #{job.id} queued{mode}. "
+                          f"You can paste the next transcript meanwhile.\033[0m")
+                    if show_previews:
+                        preview = analyze_transcript_demo(full_transcript)
+                        preview['is_preview'] = True
+                        previews[job.id] = preview
+                        last_analysis = preview
+                        add_to_history(preview)
+                        print(f"\n\033[93m⚡ Preview #{job.id} (pattern matching; "
+                              f"the AI analysis will replace it)\033[0m")
+                        print(format_terminal_output(preview))
                     
     except KeyboardInterrupt:
         print("\n\n\033[92mThank you for using Meeting Notes AI!\033[0m")
     except Exception as e:
         print(f"\n\033[91m✗ Unexpected error: {str(e)}\033[0m")
+    finally:
+        queue.shutdown(cancel_pending=True)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Meeting Notes AI - Rate Limiting Module
+Handles client-side request/token budgets and adaptive concurrency.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+
+# How long to wait before re-checking for a free concurrency slot (async)
+SLOT_POLL_INTERVAL = 0.05
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+    
+    Callers reserve capacity up front and are told how long to wait, so
+    concurrent callers queue fairly instead of polling the bucket.
+    """
+    
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        
+    def reserve(self, amount: float, now: Optional[float] = None) -> float:
+        """
+        Take tokens from the bucket, going into debt if necessary.
+        
+        Args:
+            amount: Tokens to take
+            now: Current monotonic time (defaults to time.monotonic())
+            
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        if now is None:
+            now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= min(amount, self.capacity)
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Shared client-side limiter for API requests.
+    
+    Enforces optional requests-per-minute and tokens-per-minute budgets and
+    caps concurrent requests. The concurrency cap adapts AIMD-style: it
+    grows by one after a full window of successes and halves on every
+    rate-limit response, so throughput settles just under the quota.
+    """
+    
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None,
+                 max_concurrency: int = 8, min_concurrency: int = 1):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.concurrency = self.max_concurrency
+        self._requests = TokenBucket(rpm) if rpm else None
+        self._tokens = TokenBucket(tpm) if tpm else None
+        self._in_flight = 0
+        self._successes = 0
+        self._rate_limited = 0
+        self._condition = threading.Condition()
+        
+    def _reserve(self, tokens: int) -> float:
+        """Reserve budget for one request and return the required delay."""
+        delay = 0.0
+        now = time.monotonic()
+        if self._requests:
+            delay = max(delay, self._requests.reserve(1, now))
+        if self._tokens:
+            delay = max(delay, self._tokens.reserve(tokens, now))
+        return delay
+        
+    def _try_take_slot(self) -> bool:
+        if self._in_flight < self.concurrency:
+            self._in_flight += 1
+            return True
+        return False
+        
+    def _release_slot(self, succeeded: bool) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if succeeded:
+                self._successes += 1
+                # Additive increase: one more slot per window of successes
+                if self._successes >= self.concurrency and self.concurrency < self.max_concurrency:
+                    self.concurrency += 1
+                    self._successes = 0
+            self._condition.notify_all()
+            
+    def on_rate_limited(self) -> None:
+        """Multiplicative decrease after the server answers with HTTP 429."""
+        with self._condition:
+            self._rate_limited += 1
+            self._successes = 0
+            self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+            
+    @contextmanager
+    def limit(self, tokens: int):
+        """
+        Block until a request of the given size may be sent.
+        
+        Args:
+            tokens: Estimated prompt plus completion tokens for the request
+        """
+        with self._condition:
+            while not self._try_take_slot():
+                self._condition.wait()
+            delay = self._reserve(tokens)
+        
+        succeeded = False
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            yield
+            succeeded = True
+        finally:
+            self._release_slot(succeeded)
+            
+    @asynccontextmanager
+    async def limit_async(self, tokens: int):
+        """
+        Async counterpart of limit(); waits without blocking the event loop.
+        
+        Args:
+            tokens: Estimated prompt plus completion tokens for the request
+        """
+        while True:
+            with self._condition:
+                if self._try_take_slot():
+                    delay = self._reserve(tokens)
+                    break
+            await asyncio.sleep(SLOT_POLL_INTERVAL)
+        
+        succeeded = False
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+            succeeded = True
+        finally:
+            self._release_slot(succeeded)
+            
+    def stats(self) -> Dict[str, int]:
+        """
+        Get limiter state.
+        
+        Returns:
+            Dictionary with 'concurrency', 'in_flight' and 'rate_limited' count
+        """
+        with self._condition:
+            return {
+                'concurrency': self.concurrency,
+                'in_flight': self._in_flight,
+                'rate_limited': self._rate_limited
+            }
@@ -0,0 +1,218 @@
+"""
+Meeting Notes AI - Retry Policy Module
+Handles retry backoff, Retry-After hints and circuit breaking for API calls.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+
+# Error categories used for per-class retry budgets
+RATE_LIMIT = 'rate_limit'
+CONNECTION = 'connection'
+TIMEOUT = 'timeout'
+SERVER = 'server'
+
+DEFAULT_BUDGETS = {
+    RATE_LIMIT: 4,
+    CONNECTION: 2,
+    TIMEOUT: 1,
+    SERVER: 2,
+}
+
+
+def default_classify(error: Exception) -> Optional[str]:
+    """
+    Classify an error by HTTP status code and exception type name.
+    
+    Args:
+        error: Exception raised by an API call
+        
+    Returns:
+        Error category, or None if the error should not be retried
+    """
+    status = getattr(error, 'status_code', None)
+    if status == 429:
+        return RATE_LIMIT
+    if isinstance(status, int) and status >= 500:
+        return SERVER
+    names = {cls.__name__ for cls in type(error).__mro__}
+    if 'APITimeoutError' in names or isinstance(error, TimeoutError):
+        return TIMEOUT
+    if 'APIConnectionError' in names or isinstance(error, ConnectionError):
+        return CONNECTION
+    return None
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read a server-provided retry hint from an error's HTTP response.
+    
+    Supports the 'retry-after-ms' header and 'retry-after' given either in
+    seconds or as an HTTP date.
+    
+    Args:
+        error: Exception raised by an API call
+        
+    Returns:
+        Seconds to wait, or None if the server gave no usable hint
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    
+    try:
+        value = headers.get('retry-after-ms')
+        if value is not None:
+            return max(0.0, float(value) / 1000)
+        value = headers.get('retry-after')
+        if value is None:
+            return None
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Full-jitter exponential backoff with per-error-class retry budgets.
+    
+    Server Retry-After hints take precedence over the computed backoff.
+    Pass a custom `classify` function or subclass to change which errors
+    are retried.
+    """
+    
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 30.0,
+                 budgets: Optional[Dict[str, int]] = None,
+                 classify: Callable[[Exception], Optional[str]] = default_classify):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budgets = dict(DEFAULT_BUDGETS if budgets is None else budgets)
+        self.classify = classify
+        
+    def backoff(self, attempt: int) -> float:
+        """
+        Full-jitter delay for a retry attempt.
+        
+        Args:
+            attempt: Zero-based retry number within the error's category
+            
+        Returns:
+            Random delay between 0 and min(max_delay, base_delay * 2**attempt)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        
+    def next_delay(self, error: Exception, attempts: Dict[str, int]) -> Optional[float]:
+        """
+        Decide whether to retry an error and how long to wait first.
+        
+        Args:
+            error: Exception raised by the last attempt
+            attempts: Retries so far per category; updated in place
+            
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        category = self.classify(error)
+        if category is None:
+            return None
+        used = attempts.get(category, 0)
+        if used >= self.budgets.get(category, 0):
+            return None
+        attempts[category] = used + 1
+        
+        hint = retry_after_seconds(error)
+        if hint is not None:
+            return min(hint, self.max_delay)
+        return self.backoff(used)
+
+
+class CircuitBreaker:
+    """
+    Fails fast once the recent error rate of an endpoint crosses a threshold.
+    
+    Outcomes are tracked over a sliding window of recent calls. When open,
+    calls are rejected until the cooldown passes; then a single probe call
+    is let through (half-open), and its outcome closes or re-opens the circuit.
+    A probe that never reports back is given up after `probe_timeout`
+    seconds, so another call may probe instead.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: float = 0.5, window: int = 20,
+                 min_calls: int = 5, cooldown: float = 30.0, probe_timeout: float = 180.0):
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.probe_timeout = probe_timeout
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+        
+    def allow(self) -> bool:
+        """
+        Check whether a call may be attempted now.
+        
+        Returns:
+            True if the call may proceed, False to fail fast
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self._opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and \
+                    (not self._probe_in_flight or now - self._probe_started >= self.probe_timeout):
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            return False
+            
+    def release(self) -> None:
+        """Give back an allowed call that ended without an outcome, e.g. one never sent."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+            
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+            
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the error rate is too high."""
+        with self._lock:
+            self._outcomes.append(False)
+            if self.state == self.HALF_OPEN:
+                self._open()
+                return
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_calls and \
+                    failures / len(self._outcomes) >= self.failure_threshold:
+                self._open()
+                
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
@@ -2,9 +2,23 @@
 Unit tests for analyzer module
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
-from analyzer import build_prompt, parse_response, analyze_transcript
+from unittest.mock import AsyncMock, Mock, patch
+from analyzer import (
+    build_prompt,
+    parse_response,
+    analyze_transcript,
+    analyze_transcript_demo,
+    analyze_lines_demo,
+    split_transcript,
+    merge_analyses,
+    ResponseParser,
+    decode_json_response,
+    StructuredOutputError,
+    analyze_transcript_async,
+    analyze_many
+)
 from datetime import datetime
 
 
@@ -25,6 +39,15 @@ class TestBuildPrompt:
         assert "DECISIONS" in prompt.upper()
         assert "OPEN QUESTIONS" in prompt.upper() or "FOLLOW" in prompt.upper()
         assert "ATTENDEES" in prompt.upper()
+        
+    def test_build_prompt_only_requests_selected_sections(self):
+        """Test that a section subset shrinks the requested layout"""
+        prompt = build_prompt("test", ['decisions', 'action_items'])
+        assert "ACTION ITEMS:" in prompt
+        assert "DECISIONS MADE:" in prompt
+        assert "SUMMARY:" not in prompt
+        assert "ATTENDEES:" not in prompt
+        assert prompt.index("ACTION ITEMS:") < prompt.index("DECISIONS MADE:")
 
 
 class TestParseResponse:
@@ -95,6 +118,327 @@ Just a summary
         assert result['summary']
         assert isinstance(result['action_items'], list)
         assert isinstance(result['decisions'], list)
+        
+    def test_parse_response_strips_bullets_and_placeholders(self):
+        """Test that bullets are removed and 'None' placeholders skipped"""
+        response = "SUMMARY:\nLine one\nline two\n\nDECISIONS MADE:\n• Ship it\n* None\n\nATTENDEES:\nN/A"
+        result = parse_response(response)
+        assert result['summary'] == 'Line one line two'
+        assert result['decisions'] == ['Ship it']
+        assert result['attendees'] == []
+        
+    def test_parse_response_ignores_headers_inside_body_lines(self):
+        """Test that only headers at the start of a line switch sections"""
+        response = """SUMMARY:
+We reviewed the SUMMARY: section of the report.
+
+ACTION ITEMS:
+- Update the ATTENDEES: list on the wiki
+"""
+        result = parse_response(response)
+        assert result['summary'] == 'We reviewed the SUMMARY: section of the report.'
+        assert result['action_items'] == ['Update the ATTENDEES: list on the wiki']
+        assert result['attendees'] == []
+        
+    def test_parse_response_accepts_markdown_headers(self):
+        """Test decorated headers and content on the header line"""
+        response = "## Summary: Short sync.\n**Action Items:**\n- Ship it\n1. ATTENDEES:\n- Ana"
+        result = parse_response(response)
+        assert result['summary'] == 'Short sync.'
+        assert result['action_items'] == ['Ship it']
+        assert result['attendees'] == ['Ana']
+
+
+class TestSelectedSections:
+    """Tests for requesting a subset of sections"""
+    
+    RESPONSE = "ACTION ITEMS:\n- John to send the deck\nSUMMARY:\nUnrequested summary."
+    
+    def test_parse_response_keeps_only_requested_sections(self):
+        """Test that unrequested sections are absent, even if the model wrote them"""
+        result = parse_response(self.RESPONSE, ['action_items'])
+        assert set(result) == {'action_items', 'timestamp'}
+        assert result['action_items'] == ["John to send the deck"]
+        
+    @patch('analyzer.get_client')
+    def test_subset_uses_section_budgets_and_own_cache_key(self, mock_get_client):
+        """Test that max_tokens is capped by the selected budgets and full analyses aren't reused"""
+        import analyzer
+        mock_client = Mock()
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = self.RESPONSE
+        mock_client.chat.completions.create.return_value = response
+        mock_get_client.return_value = mock_client
+        transcript = "John: I'll send the deck"
+        
+        result = analyze_transcript(transcript, sections=['action_items'])
+        assert set(result) == {'action_items', 'timestamp'}
+        assert mock_client.chat.completions.create.call_args.kwargs['max_tokens'] == \
+            analyzer.estimate_output_tokens(transcript, {'action_items': 500})['action_items']
+        
+        analyze_transcript(transcript, sections={'action_items': 30, 'decisions': 20})
+        assert mock_client.chat.completions.create.call_args.kwargs['max_tokens'] == 50
+        assert analyzer.get_cache().get(analyzer.cache_key_for(transcript)) is None
+        
+    def test_unknown_section_is_rejected(self):
+        """Test that a misspelled section fails before any request"""
+        with pytest.raises(ValueError, match="actions"):
+            analyze_transcript("John: hi", use_demo=True, sections=['actions'])
+            
+    def test_all_sections_is_the_default_analysis(self):
+        """Test that selecting every section keeps the default prompt and cache key"""
+        import analyzer
+        assert analyzer.resolve_sections(list(analyzer.SECTION_MAX_TOKENS)) is None
+        
+    def test_demo_mode_filters_sections(self):
+        """Test that demo results contain only the requested sections"""
+        sections = []
+        result = analyze_transcript("John: I will write the report.", use_demo=True,
+                                    sections=['attendees'], on_section=lambda key, value: sections.append(key))
+        assert set(result) == {'attendees', 'timestamp'}
+        assert sections == ['attendees']
+        
+    def test_structured_schema_covers_only_requested_sections(self):
+        """Test that the JSON schema and decoder follow the selection"""
+        import analyzer
+        response_format = analyzer.json_response_format(['decisions'])
+        schema = response_format['json_schema']['schema']
+        assert schema['required'] == ['decisions']
+        assert list(schema['properties']) == ['decisions']
+        assert analyzer.ANALYSIS_SCHEMA['required'][0] == 'summary'
+        
+        result = decode_json_response('{"decisions": ["Ship it"]}', ['decisions'])
+        assert result['decisions'] == ["Ship it"]
+        assert 'summary' not in result
+
+
+class TestTruncation:
+    """Tests for output size estimates and continuation of truncated responses"""
+    
+    @staticmethod
+    def _response(content, finish_reason='stop'):
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = content
+        response.choices[0].finish_reason = finish_reason
+        return response
+        
+    def test_output_estimate_grows_with_transcript_up_to_budget(self):
+        """Test that longer transcripts get more output tokens, never beyond the budgets"""
+        import analyzer
+        short = sum(analyzer.estimate_output_tokens("John: hi").values())
+        long = sum(analyzer.estimate_output_tokens("John: hi there\n" * 2000).values())
+        huge = analyzer.estimate_output_tokens("John: hi there\n" * 200000)
+        assert short < long < analyzer.MAX_TOKENS
+        assert huge == analyzer.SECTION_MAX_TOKENS
+        
+    def test_render_response_round_trips(self):
+        """Test that a rendered analysis parses back to the same sections"""
+        import analyzer
+        analysis = parse_response("SUMMARY:\nShort.\nACTION ITEMS:\n- Task one\nDECISIONS MADE:\nNone")
+        again = parse_response(analyzer.render_response(analysis))
+        for key in analyzer.RESPONSE_SECTIONS.values():
+            assert again[key] == analysis[key]
+            
+    @patch('analyzer.get_client')
+    def test_truncated_response_is_continued_and_cached(self, mock_get_client):
+        """Test that unfinished sections are requested again with their full budgets"""
+        import analyzer
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            self._response("SUMMARY:\nWe planned.\n\nACTION ITEMS:\n- John to write the", 'length'),
+            self._response("ACTION ITEMS:\n- John to write the post\nDECISIONS MADE:\n- Ship Monday\n"
+                           "OPEN QUESTIONS:\nNone\nATTENDEES:\n- John")
+        ]
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_transcript("John: long meeting")
+        
+        first, second = mock_client.chat.completions.create.call_args_list
+        assert first.kwargs['max_tokens'] < analyzer.MAX_TOKENS
+        prompt = second.kwargs['messages'][1]['content']
+        assert "SUMMARY:" not in prompt and "ACTION ITEMS:" in prompt
+        assert second.kwargs['max_tokens'] == sum(analyzer.SECTION_MAX_TOKENS[key] for key in
+                                                  ['action_items', 'decisions', 'questions', 'attendees'])
+        assert result['summary'] == "We planned."
+        assert result['action_items'] == ["John to write the post"]
+        assert result['attendees'] == ["John"]
+        
+        assert analyze_transcript("John: long meeting")['decisions'] == ["Ship Monday"]
+        assert mock_client.chat.completions.create.call_count == 2
+        
+    @patch('analyzer.get_client')
+    def test_structured_requests_use_full_budget(self, mock_get_client):
+        """Test that JSON requests, which can't be continued, aren't sized down"""
+        import analyzer
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = self._response(TestStructuredOutput.JSON_RESPONSE)
+        mock_get_client.return_value = mock_client
+        
+        analyze_transcript("John: short", structured=True)
+        assert mock_client.chat.completions.create.call_args.kwargs['max_tokens'] == analyzer.MAX_TOKENS
+        
+    @patch('analyzer.get_client')
+    def test_continuation_stops_without_progress(self, mock_get_client):
+        """Test that a response truncated before any section finishes isn't requested forever"""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = self._response("SUMMARY:\nEndless", 'length')
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_transcript("John: ramble")
+        
+        assert mock_client.chat.completions.create.call_count == 2
+        assert result['summary'] == "Endless"
+        
+        # Still incomplete, so it isn't replayed from the cache
+        analyze_transcript("John: ramble")
+        assert mock_client.chat.completions.create.call_count == 4
+        
+    @patch('analyzer.get_client')
+    def test_partly_continued_response_is_not_cached(self, mock_get_client):
+        """Test that an answer whose follow-ups ran out is returned but not cached"""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            self._response("SUMMARY:\nWe planned.\n\nACTION ITEMS:\n- John to", 'length'),
+            self._response("ACTION ITEMS:\n- John to write\nDECISIONS MADE:\n- Ship", 'length'),
+            self._response("DECISIONS MADE:\n- Ship", 'length'),
+            self._response("SUMMARY:\nAll of it.", 'stop'),
+        ]
+        mock_get_client.return_value = mock_client
+        
+        first = analyze_transcript("John: long meeting")
+        second = analyze_transcript("John: long meeting")
+        
+        assert first['summary'] == "We planned."
+        assert first['action_items'] == ["John to write"]
+        assert second['summary'] == "All of it."
+        assert mock_client.chat.completions.create.call_count == 4
+
+
+class TestCompressTranscript:
+    """Tests for local transcript compression"""
+    
+    def test_strips_timestamps_but_not_times_in_speech(self):
+        """Test that timestamps and subtitle cues go while spoken times stay"""
+        from analyzer import compress_transcript
+        transcript = ("WEBVTT\n\n1\n00:00:01.000 --> 00:00:04.000\n"
+                      "[10:15 AM] John: Let's meet at 3:30.\n00:01:02 Sarah: Fine.")
+        compressed, _ = compress_transcript(transcript)
+        assert compressed == "John: Let's meet at 3:30.\nSarah: Fine."
+        
+    def test_strips_filler_words_and_phrases(self):
+        """Test that filler is removed along with its commas, but real uses are kept"""
+        from analyzer import compress_transcript
+        compressed, _ = compress_transcript("John: Um, I, uh, think, you know, it works.\n"
+                                            "Sarah: Do you know the answer?")
+        assert compressed == "John: I think it works.\nSarah: Do you know the answer?"
+        
+    def test_content_is_not_damaged(self):
+        """Test that acronyms, headings, punctuation and spoken times survive compression"""
+        from analyzer import compress_transcript
+        transcript = ("Agenda:\n"
+                      "John: Take him to the (ER), HM Revenue called.\n"
+                      "Sarah: The .NET migration... is done.\n"
+                      "Mike: ...and 10:30 works for me.\n"
+                      "Action items:\n"
+                      "10:30 Sarah: Um, ship it.")
+        compressed, _ = compress_transcript(transcript)
+        assert compressed == ("Agenda:\n"
+                              "John: Take him to the (ER), HM Revenue called.\n"
+                              "Sarah: The .NET migration... is done.\n"
+                              "Mike: ...and 10:30 works for me.\n"
+                              "Action items:\n"
+                              "Sarah: ship it.")
+        
+    def test_merges_turns_and_drops_crosstalk_duplicates(self):
+        """Test that one speaker's consecutive turns become one and repeats are dropped"""
+        from analyzer import compress_transcript
+        transcript = "John: First.\nJohn:   Second.\nSarah: Yes.\nSarah: Yes.\nJohn: Third."
+        compressed, stats = compress_transcript(transcript)
+        
+        assert compressed == "John: First.\nSecond.\nSarah: Yes.\nJohn: Third."
+        assert stats['tokens_saved'] == stats['tokens_before'] - stats['tokens_after'] > 0
+        
+    def test_merged_turns_still_split_between_lines(self):
+        """Test that a long merged turn is chunked at line breaks, not mid-sentence"""
+        from analyzer import compress_transcript, split_transcript
+        transcript = '\n'.join(f"John: Point number {i} is settled." for i in range(40))
+        compressed, _ = compress_transcript(transcript)
+        
+        chunks = split_transcript(compressed, max_tokens=60)
+        assert len(chunks) > 1
+        lines = [line for chunk in chunks for line in chunk.split('\n')]
+        assert all(line.endswith('is settled.') for line in lines)
+        # Every chunk still names the speaker of the turn it continues
+        assert all(chunk.startswith("John: ") for chunk in chunks)
+        
+    def test_steps_can_be_disabled(self):
+        """Test that each compression step is optional"""
+        from analyzer import compress_transcript
+        transcript = "[00:01] John: Um, yes.\nJohn: Okay."
+        compressed, _ = compress_transcript(transcript, strip_filler=False, strip_timestamps=False,
+                                            merge_turns=False)
+        assert compressed == transcript
+        
+    @patch('analyzer.get_client')
+    def test_analysis_sends_compressed_transcript(self, mock_get_client):
+        """Test that the API sees the compressed text and the saving is counted"""
+        from analyzer import get_compression_stats
+        mock_client = Mock()
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "SUMMARY:\nShort."
+        mock_client.chat.completions.create.return_value = response
+        mock_get_client.return_value = mock_client
+        transcript = "[00:00:01] John: Um, hello there.\n[00:00:02] John: Uh, we ship Monday."
+        
+        saved = get_compression_stats()['tokens_saved']
+        reported = []
+        result = analyze_transcript(transcript, on_compressed=reported.append)
+        prompt = mock_client.chat.completions.create.call_args.kwargs['messages'][1]['content']
+        assert "John: hello there.\nwe ship Monday." in prompt
+        assert get_compression_stats()['tokens_saved'] - saved == reported[0]['tokens_saved'] > 0
+        assert 'tokens_saved' not in result
+        
+        analyze_transcript(transcript, compress=False)
+        prompt = mock_client.chat.completions.create.call_args.kwargs['messages'][1]['content']
+        assert transcript in prompt
+
+
+class TestResponseParser:
+    """Tests for incremental ResponseParser"""
+    
+    RESPONSE = """SUMMARY:
+Quick sync.
+
+ACTION ITEMS:
+- John to send notes
+
+OPEN QUESTIONS:
+- Budget?
+"""
+
+    def test_sections_complete_when_next_header_arrives(self):
+        """Test that each section is reported as soon as it is finished"""
+        parser = ResponseParser()
+        completed = []
+        for i in range(0, len(self.RESPONSE), 7):
+            completed.append([key for key, _ in parser.feed(self.RESPONSE[i:i + 7])])
+        
+        flat = [key for keys in completed for key in keys]
+        assert flat == ['summary', 'action_items']
+        assert [key for key, _ in parser.close()] == ['questions', 'decisions', 'attendees']
+        
+    def test_incremental_result_matches_parse_response(self):
+        """Test that feeding in fragments gives the same result as parsing at once"""
+        parser = ResponseParser()
+        for char in self.RESPONSE:
+            parser.feed(char)
+        parser.close()
+        expected = parse_response(self.RESPONSE)
+        for key in ('summary', 'action_items', 'decisions', 'questions', 'attendees'):
+            assert parser.result[key] == expected[key]
 
 
 class TestAnalyzeTranscript:
@@ -144,6 +488,910 @@ ATTENDEES:
         
         assert "Failed to analyze transcript" in str(exc_info.value)
 
+    @patch('analyzer.get_client')
+    def test_analyze_transcript_chunks_long_transcripts(self, mock_get_client):
+        """Test that long transcripts are analyzed per chunk and merged"""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = """
+SUMMARY:
+Chunk summary
+
+ACTION ITEMS:
+- Shared action
+
+ATTENDEES:
+- John
+"""
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_get_client.return_value = mock_client
+        
+        transcript = "\n".join(f"John: point number {i} " + "x" * 80 for i in range(100))
+        
+        with patch('analyzer.CHUNK_TOKEN_LIMIT', 500):
+            result = analyze_transcript(transcript)
+        
+        assert mock_client.chat.completions.create.call_count > 1
+        assert result['action_items'] == ['Shared action']
+        assert result['attendees'] == ['John']
+        assert "Chunk summary" in result['summary']
+
+    @patch('analyzer.get_client')
+    def test_analyze_transcript_replays_cached_response(self, mock_get_client):
+        """Test that repeat analyses are served from the cache"""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "SUMMARY:\nCached summary\n\nACTION ITEMS:\n- Task"
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_get_client.return_value = mock_client
+        
+        first = analyze_transcript("John: same meeting")
+        second = analyze_transcript("John: same meeting  \n")
+        analyze_transcript("John: same meeting", use_cache=False)
+        
+        assert mock_client.chat.completions.create.call_count == 2
+        assert second['summary'] == first['summary'] == 'Cached summary'
+        assert second['action_items'] == ['Task']
+        
+    @patch('analyzer.get_client')
+    def test_analyze_transcript_streams_sections(self, mock_get_client):
+        """Test that stream=True reports sections while the completion arrives"""
+        text = "SUMMARY:\nStreamed summary\n\nACTION ITEMS:\n- First task\n"
+        chunks = []
+        for piece in [text[i:i + 5] for i in range(0, len(text), 5)]:
+            chunk = Mock()
+            chunk.choices = [Mock()]
+            chunk.choices[0].delta.content = piece
+            chunks.append(chunk)
+        seen = []
+        
+        def fake_stream(**kwargs):
+            assert kwargs['stream'] is True
+            for chunk in chunks:
+                seen.append(('chunk', None))
+                yield chunk
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = fake_stream
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_transcript("John: stream me", stream=True,
+                                    on_section=lambda key, value: seen.append((key, value)))
+        
+        sections = [item for item in seen if item[0] != 'chunk']
+        assert sections[0] == ('summary', 'Streamed summary')
+        assert seen.index(sections[0]) < len(chunks)  # before the stream finished
+        assert [key for key, _ in sections] == ['summary', 'action_items', 'decisions', 'questions', 'attendees']
+        assert result['action_items'] == ['First task']
+
+    @patch('analyzer.time.sleep')
+    @patch('analyzer.get_client')
+    def test_rate_limit_errors_shrink_shared_concurrency(self, mock_get_client, mock_sleep):
+        """Test that a 429 is reported to the shared rate limiter"""
+        from openai import RateLimitError
+        import analyzer
+        rate_limited = RateLimitError.__new__(RateLimitError)
+        Exception.__init__(rate_limited, "429")
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "SUMMARY:\nAfter retry"
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [rate_limited, response]
+        mock_get_client.return_value = mock_client
+        
+        limiter = analyzer.configure_rate_limiter(rpm=600, tpm=100000, max_concurrency=4)
+        try:
+            result = analyze_transcript("John: throttled")
+        finally:
+            analyzer.configure_rate_limiter(None, None)
+        
+        assert result['summary'] == 'After retry'
+        assert limiter.stats()['rate_limited'] == 1
+        assert limiter.concurrency == 2
+        
+    @patch('analyzer.time.sleep')
+    @patch('analyzer.get_client')
+    def test_retry_policy_budgets_decide_by_default(self, mock_get_client, mock_sleep):
+        """Test that rate limits get their own larger budget unless the caller caps retries"""
+        from openai import RateLimitError
+        from retry_policy import DEFAULT_BUDGETS, RATE_LIMIT
+        rate_limited = RateLimitError.__new__(RateLimitError)
+        Exception.__init__(rate_limited, "429")
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "SUMMARY:\nEventually"
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        
+        mock_client.chat.completions.create.side_effect = [rate_limited] * DEFAULT_BUDGETS[RATE_LIMIT] + [response]
+        assert analyze_transcript("John: patient", use_cache=False)['summary'] == 'Eventually'
+        
+        mock_client.chat.completions.create.side_effect = [rate_limited, rate_limited, response]
+        with pytest.raises(Exception, match="Rate limit"):
+            analyze_transcript("John: impatient", retry_count=1, use_cache=False)
+
+
+    @patch('analyzer.time.sleep')
+    @patch('analyzer.get_client')
+    def test_server_errors_retry_with_retry_after(self, mock_get_client, mock_sleep):
+        """Test that a 5xx is retried after the server's Retry-After hint"""
+        from openai import InternalServerError
+        server_error = InternalServerError.__new__(InternalServerError)
+        Exception.__init__(server_error, "503")
+        server_error.status_code = 503
+        server_error.response = Mock(headers={'retry-after': '3'})
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "SUMMARY:\nRecovered"
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [server_error, response]
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_transcript("John: flaky server")
+        
+        assert result['summary'] == 'Recovered'
+        mock_sleep.assert_called_once_with(3.0)
+        
+    @patch('analyzer.get_client')
+    def test_open_circuit_fails_fast_or_falls_back(self, mock_get_client):
+        """Test that an open circuit skips the API and can fall back to demo mode"""
+        import analyzer
+        breaker = analyzer.get_circuit_breaker()
+        for _ in range(breaker.min_calls):
+            breaker.record_failure()
+        
+        with pytest.raises(analyzer.CircuitOpenError):
+            analyze_transcript("John: anyone there?")
+        result = analyze_transcript("John: I will send the notes.", fallback_to_demo=True)
+        
+        mock_get_client.assert_not_called()
+        assert result['attendees'] == ['John']
+
+
+class TestDeadlinesAndHedging:
+    """Tests for per-call deadlines and hedged requests"""
+    
+    @patch('analyzer.time.sleep')
+    @patch('analyzer.get_client')
+    def test_deadline_carries_through_retries(self, mock_get_client, mock_sleep):
+        """Test that each attempt gets the remaining time and retries stop at the deadline"""
+        import analyzer
+        from openai import APIConnectionError
+        connection_error = APIConnectionError.__new__(APIConnectionError)
+        Exception.__init__(connection_error, "connection reset")
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = connection_error
+        mock_get_client.return_value = mock_client
+        clock = iter([100.0, 100.0, 100.5, 101.0, 103.5, 104.0, 110.0, 110.0])
+        
+        with patch('analyzer.time.monotonic', side_effect=lambda: next(clock)), \
+                patch.object(analyzer.get_retry_policy(), 'backoff', return_value=3.0):
+            with pytest.raises(analyzer.DeadlineExceededError):
+                analyze_transcript("John: hello", retry_count=5, deadline=5.0)
+        
+        timeouts = [call.kwargs['timeout'] for call in mock_client.chat.completions.create.call_args_list]
+        assert timeouts[0] == pytest.approx(5.0)
+        assert 0 < timeouts[1] < 5.0 - 3.0
+        assert len(timeouts) == 2
+        
+    @patch('analyzer.get_client')
+    def test_expired_probe_does_not_wedge_circuit(self, mock_get_client):
+        """Test that a half-open probe that runs out of time lets later calls through"""
+        import analyzer
+        from retry_policy import CircuitBreaker
+        mock_get_client.return_value = Mock()
+        breaker = analyzer.get_circuit_breaker()
+        breaker.state = CircuitBreaker.HALF_OPEN
+        
+        with patch('analyzer._time_left', side_effect=analyzer.DeadlineExceededError("Too slow.")):
+            with pytest.raises(analyzer.DeadlineExceededError):
+                analyze_transcript("John: probe", deadline=0.05, hedge=True)
+        assert breaker.allow()
+        
+    @patch('analyzer.get_client')
+    def test_deadline_bounds_a_stream_that_keeps_sending(self, mock_get_client):
+        """Test that a slow but steady stream is closed once the whole deadline passes"""
+        import time
+        import analyzer
+        closed = []
+        
+        def endless_stream(**kwargs):
+            try:
+                while True:
+                    time.sleep(0.02)
+                    chunk = Mock()
+                    chunk.choices = [Mock(finish_reason=None)]
+                    chunk.choices[0].delta.content = "word "
+                    yield chunk
+            finally:
+                closed.append(True)
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = endless_stream
+        mock_get_client.return_value = mock_client
+        
+        start = time.monotonic()
+        with pytest.raises(analyzer.DeadlineExceededError):
+            analyze_transcript("John: stream me", stream=True, on_section=lambda key, value: None,
+                               deadline=0.3, use_cache=False)
+        assert time.monotonic() - start < 1.0
+        assert closed == [True]
+        
+    @patch('analyzer.get_client')
+    def test_local_errors_are_not_recorded_as_endpoint_health(self, mock_get_client):
+        """Test that a missing API key neither closes a half-open circuit nor counts as a success"""
+        import analyzer
+        from retry_policy import CircuitBreaker
+        mock_get_client.side_effect = ValueError("OPENAI_API_KEY environment variable is not set")
+        breaker = analyzer.get_circuit_breaker()
+        breaker.state = CircuitBreaker.HALF_OPEN
+        
+        with pytest.raises(Exception, match="OPENAI_API_KEY"):
+            analyze_transcript("John: no key", use_cache=False)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert len(breaker._outcomes) == 0
+        assert breaker.allow()  # the probe was released
+        
+    @patch('analyzer.get_client')
+    def test_deadline_can_fall_back_to_demo(self, mock_get_client):
+        """Test that an expired deadline can degrade to demo mode"""
+        import analyzer
+        mock_get_client.return_value = Mock()
+        with patch('analyzer._time_left', side_effect=analyzer.DeadlineExceededError("Too slow.")):
+            result = analyze_transcript("John: I will send the notes.", deadline=1.0, fallback_to_demo=True)
+        assert result['attendees'] == ['John']
+        
+    @patch('analyzer.get_client')
+    def test_slow_request_is_hedged_with_fallback_model(self, mock_get_client):
+        """Test that the backup model's answer wins and isn't cached as the primary's"""
+        import threading
+        import analyzer
+        release = threading.Event()
+        
+        def create(**kwargs):
+            response = Mock()
+            response.choices = [Mock()]
+            if kwargs['model'] == analyzer.MODEL:
+                release.wait(5)
+                response.choices[0].message.content = "SUMMARY:\nPrimary"
+            else:
+                response.choices[0].message.content = "SUMMARY:\nBackup"
+            return response
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_get_client.return_value = mock_client
+        try:
+            with patch('analyzer.HEDGE_MODEL', 'fast-model'), patch('analyzer.HEDGE_DEFAULT_DELAY', 0.05):
+                result = analyze_transcript("John: hedge me", hedge=True)
+        finally:
+            release.set()
+        
+        assert result['summary'] == 'Backup'
+        assert analyzer.get_cache().get(analyzer.cache_key_for("John: hedge me")) is None
+        
+    @patch('analyzer.get_client')
+    def test_hedged_backup_counts_against_rate_limits(self, mock_get_client):
+        """Test that the backup request reserves its own rate limit budget"""
+        import threading
+        import analyzer
+        release = threading.Event()
+        
+        def create(**kwargs):
+            if kwargs['model'] == analyzer.MODEL:
+                release.wait(5)
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = "SUMMARY:\nDone"
+            return response
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_get_client.return_value = mock_client
+        limiter = analyzer.configure_rate_limiter(rpm=600, tpm=1000000, max_concurrency=4)
+        try:
+            with patch('analyzer.HEDGE_MODEL', 'fast-model'), patch('analyzer.HEDGE_DEFAULT_DELAY', 0.05), \
+                    patch.object(limiter, 'limit', wraps=limiter.limit) as limit:
+                analyze_transcript("John: hedge me too", hedge=True, use_cache=False)
+        finally:
+            release.set()
+            analyzer.configure_rate_limiter()
+        
+        assert limit.call_count == 2
+
+
+class TestFanOut:
+    """Tests for parallel per-section requests"""
+    
+    @staticmethod
+    def _section_client():
+        """Mock client answering each single-section prompt with that section only."""
+        import analyzer
+        answers = {
+            'SUMMARY:': "SUMMARY:\nWe planned the launch.",
+            'ACTION ITEMS:': "ACTION ITEMS:\n- John will draft the post\nATTENDEES:\n- Stray",
+            'DECISIONS MADE:': "DECISIONS MADE:\n- Launch on Monday",
+            'OPEN QUESTIONS:': "OPEN QUESTIONS:\n- Who reviews it?",
+            'ATTENDEES:': "ATTENDEES:\n- John"
+        }
+        
+        def create(**kwargs):
+            prompt = kwargs['messages'][1]['content']
+            header = next(h for h in analyzer.SECTION_INSTRUCTIONS if f"\n{h}\n" in prompt)
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = answers[header]
+            return response
+        
+        client = Mock()
+        client.chat.completions.create.side_effect = create
+        return client
+        
+    @patch('analyzer.get_client')
+    def test_sections_are_requested_separately_and_merged(self, mock_get_client):
+        """Test that each section gets its own request and token estimate"""
+        import analyzer
+        mock_get_client.return_value = self._section_client()
+        sections = []
+        
+        result = analyze_transcript("John: let's launch Monday", fan_out=True,
+                                    on_section=lambda key, value: sections.append(key))
+        
+        calls = mock_get_client.return_value.chat.completions.create.call_args_list
+        estimates = analyzer.estimate_output_tokens("John: let's launch Monday")
+        assert sorted(call.kwargs['max_tokens'] for call in calls) == sorted(estimates.values())
+        assert result['summary'] == "We planned the launch."
+        assert result['action_items'] == ["John will draft the post"]
+        assert result['decisions'] == ["Launch on Monday"]
+        assert result['questions'] == ["Who reviews it?"]
+        # The stray header in the action items answer is ignored
+        assert result['attendees'] == ["John"]
+        assert sections == list(analyzer.RESPONSE_SECTIONS.values())
+        
+    @patch('analyzer.get_client')
+    def test_sections_are_cached_individually(self, mock_get_client):
+        """Test that a repeat fan-out analysis is served from the cache"""
+        mock_get_client.return_value = self._section_client()
+        first = analyze_transcript("John: cache each section", fan_out=True)
+        second = analyze_transcript("John: cache each section", fan_out=True)
+        
+        assert mock_get_client.return_value.chat.completions.create.call_count == 5
+        assert second['decisions'] == first['decisions']
+
+
+class TestClients:
+    """Tests for shared client construction"""
+    
+    def test_concurrent_get_client_builds_one_client(self, monkeypatch):
+        """Test that racing first calls share a single client and pool"""
+        import threading
+        import time
+        import analyzer
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(analyzer, '_client', None)
+        
+        def slow_client(**kwargs):
+            time.sleep(0.05)
+            return Mock()
+        
+        with patch('openai.OpenAI', side_effect=slow_client) as mock_openai, \
+                patch('openai.DefaultHttpxClient'):
+            threads = [threading.Thread(target=analyzer.get_client) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert mock_openai.call_count == 1
+        
+    def test_configure_http_client_sets_pool_and_timeouts(self, monkeypatch):
+        """Test that pool limits and timeouts reach the HTTP client"""
+        import analyzer
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        analyzer.configure_http_client(max_connections=12, max_keepalive=6, connect_timeout=2.0,
+                                       read_timeout=30.0)
+        try:
+            with patch('openai.OpenAI'), patch('openai.DefaultHttpxClient') as mock_http:
+                analyzer.get_client()
+        finally:
+            analyzer.configure_http_client()
+        
+        options = mock_http.call_args.kwargs
+        assert options['limits'].max_connections == 12
+        assert options['limits'].max_keepalive_connections == 6
+        assert options['timeout'].connect == 2.0
+        assert options['timeout'].read == 30.0
+
+
+    def test_prewarm_connection_opens_pooled_connection(self, monkeypatch):
+        """Test that pre-warming builds the client and touches the API host"""
+        import analyzer
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(analyzer, '_client', None)
+        monkeypatch.setattr(analyzer, '_http_client', None)
+        with patch('openai.OpenAI') as mock_openai, patch('openai.DefaultHttpxClient') as mock_http:
+            mock_openai.return_value.base_url = "https://api.example.com/v1/"
+            assert analyzer.prewarm_connection() is True
+        
+        mock_http.return_value.head.assert_called_once_with("https://api.example.com/v1/")
+        
+    def test_prewarm_connection_failures_are_silent(self, monkeypatch):
+        """Test that a failed warm-up never raises"""
+        import analyzer
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(analyzer, '_client', None)
+        monkeypatch.setattr(analyzer, '_http_client', None)
+        with patch('openai.OpenAI'), patch('openai.DefaultHttpxClient') as mock_http:
+            mock_http.return_value.head.side_effect = OSError("offline")
+            assert analyzer.prewarm_connection() is False
+
+
+class TestImportTime:
+    """Import-time budget for the demo path (no OpenAI SDK)"""
+    
+    # Generous budget; importing the OpenAI SDK alone costs several times more
+    BUDGET_US = 250_000
+    
+    def _import_times(self, code):
+        """Run code with -X importtime and return {module: cumulative microseconds}"""
+        import os
+        import subprocess
+        import sys
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative_us, name = line.split("|")
+            times[name.strip()] = int(cumulative_us)
+        return times
+        
+    def test_demo_mode_does_not_import_openai(self):
+        """Test that demo analysis never loads the SDK or its dependencies"""
+        times = self._import_times("import analyzer; analyzer.analyze_transcript_demo('John: hi')")
+        loaded = {name.split('.')[0] for name in times}
+        assert not loaded & {'openai', 'httpx', 'httpx2', 'pydantic'}
+        
+    def test_analyzer_import_within_budget(self):
+        """Test that importing analyzer stays cheap"""
+        times = self._import_times("import analyzer")
+        assert times['analyzer'] < self.BUDGET_US
+
+
+class TestLiveAnalysis:
+    """Tests for incremental (live meeting) analysis"""
+    
+    def test_live_context_is_bounded(self):
+        """Test that the context sent with each update doesn't grow with the meeting"""
+        import analyzer
+        prior = {'summary': 'Planning.', 'action_items': [f"task {i}" for i in range(500)],
+                 'decisions': [], 'questions': [], 'attendees': ['John']}
+        context = analyzer.build_live_context(prior)
+        assert "task 499" in context
+        assert f"task {499 - analyzer.LIVE_CONTEXT_ITEMS}" not in context
+        assert "Planning." in context
+        
+    @patch('analyzer.get_client')
+    def test_update_sends_only_new_segment(self, mock_get_client):
+        """Test that an update sends the delta plus prior notes, then merges"""
+        import analyzer
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = (
+            "SUMMARY:\nPlanning, then launch.\n\nACTION ITEMS:\n- Book venue\n- Draft plan\n\n"
+            "ATTENDEES:\n- Sarah"
+        )
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = response
+        mock_get_client.return_value = mock_client
+        prior = {'summary': 'Planning.', 'action_items': ['Draft plan'], 'decisions': ['Use Python'],
+                 'questions': [], 'attendees': ['John']}
+        
+        result = analyzer.analyze_transcript_update("Sarah: I will book the venue.\n", prior)
+        
+        prompt = mock_client.chat.completions.create.call_args.kwargs['messages'][-1]['content']
+        assert "Sarah: I will book the venue." in prompt
+        assert "Draft plan" in prompt  # prior notes as context
+        assert result['summary'] == 'Planning, then launch.'
+        assert result['action_items'] == ['Draft plan', 'Book venue']
+        assert result['decisions'] == ['Use Python']
+        assert result['attendees'] == ['John', 'Sarah']
+
+
+class TestAnalyzeTranscriptDemo:
+    """Tests for analyze_transcript_demo function"""
+    
+    def test_demo_classifies_lines(self):
+        """Test attendee, action, decision and question extraction"""
+        transcript = """John: Let's get started with the sprint review.
+Sarah: I will deploy the hotfix tonight.
+Mike Chen: We agreed to freeze the API next week.
+John: Can we move the demo to Friday?
+all of us should read the doc before next meeting
+"""
+        result = analyze_transcript_demo(transcript)
+        
+        assert result['attendees'] == ['John', 'Sarah', 'Mike Chen']
+        assert result['action_items'] == [
+            'I will deploy the hotfix tonight.',
+            'all of us should read the doc before next meeting'
+        ]
+        assert result['decisions'] == [
+            "Let's get started with the sprint review.",
+            'We agreed to freeze the API next week.'
+        ]
+        assert result['questions'] == ['Can we move the demo to Friday?']
+        assert 'with 3 participants' in result['summary']
+        assert '6 lines' in result['summary']
+        
+    def test_demo_caps_items(self):
+        """Test that item lists are capped while counts cover the whole transcript"""
+        transcript = "\n".join(f"Speaker {i}: Should we ship build {i}?" for i in range(50))
+        result = analyze_transcript_demo(transcript)
+        
+        assert len(result['action_items']) == 10
+        assert len(result['questions']) == 10
+        assert len(result['attendees']) == 20
+        assert 'with 50 participants' in result['summary']
+
+
+class TestAnalyzeLinesDemo:
+    """Tests for analyze_lines_demo function"""
+    
+    TRANSCRIPT = "John: We agreed to ship on Monday.\nSarah: Who will write the notes?\n\nMike: I will.\n"
+    
+    @staticmethod
+    def _without_timestamp(result):
+        return {key: value for key, value in result.items() if key != 'timestamp'}
+        
+    def test_file_input_matches_string_input(self, tmp_path):
+        """Test that streaming a file gives the same result as the whole string"""
+        path = tmp_path / "meeting.txt"
+        path.write_text(self.TRANSCRIPT, encoding='utf-8')
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            streamed = analyze_lines_demo(f)
+        
+        assert self._without_timestamp(streamed) == self._without_timestamp(analyze_transcript_demo(self.TRANSCRIPT))
+        
+    def test_generator_input_uses_bounded_memory(self):
+        """Test that memory does not grow with the number of input lines"""
+        import tracemalloc
+        
+        def lines(count):
+            for i in range(count):
+                yield f"Speaker {i % 5}: we should follow up on item {i}?\n"
+        
+        tracemalloc.start()
+        result = analyze_lines_demo(lines(200_000))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        assert len(result['action_items']) == 10
+        assert '200001 lines' in result['summary']
+        assert peak < 1024 * 1024
+
+
+class TestStructuredOutput:
+    """Tests for the JSON schema output mode"""
+    
+    JSON_RESPONSE = """{
+        "summary": "Release planning.",
+        "action_items": [
+            {"task": "Write the changelog", "assignee": "Sarah"},
+            {"task": "Mike to tag the release", "assignee": "Mike"},
+            {"task": "Book a room", "assignee": null}
+        ],
+        "decisions": ["Ship on Monday", "None"],
+        "questions": [],
+        "attendees": ["Sarah", "Mike"]
+    }"""
+    
+    @staticmethod
+    def _mock_client(*contents_or_errors):
+        mock_client = Mock()
+        side_effects = []
+        for item in contents_or_errors:
+            if isinstance(item, Exception):
+                side_effects.append(item)
+            else:
+                response = Mock()
+                response.choices = [Mock()]
+                response.choices[0].message.content = item
+                side_effects.append(response)
+        mock_client.chat.completions.create.side_effect = side_effects
+        return mock_client
+        
+    def test_decode_json_response(self):
+        """Test that JSON output maps onto the standard analysis dict"""
+        result = decode_json_response(self.JSON_RESPONSE)
+        
+        assert result['summary'] == 'Release planning.'
+        assert result['action_items'] == [
+            'Write the changelog (Sarah)',
+            'Mike to tag the release',
+            'Book a room'
+        ]
+        assert result['decisions'] == ['Ship on Monday']
+        assert result['attendees'] == ['Sarah', 'Mike']
+        
+    def test_decode_json_response_rejects_malformed_output(self):
+        """Test that truncated or wrongly shaped JSON raises StructuredOutputError"""
+        with pytest.raises(StructuredOutputError):
+            decode_json_response('{"summary": "cut off')
+        with pytest.raises(StructuredOutputError):
+            decode_json_response('{"summary": "ok", "decisions": "not a list"}')
+            
+    @patch('analyzer.get_client')
+    def test_structured_mode_requests_json_schema(self, mock_get_client):
+        """Test that structured=True sends response_format and skips text parsing"""
+        mock_client = self._mock_client(self.JSON_RESPONSE)
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_transcript("Sarah: let's release", structured=True)
+        
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs['response_format']['type'] == 'json_schema'
+        assert result['decisions'] == ['Ship on Monday']
+        
+    @patch('analyzer._structured_output_supported', True)
+    @patch('analyzer.get_client')
+    def test_structured_mode_falls_back_when_schema_unsupported(self, mock_get_client):
+        """Test the fallback to the text format when the endpoint rejects schemas"""
+        from openai import BadRequestError
+        rejected = BadRequestError.__new__(BadRequestError)
+        Exception.__init__(rejected, "response_format json_schema is not supported")
+        mock_client = self._mock_client(rejected, "SUMMARY:\nText summary")
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_transcript("John: hello", structured=True)
+        
+        assert result['summary'] == 'Text summary'
+        second_call = mock_client.chat.completions.create.call_args_list[1].kwargs
+        assert 'response_format' not in second_call
+        
+    @patch('analyzer._structured_output_supported', True)
+    @patch('analyzer.get_client')
+    def test_unrelated_bad_request_keeps_structured_mode(self, mock_get_client):
+        """Test that a bad request about something else doesn't disable JSON schemas"""
+        import analyzer
+        from openai import BadRequestError
+        rejected = BadRequestError.__new__(BadRequestError)
+        Exception.__init__(rejected, "This model's maximum context length is 128000 tokens")
+        rejected.param, rejected.code = 'messages', 'context_length_exceeded'
+        mock_client = self._mock_client(rejected, "SUMMARY:\nText summary")
+        mock_get_client.return_value = mock_client
+        
+        with pytest.raises(Exception, match="maximum context length"):
+            analyze_transcript("John: hello", structured=True, retry_count=0, fallback_to_demo=False)
+        assert analyzer._structured_output_supported is True
+        assert mock_client.chat.completions.create.call_count == 1
+        
+    @patch('analyzer.get_client')
+    def test_structured_mode_falls_back_on_malformed_json(self, mock_get_client):
+        """Test that an undecodable JSON response is retried in text mode"""
+        mock_client = self._mock_client('{"summary": ', "SUMMARY:\nRecovered")
+        mock_get_client.return_value = mock_client
+        
+        result = analyze_transcript("John: hello again", structured=True)
+        
+        assert result['summary'] == 'Recovered'
+
+
+class TestSplitTranscript:
+    """Tests for split_transcript function"""
+    
+    def test_short_transcript_is_single_chunk(self):
+        """Test that a transcript under the limit is not split"""
+        transcript = "John: Hello\nSarah: Hi"
+        assert split_transcript(transcript) == [transcript]
+        
+    def test_chunks_break_on_speaker_turns(self):
+        """Test that chunks respect the budget and never split a turn"""
+        turns = [f"Speaker{i % 3}: " + "word " * 40 + f"\ncontinued thought {i}" for i in range(30)]
+        transcript = "\n".join(turns)
+        chunks = split_transcript(transcript, max_tokens=200)
+        
+        assert len(chunks) > 1
+        assert "\n".join(chunks) == transcript
+        for chunk in chunks:
+            assert chunk.startswith("Speaker")
+            assert len(chunk) <= 200 * 4
+            
+    def test_edit_only_changes_nearby_chunks(self):
+        """Test that content-defined boundaries survive an edit elsewhere"""
+        turns = [f"Speaker{i % 4}: " + "word " * (5 + (i * 7) % 40) + f"point {i}" for i in range(600)]
+        before = split_transcript("\n".join(turns), max_tokens=500)
+        turns[300] = turns[300].replace("Speaker", "Spaeker") + " (typo fixed)"
+        after = split_transcript("\n".join(turns), max_tokens=500)
+        
+        changed = set(after) - set(before)
+        assert len(before) > 10
+        assert 1 <= len(changed) <= 3
+        
+    @patch('analyzer.CHUNK_TOKEN_LIMIT', 500)
+    @patch('analyzer.get_client')
+    def test_reanalysis_after_edit_resends_only_changed_chunks(self, mock_get_client):
+        """Test that cached partial analyses are reused for unchanged chunks"""
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "SUMMARY:\nPart."
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = response
+        mock_get_client.return_value = mock_client
+        turns = [f"Speaker{i % 4}: " + "word " * (5 + (i * 7) % 40) + f"point {i}" for i in range(600)]
+        
+        analyze_transcript("\n".join(turns))
+        first_calls = mock_client.chat.completions.create.call_count
+        turns[300] += " (typo fixed)"
+        analyze_transcript("\n".join(turns))
+        
+        assert mock_client.chat.completions.create.call_count - first_calls <= 3 < first_calls
+        
+    def test_oversized_turn_is_hard_split(self):
+        """Test that a single turn larger than the budget is still split"""
+        transcript = "John: " + "a" * 5000
+        chunks = split_transcript(transcript, max_tokens=100)
+        
+        assert len(chunks) > 1
+        assert all(chunk.startswith("John: ") and len(chunk) <= 100 * 4 for chunk in chunks)
+        assert chunks[0] + "".join(chunk[len("John: "):] for chunk in chunks[1:]) == transcript
+
+
+class TestMergeAnalyses:
+    """Tests for merge_analyses function"""
+    
+    def test_merge_joins_summaries_and_dedupes_lists(self):
+        """Test that partial analyses are reduced into one result"""
+        partials = [
+            {'summary': 'Part one.', 'action_items': ['Write report'], 'decisions': [],
+             'questions': [], 'attendees': ['John', 'Sarah'], 'timestamp': datetime.now()},
+            {'summary': 'Part two.', 'action_items': ['write report', 'Deploy'], 'decisions': ['Ship it'],
+             'questions': [], 'attendees': ['Sarah', 'Mike'], 'timestamp': datetime.now()},
+        ]
+        result = merge_analyses(partials)
+        
+        assert result['summary'] == 'Part one. Part two.'
+        assert result['action_items'] == ['Write report', 'Deploy']
+        assert result['decisions'] == ['Ship it']
+        assert result['attendees'] == ['John', 'Sarah', 'Mike']
+        assert isinstance(result['timestamp'], datetime)
+
+
+
+class TestAsyncAnalysis:
+    """Tests for analyze_transcript_async and analyze_many"""
+    
+    @staticmethod
+    def _mock_async_client(content):
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        return mock_client
+    
+    def test_each_event_loop_gets_its_own_client(self, monkeypatch):
+        """Test that a second asyncio.run doesn't reuse a client bound to a closed loop"""
+        import analyzer
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        
+        async def client_and_again():
+            return analyzer.get_async_client(), analyzer.get_async_client()
+        
+        first, same = asyncio.run(client_and_again())
+        second, _ = asyncio.run(client_and_again())
+        
+        assert first is same
+        assert second is not first
+        assert len(analyzer._async_clients) == 1
+        
+    @patch('analyzer.get_async_client')
+    def test_analyze_transcript_async_calls_api(self, mock_get_client):
+        """Test that the async path parses the API response"""
+        mock_client = self._mock_async_client("SUMMARY:\nAsync summary\n\nACTION ITEMS:\n- Do it")
+        mock_get_client.return_value = mock_client
+        
+        result = asyncio.run(analyze_transcript_async("Test transcript"))
+        
+        assert mock_client.chat.completions.create.await_count == 1
+        assert result['summary'] == 'Async summary'
+        assert result['action_items'] == ['Do it']
+        
+    @patch('analyzer.get_async_client')
+    def test_async_truncated_response_is_continued(self, mock_get_client):
+        """Test that the async path sizes max_tokens and continues cut-off answers like the sync one"""
+        import analyzer
+        responses = []
+        for content, finish_reason in [("SUMMARY:\nAsync plan.\n\nACTION ITEMS:\n- John to", 'length'),
+                                       ("ACTION ITEMS:\n- John to write\nDECISIONS MADE:\nNone\n"
+                                        "OPEN QUESTIONS:\nNone\nATTENDEES:\n- John", 'stop')]:
+            response = Mock()
+            response.choices = [Mock(finish_reason=finish_reason)]
+            response.choices[0].message.content = content
+            responses.append(response)
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=responses)
+        mock_get_client.return_value = mock_client
+        transcript = "John: async long meeting"
+        
+        result = asyncio.run(analyze_transcript_async(transcript, compress=False))
+        
+        calls = mock_client.chat.completions.create.call_args_list
+        assert calls[0].kwargs['max_tokens'] == sum(analyzer.estimate_output_tokens(transcript).values())
+        assert result['summary'] == "Async plan."
+        assert result['action_items'] == ["John to write"]
+        assert result['attendees'] == ["John"]
+        assert analyzer.get_cache().get(analyzer.cache_key_for(transcript)) is not None
+        
+    @patch('analyzer.get_async_client')
+    @patch('analyzer.get_client')
+    def test_async_path_sends_the_same_compressed_text(self, mock_get_client, mock_get_async_client):
+        """Test that the sync and async entry points send identical prompts"""
+        mock_async = self._mock_async_client("SUMMARY:\nShort.")
+        mock_get_async_client.return_value = mock_async
+        mock_sync = Mock()
+        mock_sync.chat.completions.create.return_value = mock_async.chat.completions.create.return_value
+        mock_get_client.return_value = mock_sync
+        transcript = "[00:00:01] John: Um, hello there.\n[00:00:02] John: Uh, we ship Monday."
+        
+        asyncio.run(analyze_transcript_async(transcript, use_cache=False))
+        analyze_transcript(transcript, use_cache=False)
+        
+        async_prompt = mock_async.chat.completions.create.call_args.kwargs['messages'][1]['content']
+        sync_prompt = mock_sync.chat.completions.create.call_args.kwargs['messages'][1]['content']
+        assert "John: hello there.\nwe ship Monday." in async_prompt
+        assert async_prompt == sync_prompt
+        
+    @patch('analyzer.get_async_client')
+    def test_analyze_many_bounds_concurrency(self, mock_get_client):
+        """Test that analyze_many never exceeds the concurrency limit"""
+        in_flight = 0
+        peak = 0
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "SUMMARY:\nDone"
+        
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return response
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create = create
+        mock_get_client.return_value = mock_client
+        
+        async def collect():
+            return [item async for item in analyze_many([f"Meeting {i}" for i in range(10)], concurrency=3)]
+        
+        results = asyncio.run(collect())
+        
+        assert peak <= 3
+        assert sorted(index for index, _ in results) == list(range(10))
+        assert all(result['summary'] == 'Done' for _, result in results)
+        
+    @patch('analyzer.get_async_client')
+    def test_analyze_many_yields_errors_per_transcript(self, mock_get_client):
+        """Test that one failing transcript doesn't abort the batch"""
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("boom"))
+        mock_get_client.return_value = mock_client
+        
+        async def collect():
+            return [item async for item in analyze_many(["a", "b"])]
+        
+        results = asyncio.run(collect())
+        
+        assert len(results) == 2
+        assert all(isinstance(result, Exception) for _, result in results)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""
+Unit tests for batch module
+"""
+
+import os
+import pytest
+from batch import iter_transcript_files, output_path_for, run_batch, format_batch_summary
+from main import main
+
+
+TRANSCRIPT = """John: Good morning everyone. Let's start with updates.
+Sarah: I will finish the report by Friday.
+Mike: Should we move the release?
+"""
+
+
+class TestIterTranscriptFiles:
+    """Tests for iter_transcript_files function"""
+    
+    def test_directories_are_walked_for_transcripts(self, tmp_path):
+        """Test that directories expand to their .txt files in sorted order"""
+        (tmp_path / "b.txt").write_text("b")
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "notes.md").write_text("skip me")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "c.txt").write_text("c")
+        
+        files = list(iter_transcript_files([str(tmp_path)]))
+        
+        assert [os.path.basename(f) for f in files] == ['a.txt', 'b.txt', 'c.txt']
+        
+    def test_explicit_files_are_kept(self, tmp_path):
+        """Test that explicitly named files are used regardless of extension"""
+        path = tmp_path / "meeting.log"
+        path.write_text("x")
+        assert list(iter_transcript_files([str(path)])) == [str(path)]
+
+
+class TestRunBatch:
+    """Tests for run_batch function"""
+    
+    def test_run_batch_demo_mode_writes_results(self, tmp_path):
+        """Test that every transcript is analyzed and saved"""
+        src = tmp_path / "src"
+        src.mkdir()
+        for i in range(5):
+            (src / f"meeting_{i}.txt").write_text(TRANSCRIPT)
+        out = tmp_path / "out"
+        
+        report = run_batch([str(src)], str(out), jobs=2, use_demo=True)
+        
+        assert report['succeeded'] == 5
+        assert report['failed'] == []
+        for i in range(5):
+            assert (out / f"meeting_{i}.md").exists()
+            
+    def test_run_batch_mirrors_directories(self, tmp_path):
+        """Test that same-named transcripts in different folders don't overwrite each other"""
+        for team in ("a", "b"):
+            (tmp_path / team).mkdir()
+            (tmp_path / team / "standup.txt").write_text(TRANSCRIPT)
+        out = tmp_path / "out"
+        
+        report = run_batch([str(tmp_path / "a"), str(tmp_path / "b")], str(out), jobs=2, use_demo=True)
+        
+        assert report['succeeded'] == 2
+        assert (out / "a" / "standup.md").exists()
+        assert (out / "b" / "standup.md").exists()
+        
+    def test_run_batch_reports_failures(self, tmp_path):
+        """Test that failing files are reported without stopping the batch"""
+        good = tmp_path / "good.txt"
+        good.write_text(TRANSCRIPT)
+        empty = tmp_path / "empty.txt"
+        empty.write_text("   ")
+        results = []
+        
+        report = run_batch([str(good), str(empty), str(tmp_path / "missing.txt")], str(tmp_path / "out"),
+                           jobs=2, use_demo=True, on_result=lambda *args: results.append(args))
+        
+        assert report['succeeded'] == 1
+        assert len(report['failed']) == 2
+        assert len(results) == 3
+        assert "2 failed" in format_batch_summary(report)
+
+
+class TestFormatFileResult:
+    """Tests for format_file_result function"""
+    
+    def test_reports_saving_and_errors(self):
+        """Test that each file's line shows its compression saving or its error"""
+        from batch import format_file_result
+        assert "saved ~42 token(s)" in format_file_result("a.txt", "out/a.md", None, 42)
+        assert "saved" not in format_file_result("a.txt", "out/a.md", None, None)
+        assert "✗ a.txt: Empty transcript" in format_file_result("a.txt", None, ValueError("Empty transcript"))
+
+
+class TestAnalyzeCommand:
+    """Tests for the 'analyze' CLI subcommand"""
+    
+    def test_analyze_command_exit_codes(self, tmp_path, capsys):
+        """Test that the exit code is non-zero only when a file fails"""
+        good = tmp_path / "good.txt"
+        good.write_text(TRANSCRIPT)
+        out = str(tmp_path / "out")
+        
+        assert main(["analyze", str(good), "--demo", "--jobs", "2", "--out", out]) == 0
+        assert os.path.exists(output_path_for(str(good), out))
+        assert main(["analyze", str(tmp_path / "missing.txt"), "--demo", "--out", out]) == 1
+        assert "Processed" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,63 @@
+"""
+Unit tests for cache module
+"""
+
+import pytest
+from cache import ResponseCache, make_cache_key
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key function"""
+    
+    def test_key_ignores_cosmetic_whitespace(self):
+        """Test that line endings and trailing spaces don't change the key"""
+        a = make_cache_key("John: hi\nSarah: hello\n", "gpt-4o-mini", 1, 1500, 0.7)
+        b = make_cache_key("  \r\nJohn: hi   \r\nSarah: hello", "gpt-4o-mini", 1, 1500, 0.7)
+        assert a == b
+        
+    def test_key_depends_on_request_settings(self):
+        """Test that model, prompt version and sampling settings are part of the key"""
+        base = make_cache_key("John: hi", "gpt-4o-mini", 1, 1500, 0.7)
+        assert base != make_cache_key("John: hi", "gpt-4o", 1, 1500, 0.7)
+        assert base != make_cache_key("John: hi", "gpt-4o-mini", 2, 1500, 0.7)
+        assert base != make_cache_key("John: hi", "gpt-4o-mini", 1, 1000, 0.7)
+        assert base != make_cache_key("John: hi", "gpt-4o-mini", 1, 1500, 0.2)
+        assert base != make_cache_key("John: hi", "gpt-4o-mini", 1, 1500, 0.7, sections=['summary'])
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class"""
+    
+    def test_get_put_and_counters(self, tmp_path):
+        """Test round-tripping a response and counting hits and misses"""
+        cache = ResponseCache(str(tmp_path))
+        
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, "SUMMARY:\nCached")
+        assert cache.get("ab" * 32) == "SUMMARY:\nCached"
+        
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        """Test that the least recently used entry is evicted first"""
+        import os
+        import time
+        cache = ResponseCache(str(tmp_path), max_bytes=250)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        
+        for i, key in enumerate(keys[:2]):
+            cache.put(key, "x" * 100)
+            os.utime(cache._path(key), (time.time() - 100 + i, time.time() - 100 + i))
+        cache.get(keys[0])  # keys[0] becomes most recently used
+        cache.put(keys[2], "x" * 100)
+        
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats()['size_bytes'] <= 250
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -9,6 +9,7 @@ from file_handler import (
     generate_filename, 
     save_to_file, 
     add_to_history, 
+    replace_in_history,
     get_history,
     format_history_display,
     _session_history
@@ -125,6 +126,20 @@ class TestSessionHistory:
         
         assert history1 is not history2
         
+    def test_replace_in_history_keeps_position(self):
+        """Test that a preview entry is replaced in place by the final analysis"""
+        first = {'summary': 'First', 'timestamp': datetime.now()}
+        preview = {'summary': 'Preview', 'timestamp': datetime.now(), 'is_preview': True}
+        final = {'summary': 'Final', 'timestamp': datetime.now()}
+        add_to_history(first)
+        add_to_history(preview)
+        
+        assert "preview" in format_history_display()
+        assert replace_in_history(preview, final) is True
+        assert [a['summary'] for a in get_history()] == ['First', 'Final']
+        assert "preview" not in format_history_display()
+        assert replace_in_history(preview, final) is False
+        
     def test_format_history_display_empty(self):
         """Test formatting empty history"""
         output = format_history_display()
@@ -3,7 +3,7 @@ Unit tests for formatter module
 """
 
 import pytest
-from formatter import format_terminal_output, format_markdown_output
+from formatter import format_terminal_output, format_terminal_section, format_markdown_output
 from datetime import datetime
 
 
@@ -61,6 +61,39 @@ class TestFormatTerminalOutput:
         # Should not crash and should indicate no items
         assert output
         assert 'No action items' in output or 'action items' in output.lower()
+        
+    def test_unrequested_sections_are_omitted(self):
+        """Test that sections missing from a partial analysis aren't shown"""
+        output = format_terminal_output({'action_items': ['Task'], 'timestamp': datetime.now()})
+        
+        assert 'ACTION ITEMS' in output
+        assert 'SUMMARY' not in output
+        assert 'ATTENDEES' not in output
+
+
+class TestFormatTerminalSection:
+    """Tests for format_terminal_section function"""
+    
+    def test_sections_concatenate_to_full_output(self):
+        """Test that printing sections one by one matches the full output"""
+        analysis = {
+            'summary': 'Streamed summary',
+            'action_items': ['Task'],
+            'decisions': [],
+            'questions': ['Why?'],
+            'attendees': [],
+            'timestamp': datetime.now()
+        }
+        keys = ['summary', 'action_items', 'decisions', 'questions', 'attendees']
+        sections = [format_terminal_section(key, analysis[key]) for key in keys]
+        
+        assert "\n".join(sections) == format_terminal_output(analysis)
+        
+    def test_empty_list_section_shows_placeholder(self):
+        """Test that an empty section shows its placeholder message"""
+        output = format_terminal_section('decisions', [])
+        assert 'DECISIONS MADE' in output
+        assert 'No decisions identified' in output
 
 
 class TestFormatMarkdownOutput:
@@ -118,6 +151,14 @@ class TestFormatMarkdownOutput:
         assert 'Decisions' in output or 'DECISIONS' in output
         assert 'Questions' in output or 'QUESTIONS' in output
         assert 'Attendees' in output or 'ATTENDEES' in output
+        
+    def test_format_markdown_output_omits_unrequested_sections(self):
+        """Test that a partial analysis only renders its own sections"""
+        output = format_markdown_output({'decisions': [], 'timestamp': datetime.now()})
+        
+        assert '## 📅 Decisions Made' in output
+        assert 'No decisions identified' in output
+        assert 'Summary' not in output
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""
+Unit tests for job_queue module
+"""
+
+import threading
+from job_queue import AnalysisQueue, DONE, FAILED
+
+
+class TestAnalysisQueue:
+    """Tests for AnalysisQueue class"""
+    
+    def test_submit_returns_before_analysis_finishes(self):
+        """Test that the caller isn't blocked while a job runs"""
+        release = threading.Event()
+        queue = AnalysisQueue(lambda transcript: release.wait(5) and {'summary': transcript})
+        try:
+            job = queue.submit("John: first meeting")
+            assert queue.pending() == [job]
+            release.set()
+            assert queue.wait(timeout=5)
+        finally:
+            queue.shutdown()
+        
+        assert job.status == DONE
+        assert job.result == {'summary': "John: first meeting"}
+        assert queue.pending() == []
+        
+    def test_on_complete_reports_results_and_errors(self):
+        """Test that every job is reported once, including failures"""
+        def analyze(transcript):
+            if "bad" in transcript:
+                raise ValueError("cannot analyze")
+            return {'summary': transcript}
+        
+        finished = []
+        queue = AnalysisQueue(analyze, workers=2, on_complete=finished.append)
+        good = queue.submit("good meeting")
+        bad = queue.submit("bad meeting")
+        queue.wait(timeout=5)
+        queue.shutdown()
+        
+        assert sorted(job.id for job in finished) == [good.id, bad.id]
+        assert good.status == DONE
+        assert bad.status == FAILED
+        assert str(bad.error) == "cannot analyze"
+        assert good.transcript is None  # released after the job ran
+        
+    def test_jobs_run_in_background_concurrently(self):
+        """Test that workers analyze several transcripts at once"""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def analyze(transcript):
+            barrier.wait()
+            return {}
+        
+        queue = AnalysisQueue(analyze, workers=2)
+        jobs = [queue.submit("one"), queue.submit("two")]
+        assert queue.wait(timeout=5)
+        queue.shutdown()
+        assert [job.status for job in jobs] == [DONE, DONE]
+        
+    def test_sections_are_reported_while_the_job_runs(self):
+        """Test that on_section receives each streamed section with its job"""
+        def analyze(transcript, on_section):
+            on_section('summary', transcript)
+            on_section('action_items', [])
+            return {'summary': transcript, 'action_items': []}
+        
+        sections = []
+        queue = AnalysisQueue(analyze, on_section=lambda job, key, value: sections.append((job.id, key, value)))
+        job = queue.submit("standup")
+        assert queue.wait(timeout=5)
+        queue.shutdown()
+        
+        assert sections == [(job.id, 'summary', "standup"), (job.id, 'action_items', [])]
+        assert job.status == DONE
+        
+    def test_preview_is_first_line(self):
+        """Test that jobs are labelled by a short preview of their first line"""
+        queue = AnalysisQueue(lambda transcript: {})
+        job = queue.submit("  Sarah: " + "x" * 100 + "\nMike: hi")
+        queue.wait(timeout=5)
+        queue.shutdown()
+        assert job.preview.startswith("Sarah: xxx")
+        assert job.preview.endswith("...")
+        assert len(job.preview) == 43
+        
+    def test_cancelled_jobs_do_not_run_and_workers_are_daemons(self):
+        """Test that shutdown(cancel_pending=True) drops queued jobs without waiting"""
+        release = threading.Event()
+        started = []
+        
+        def analyze(transcript):
+            started.append(transcript)
+            release.wait(5)
+            return {}
+        
+        queue = AnalysisQueue(analyze, workers=1)
+        running = queue.submit("running")
+        queued = queue.submit("queued")
+        while not started:
+            release.wait(0.01)
+        queue.shutdown(cancel_pending=True)
+        
+        assert all(thread.daemon for thread in queue._threads)
+        assert queued._future.cancelled()
+        release.set()
+        assert running._future.result(timeout=5) is None
+        assert started == ["running"]
+        assert running.status == DONE
@@ -0,0 +1,92 @@
+"""
+Unit tests for latency module
+"""
+
+import threading
+import time
+import pytest
+from latency import LatencyTracker, hedged_call
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker class"""
+    
+    def test_default_until_enough_samples(self):
+        """Test that the default is used while the window is nearly empty"""
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record(1.0)
+        assert tracker.percentile(95, default=10.0) == 10.0
+        
+    def test_percentile_of_window(self):
+        """Test percentile selection over recent samples"""
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for i in range(1, 101):
+            tracker.record(i / 100)
+        assert tracker.percentile(50, default=0) == pytest.approx(0.51)
+        assert tracker.percentile(95, default=0) == pytest.approx(0.96)
+        assert tracker.percentile(100, default=0) == pytest.approx(1.0)
+
+
+class TestHedgedCall:
+    """Tests for hedged_call function"""
+    
+    def test_fast_primary_sends_no_backup(self):
+        """Test that the backup is not sent when the primary answers in time"""
+        backup_calls = []
+        result = hedged_call(lambda: "primary", lambda: backup_calls.append(1), hedge_delay=1.0)
+        assert result == ("primary", False)
+        assert backup_calls == []
+        
+    def test_slow_primary_is_hedged(self):
+        """Test that a slow primary loses to the backup"""
+        release = threading.Event()
+        try:
+            result = hedged_call(lambda: release.wait(5) and "primary", lambda: "backup", hedge_delay=0.05)
+        finally:
+            release.set()
+        assert result == ("backup", True)
+        
+    def test_primary_error_before_hedge_is_raised(self):
+        """Test that a fast failure is left to the retry policy instead of hedged"""
+        def fail():
+            raise ValueError("bad request")
+        
+        with pytest.raises(ValueError):
+            hedged_call(fail, lambda: "backup", hedge_delay=1.0)
+            
+    def test_failed_backup_still_waits_for_primary(self):
+        """Test that one failure doesn't discard the other in-flight request"""
+        def fail():
+            raise ConnectionError("backup down")
+        
+        result = hedged_call(lambda: time.sleep(0.2) or "primary", fail, hedge_delay=0.05)
+        assert result == ("primary", False)
+        
+    def test_timeout(self):
+        """Test that neither answering within the timeout raises TimeoutError"""
+        release = threading.Event()
+        try:
+            with pytest.raises(TimeoutError):
+                hedged_call(lambda: release.wait(5), lambda: release.wait(5), hedge_delay=0.05, timeout=0.1)
+        finally:
+            release.set()
+            
+    def test_many_concurrent_calls_are_not_queued(self):
+        """Test that simultaneous hedged calls all start at once instead of waiting for workers"""
+        barrier = threading.Barrier(40, timeout=5)
+        backups = []
+        
+        def primary():
+            barrier.wait()
+            return "primary"
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            hedged_call(primary, lambda: backups.append(1), hedge_delay=5.0))) for _ in range(40)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        
+        assert results == [("primary", False)] * 40
+        assert backups == []
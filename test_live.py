@@ -0,0 +1,91 @@
+"""
+Unit tests for live module
+"""
+
+from unittest.mock import patch
+import analyzer
+from live import LiveSession, TranscriptTail
+
+
+class TestTranscriptTail:
+    """Tests for TranscriptTail class"""
+    
+    def test_reads_only_complete_appended_lines(self, tmp_path):
+        """Test that partial lines are held back until their newline arrives"""
+        path = tmp_path / "meeting.txt"
+        path.write_text("John: hello\nSarah: hi th")
+        tail = TranscriptTail(str(path))
+        
+        assert tail.read_new() == "John: hello\n"
+        assert tail.read_new() == ""
+        with open(path, 'a') as f:
+            f.write("ere\nMike: yo")
+        assert tail.read_new() == "Sarah: hi there\n"
+        assert tail.read_remaining() == "Mike: yo"
+        
+    def test_restarts_when_file_is_truncated(self, tmp_path):
+        """Test that a replaced, shorter file is read from the top"""
+        path = tmp_path / "meeting.txt"
+        path.write_text("John: a long first version\n")
+        tail = TranscriptTail(str(path))
+        tail.read_new()
+        path.write_text("New: file\n")
+        assert tail.read_new() == "New: file\n"
+
+
+class TestLiveSession:
+    """Tests for LiveSession class"""
+    
+    def test_debounces_and_sends_only_new_text(self, tmp_path):
+        """Test that refreshes wait for a quiet period and analyze only the delta"""
+        path = tmp_path / "meeting.txt"
+        path.write_text("")
+        updates = []
+        session = LiveSession(str(path), use_demo=True, debounce=5.0, max_wait=30.0,
+                              on_update=updates.append)
+        
+        with open(path, 'a') as f:
+            f.write("John: I will draft the plan.\n")
+        with patch('analyzer.analyze_transcript_update', wraps=analyzer.analyze_transcript_update) as spy:
+            assert session.poll(now=0.0) is False
+            with open(path, 'a') as f:
+                f.write("Sarah: We agreed to launch Monday.\n")
+            assert session.poll(now=3.0) is False  # still growing
+            assert session.poll(now=8.0) is True   # quiet for 5 seconds
+            with open(path, 'a') as f:
+                f.write("Mike: Should we invite legal?\n")
+            session.poll(now=9.0)
+            assert session.poll(now=14.0) is True
+        
+        segments = [call.args[0] for call in spy.call_args_list]
+        assert segments == ["John: I will draft the plan.\nSarah: We agreed to launch Monday.\n",
+                            "Mike: Should we invite legal?\n"]
+        assert len(updates) == 2
+        assert session.analysis['attendees'] == ['John', 'Sarah', 'Mike']
+        assert session.analysis['questions'] == ['Should we invite legal?']
+        
+    def test_max_wait_forces_refresh_during_continuous_growth(self, tmp_path):
+        """Test that a transcript that never goes quiet still refreshes"""
+        path = tmp_path / "meeting.txt"
+        path.write_text("")
+        session = LiveSession(str(path), use_demo=True, debounce=5.0, max_wait=10.0)
+        refreshed = []
+        for second in range(0, 12, 2):
+            with open(path, 'a') as f:
+                f.write(f"John: point {second}\n")
+            refreshed.append(session.poll(now=float(second)))
+        assert refreshed == [False, False, False, False, False, True]
+        
+    def test_failed_refresh_keeps_text(self, tmp_path):
+        """Test that text is not lost when an update fails"""
+        path = tmp_path / "meeting.txt"
+        path.write_text("John: hello\n")
+        session = LiveSession(str(path), debounce=0.0)
+        with patch('analyzer.analyze_transcript_update', side_effect=Exception("offline")):
+            try:
+                session.poll(now=0.0)
+            except Exception:
+                pass
+        with patch('analyzer.analyze_transcript_update', return_value={'summary': 'ok'}) as mock_update:
+            assert session.finish() == {'summary': 'ok'}
+        assert mock_update.call_args.args[0] == "John: hello\n"
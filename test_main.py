@@ -0,0 +1,100 @@
+"""
+Unit tests for main module
+"""
+
+import argparse
+import io
+import pytest
+from unittest.mock import patch
+from main import get_multiline_input, parse_sections, read_stdin_bulk
+
+
+class TestReadStdinBulk:
+    """Tests for read_stdin_bulk function"""
+    
+    def test_reads_whole_stream_in_blocks(self):
+        """Test that chunked reads return the full text"""
+        text = "John: line\n" * 1000
+        assert read_stdin_bulk(io.StringIO(text), chunk_size=100) == text
+        
+    def test_caps_size_and_warns(self, capsys):
+        """Test that input beyond the cap is dropped with a warning"""
+        stream = io.StringIO("x" * 50)
+        result = read_stdin_bulk(stream, max_chars=20, chunk_size=8)
+        assert result == "x" * 20
+        assert "truncated" in capsys.readouterr().out
+        assert stream.read() == ""  # the rest is discarded, not left for the next read
+        
+    def test_exact_cap_does_not_warn(self, capsys):
+        """Test that input exactly at the cap is not reported as truncated"""
+        assert read_stdin_bulk(io.StringIO("x" * 20), max_chars=20) == "x" * 20
+        assert "truncated" not in capsys.readouterr().out
+
+
+class TestParseSections:
+    """Tests for the --sections option parser"""
+    
+    def test_plain_and_budgeted_sections(self):
+        """Test that budgets are optional and default per section"""
+        from analyzer import SECTION_MAX_TOKENS
+        assert parse_sections("action_items, decisions") == ['action_items', 'decisions']
+        assert parse_sections("action_items=800,summary") == {
+            'action_items': 800, 'summary': SECTION_MAX_TOKENS['summary']
+        }
+        
+    def test_invalid_sections_are_rejected(self):
+        """Test that typos and bad budgets are reported as usage errors"""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_sections("actions")
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_sections("summary=lots")
+
+
+class TestGetMultilineInput:
+    """Tests for get_multiline_input function"""
+    
+    def test_piped_input_is_read_in_bulk(self):
+        """Test that non-TTY stdin skips the per-line input() loop"""
+        with patch('sys.stdin', io.StringIO("Sarah: hello\nMike: hi\n\n")), \
+                patch('builtins.input') as mock_input:
+            assert get_multiline_input() == "Sarah: hello\nMike: hi"
+        mock_input.assert_not_called()
+        
+    def test_tty_input_uses_line_loop(self):
+        """Test that interactive terminals keep reading line by line until EOF"""
+        stdin = io.StringIO()
+        stdin.isatty = lambda: True
+        with patch('sys.stdin', stdin), \
+                patch('builtins.input', side_effect=["Sarah: hello", "Mike: hi", EOFError]):
+            assert get_multiline_input() == "Sarah: hello\nMike: hi"
+
+
+class TestSpeculativePreview:
+    """Tests for demo-first previews in interactive AI mode"""
+    
+    def test_preview_is_shown_then_replaced_by_ai_result(self, capsys, monkeypatch):
+        """Test that the preview appears first and the AI result replaces its history entry"""
+        import time
+        import analyzer
+        import main
+        from file_handler import _session_history
+        
+        def slow_ai(transcript, use_demo=False, **kwargs):
+            time.sleep(0.2)
+            result = analyzer.analyze_transcript_demo(transcript)
+            result['summary'] = 'AI summary'
+            return result
+        
+        _session_history.clear()
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(main, 'start_prewarm', lambda: None)
+        monkeypatch.setattr(analyzer, 'analyze_transcript', slow_ai)
+        monkeypatch.setattr('sys.stdin', io.StringIO("John: I will write the spec.\n"))
+        
+        main.main([])
+        output = capsys.readouterr().out
+        
+        assert output.index("Preview #1") < output.index("AI analysis #1 complete")
+        assert [a['summary'] for a in _session_history] == ['AI summary']
+        assert _session_history[0]['attendees'] == ['John']
+        _session_history.clear()
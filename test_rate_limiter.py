@@ -0,0 +1,85 @@
+"""
+Unit tests for rate_limiter module
+"""
+
+import threading
+import time
+import pytest
+from rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket class"""
+    
+    def test_reserve_within_capacity_is_immediate(self):
+        """Test that requests within the budget don't wait"""
+        bucket = TokenBucket(per_minute=60)
+        assert bucket.reserve(30, now=bucket._updated) == 0.0
+        assert bucket.reserve(30, now=bucket._updated) == 0.0
+        
+    def test_reserve_beyond_capacity_waits_for_refill(self):
+        """Test that an exhausted bucket returns the refill delay"""
+        bucket = TokenBucket(per_minute=60)  # one token per second
+        start = bucket._updated
+        bucket.reserve(60, now=start)
+        assert bucket.reserve(5, now=start) == pytest.approx(5.0)
+        # Ten seconds later the debt is paid off and 5 tokens are available again
+        assert bucket.reserve(5, now=start + 10) == 0.0
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class"""
+    
+    def test_aimd_concurrency(self):
+        """Test multiplicative decrease on 429 and additive increase on success"""
+        limiter = RateLimiter(max_concurrency=8)
+        limiter.on_rate_limited()
+        assert limiter.concurrency == 4
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+        assert limiter.concurrency == 1
+        
+        for _ in range(3):
+            with limiter.limit(10):
+                pass
+        assert limiter.concurrency == 3
+        assert limiter.stats()['rate_limited'] == 4
+        
+    def test_limit_caps_in_flight_requests(self):
+        """Test that no more than `concurrency` requests run at once"""
+        limiter = RateLimiter(max_concurrency=2)
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        
+        def worker():
+            nonlocal in_flight, peak
+            with limiter.limit(10):
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert peak == 2
+        assert limiter.stats()['in_flight'] == 0
+        
+    def test_failed_request_releases_slot(self):
+        """Test that exceptions inside the limit still free the slot"""
+        limiter = RateLimiter(max_concurrency=1)
+        with pytest.raises(RuntimeError):
+            with limiter.limit(10):
+                raise RuntimeError("boom")
+        assert limiter.stats()['in_flight'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,130 @@
+"""
+Unit tests for retry_policy module
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from retry_policy import (
+    CircuitBreaker,
+    RetryPolicy,
+    default_classify,
+    retry_after_seconds,
+    RATE_LIMIT,
+    SERVER,
+    TIMEOUT
+)
+
+
+def make_error(status_code=None, headers=None):
+    """Build an exception shaped like an SDK status error"""
+    error = Exception("boom")
+    error.status_code = status_code
+    error.response = Mock(headers=headers or {})
+    return error
+
+
+class TestClassify:
+    """Tests for default_classify function"""
+    
+    def test_classifies_by_status_and_type(self):
+        """Test status codes and builtin exception types"""
+        assert default_classify(make_error(429)) == RATE_LIMIT
+        assert default_classify(make_error(503)) == SERVER
+        assert default_classify(TimeoutError()) == TIMEOUT
+        assert default_classify(make_error(400)) is None
+        assert default_classify(ValueError()) is None
+
+
+class TestRetryAfter:
+    """Tests for retry_after_seconds function"""
+    
+    def test_reads_seconds_and_milliseconds(self):
+        """Test both retry-after header variants"""
+        assert retry_after_seconds(make_error(429, {'retry-after': '3'})) == 3.0
+        assert retry_after_seconds(make_error(429, {'retry-after-ms': '250'})) == 0.25
+        
+    def test_reads_http_date(self):
+        """Test an HTTP date in retry-after"""
+        error = make_error(429, {'retry-after': 'Wed, 21 Oct 2015 07:28:10 GMT'})
+        with patch('retry_policy.time.time', return_value=1445412480.0):
+            assert retry_after_seconds(error) == pytest.approx(10.0)
+            
+    def test_missing_or_invalid_header(self):
+        """Test that unusable hints are ignored"""
+        assert retry_after_seconds(Exception()) is None
+        assert retry_after_seconds(make_error(429, {'retry-after': 'soon'})) is None
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy class"""
+    
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that delays stay within the full-jitter envelope"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        for attempt in range(8):
+            delay = policy.backoff(attempt)
+            assert 0 <= delay <= min(5.0, 2 ** attempt)
+            
+    def test_budgets_are_per_category(self):
+        """Test that each error class has its own retry budget"""
+        policy = RetryPolicy(budgets={RATE_LIMIT: 2, SERVER: 1})
+        attempts = {}
+        assert policy.next_delay(make_error(429), attempts) is not None
+        assert policy.next_delay(make_error(429), attempts) is not None
+        assert policy.next_delay(make_error(429), attempts) is None
+        assert policy.next_delay(make_error(500), attempts) is not None
+        assert policy.next_delay(make_error(500), attempts) is None
+        assert policy.next_delay(make_error(400), attempts) is None
+        
+    def test_retry_after_overrides_backoff(self):
+        """Test that the server hint wins, capped at max_delay"""
+        policy = RetryPolicy(max_delay=10.0)
+        assert policy.next_delay(make_error(429, {'retry-after': '7'}), {}) == 7.0
+        assert policy.next_delay(make_error(429, {'retry-after': '60'}), {}) == 10.0
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker class"""
+    
+    def test_opens_after_error_rate_threshold(self):
+        """Test that the circuit opens once enough calls fail"""
+        breaker = CircuitBreaker(failure_threshold=0.5, min_calls=4, cooldown=30.0)
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        
+    def test_half_open_probe(self):
+        """Test that one probe is allowed after the cooldown"""
+        breaker = CircuitBreaker(min_calls=1, cooldown=30.0)
+        with patch('retry_policy.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+        with patch('retry_policy.time.monotonic', return_value=131.0):
+            assert breaker.allow()
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert not breaker.allow()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+        with patch('retry_policy.time.monotonic', return_value=162.0):
+            assert breaker.allow()
+            breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+        
+    def test_probe_without_outcome_does_not_wedge(self):
+        """Test that a released or timed-out probe lets another call probe"""
+        breaker = CircuitBreaker(min_calls=1, cooldown=30.0, probe_timeout=60.0)
+        with patch('retry_policy.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+        with patch('retry_policy.time.monotonic', return_value=131.0):
+            assert breaker.allow()
+            breaker.release()
+            assert breaker.allow()
+            assert not breaker.allow()
+        with patch('retry_policy.time.monotonic', return_value=192.0):
+            assert breaker.allow()
+            breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,134 @@
+"""
+Unit tests for watcher module
+"""
+
+import os
+import threading
+import time
+from watcher import FolderWatcher, load_manifest, save_manifest
+
+
+TRANSCRIPT = """John: Good morning everyone.
+Sarah: I will finish the report by Friday.
+"""
+
+
+class TestScan:
+    """Tests for FolderWatcher.scan"""
+    
+    def test_files_are_ready_only_after_settling(self, tmp_path):
+        """Test that a file still changing is not picked up"""
+        path = tmp_path / "meeting.txt"
+        path.write_text("John: part one")
+        watcher = FolderWatcher(str(tmp_path), str(tmp_path / "out"), settle=2.0)
+        
+        assert watcher.scan(now=0.0) == []
+        assert watcher.scan(now=1.0) == []
+        path.write_text("John: part one\nSarah: part two")  # still being written
+        assert watcher.scan(now=2.5) == []
+        ready = watcher.scan(now=5.0)
+        
+        assert [p for p, _ in ready] == [str(path)]
+        
+    def test_manifest_skips_processed_files_until_changed(self, tmp_path):
+        """Test that recorded files are ignored unless their contents change"""
+        path = tmp_path / "meeting.txt"
+        path.write_text("John: hello")
+        stat = os.stat(path)
+        manifest_path = str(tmp_path / "manifest.json")
+        save_manifest(manifest_path, {"meeting.txt": {"signature": [stat.st_size, stat.st_mtime_ns]}})
+        
+        watcher = FolderWatcher(str(tmp_path), str(tmp_path / "out"), settle=0.0,
+                                manifest_path=manifest_path)
+        assert watcher.scan(now=0.0) == []
+        assert watcher.scan(now=1.0) == []
+        
+        path.write_text("John: hello again")
+        watcher.scan(now=2.0)
+        assert [p for p, _ in watcher.scan(now=3.0)] == [str(path)]
+        
+        
+    def test_transient_failures_are_retried_with_backoff(self, tmp_path):
+        """Test that an API outage isn't recorded, but an empty file is"""
+        from concurrent.futures import Future
+        import watcher as watcher_module
+        flaky = tmp_path / "flaky.txt"
+        flaky.write_text("John: hello")
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        watcher = FolderWatcher(str(tmp_path), str(tmp_path / "out"), settle=0.0)
+        
+        def finish(path, error, now):
+            future = Future()
+            future.set_exception(error)
+            watcher._in_flight[future] = (str(path), watcher_module._signature(str(path)))
+            watcher._collect(now)
+        
+        finish(flaky, Exception("Rate limit exceeded. Please try again later."), now=0.0)
+        finish(empty, ValueError("Empty transcript"), now=0.0)
+        assert list(watcher.manifest) == ["empty.txt"]
+        
+        base = watcher_module.RETRY_BACKOFF_BASE
+        watcher.scan(now=1.0)
+        assert watcher.scan(now=2.0) == []
+        watcher.scan(now=base)
+        assert [p for p, _ in watcher.scan(now=base + 1)] == [str(flaky)]
+        
+        # A second failure waits twice as long
+        finish(flaky, TimeoutError("deadline"), now=base + 1)
+        watcher.scan(now=base * 2)
+        assert watcher.scan(now=base * 2 + 1) == []
+        watcher.scan(now=base * 3 + 1)
+        assert [p for p, _ in watcher.scan(now=base * 3 + 2)] == [str(flaky)]
+
+
+class TestManifest:
+    """Tests for manifest helpers"""
+    
+    def test_round_trip_and_missing_file(self, tmp_path):
+        """Test saving and loading, and that a missing manifest is empty"""
+        path = str(tmp_path / "sub" / "manifest.json")
+        assert load_manifest(path) == {}
+        save_manifest(path, {"a.txt": {"signature": [1, 2], "output": "a.md"}})
+        assert load_manifest(path) == {"a.txt": {"signature": [1, 2], "output": "a.md"}}
+
+
+class TestRun:
+    """Tests for FolderWatcher.run"""
+    
+    def test_new_transcripts_are_analyzed_once(self, tmp_path):
+        """Test the watch loop end to end in demo mode, including a restart"""
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        out_dir = tmp_path / "out"
+        results = []
+        
+        def run_until(condition, watcher, timeout=10):
+            stop = threading.Event()
+            thread = threading.Thread(target=watcher.run, args=(stop,))
+            thread.start()
+            deadline = time.monotonic() + timeout
+            while not condition() and time.monotonic() < deadline:
+                time.sleep(0.02)
+            stop.set()
+            watcher.wake()
+            thread.join(timeout=10)
+        
+        (inbox / "standup.txt").write_text(TRANSCRIPT)
+        (inbox / "empty.txt").write_text("")
+        watcher = FolderWatcher(str(inbox), str(out_dir), jobs=2, use_demo=True, settle=0.05,
+                                poll_interval=0.02,
+                                on_result=lambda path, output, error, saved: results.append((path, output, error)))
+        run_until(lambda: len(results) == 2, watcher)
+        
+        outputs = {os.path.basename(path): (output, error) for path, output, error in results}
+        assert outputs["standup.txt"][0] == str(out_dir / "standup.md")
+        assert os.path.exists(out_dir / "standup.md")
+        assert isinstance(outputs["empty.txt"][1], ValueError)
+        
+        # A restarted watcher finds everything in the manifest
+        results.clear()
+        restarted = FolderWatcher(str(inbox), str(out_dir), use_demo=True, settle=0.05, poll_interval=0.02,
+                                  on_result=lambda path, output, error, saved: results.append(path))
+        run_until(lambda: False, restarted, timeout=0.3)
+        assert results == []
@@ -0,0 +1,262 @@
+"""
+Meeting Notes AI - Folder Watcher Module
+Handles hands-off analysis of transcripts dropped into a watched directory.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from batch import INFLIGHT_PER_WORKER, analyze_file, iter_transcript_files
+
+
+MANIFEST_NAME = '.meeting-notes-manifest.json'
+
+# Seconds a file's size and mtime must stay unchanged before it is analyzed
+DEFAULT_SETTLE_SECONDS = 2.0
+
+# Polling interval without inotify, or while files are settling
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Safety rescan interval when file system events are available
+IDLE_RESCAN_INTERVAL = 60.0
+
+# Seconds before retrying a file whose analysis failed for a transient reason
+# (rate limits, connection errors, open circuit, deadlines); doubles per failure
+RETRY_BACKOFF_BASE = 30.0
+RETRY_BACKOFF_MAX = 900.0
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    """Get (size, mtime_ns) of a file, or None if it has disappeared."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def load_manifest(path: str) -> Dict[str, Dict[str, any]]:
+    """
+    Load the processed-files manifest.
+    
+    Args:
+        path: Manifest file path
+        
+    Returns:
+        Mapping of transcript path to its recorded state (empty if missing or unreadable)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(path: str, manifest: Dict[str, Dict[str, any]]) -> None:
+    """
+    Atomically write the processed-files manifest.
+    
+    Args:
+        path: Manifest file path
+        manifest: Mapping of transcript path to its recorded state
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class FolderWatcher:
+    """
+    Watches a directory and analyzes each new or changed transcript once.
+    
+    Uses file system events (inotify, via the optional watchdog package)
+    when available and falls back to polling. A file is only picked up once
+    its size and mtime have been stable for `settle` seconds, so exports
+    still being written are skipped. Analyses run on a bounded thread pool,
+    and a manifest in the output directory records what has been processed
+    so restarts don't repeat work. Files that can never succeed (empty or
+    undecodable ones) are recorded too; transient failures are retried with
+    exponential backoff instead.
+    """
+    
+    def __init__(self, directory: str, out_dir: str, jobs: int = 4, use_demo: bool = False,
+                 use_cache: bool = True, structured: bool = False,
+                 sections: Optional[Union[Iterable[str], Dict[str, int]]] = None,
+                 settle: float = DEFAULT_SETTLE_SECONDS, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 manifest_path: Optional[str] = None,
+                 on_result: Optional[Callable[[str, Optional[str], Optional[Exception], Optional[int]],
+                                              None]] = None):
+        self.directory = directory
+        self.out_dir = out_dir
+        self.jobs = max(1, jobs)
+        self.use_demo = use_demo
+        self.use_cache = use_cache
+        self.structured = structured
+        self.sections = sections
+        self.settle = settle
+        self.poll_interval = poll_interval
+        self.manifest_path = manifest_path or os.path.join(out_dir, MANIFEST_NAME)
+        self.on_result = on_result
+        self.manifest = load_manifest(self.manifest_path)
+        self.using_events = False
+        self._settling = {}  # path -> (signature, time first seen with it)
+        self._in_flight = {}  # future -> (path, signature)
+        self._backoff = {}  # path -> (signature, failures, monotonic time to retry at)
+        self._executor = None
+        self._wake = threading.Event()
+        
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self.directory)
+        
+    def scan(self, now: Optional[float] = None) -> List[Tuple[str, Tuple[int, int]]]:
+        """
+        Find transcripts that are new or changed and have finished settling.
+        
+        Args:
+            now: Current monotonic time (defaults to time.monotonic())
+            
+        Returns:
+            List of (path, signature) pairs ready for analysis
+        """
+        if now is None:
+            now = time.monotonic()
+        busy = {path for path, _ in self._in_flight.values()}
+        ready = []
+        seen = set()
+        
+        for path in iter_transcript_files([self.directory]):
+            seen.add(path)
+            if path in busy:
+                continue
+            signature = _signature(path)
+            if signature is None:
+                continue
+            recorded = self.manifest.get(self._key(path))
+            if recorded and tuple(recorded['signature']) == signature:
+                continue
+            backoff = self._backoff.get(path)
+            if backoff and backoff[0] == signature and now < backoff[2]:
+                continue
+            
+            previous = self._settling.get(path)
+            if previous is None or previous[0] != signature:
+                self._settling[path] = (signature, now)
+            elif now - previous[1] >= self.settle:
+                del self._settling[path]
+                ready.append((path, signature))
+        
+        # Forget files that were deleted before they settled or were retried
+        for pending in (self._settling, self._backoff):
+            for path in list(pending):
+                if path not in seen:
+                    del pending[path]
+        return ready
+        
+    def poll_once(self, now: Optional[float] = None) -> None:
+        """Collect finished analyses and start new ones, without blocking."""
+        if now is None:
+            now = time.monotonic()
+        self._collect(now)
+        capacity = self.jobs * INFLIGHT_PER_WORKER - len(self._in_flight)
+        for path, signature in self.scan(now):
+            if capacity <= 0:
+                # Still unprocessed, so it will be found again on the next scan
+                break
+            future = self._executor.submit(analyze_file, path, self.out_dir, self.use_demo,
+                                           self.use_cache, self.structured, self.sections,
+                                           os.path.abspath(self.directory))
+            future.add_done_callback(lambda _: self._wake.set())
+            self._in_flight[future] = (path, signature)
+            capacity -= 1
+            
+    def _collect(self, now: Optional[float] = None) -> None:
+        """Record finished analyses in the manifest and report them."""
+        if now is None:
+            now = time.monotonic()
+        done = [future for future in self._in_flight if future.done()]
+        changed = False
+        for future in done:
+            path, signature = self._in_flight.pop(future)
+            entry = {'signature': list(signature)}
+            tokens_saved = None
+            try:
+                (output, tokens_saved), error = future.result(), None
+                entry['output'] = output
+            except Exception as e:
+                output, error = None, e
+                entry['error'] = str(e)
+            
+            if error is None or isinstance(error, ValueError):
+                # A bad file (empty, undecodable) isn't retried until it changes
+                self.manifest[self._key(path)] = entry
+                self._backoff.pop(path, None)
+                changed = True
+            else:
+                previous = self._backoff.get(path)
+                failures = previous[1] + 1 if previous and previous[0] == signature else 1
+                delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (failures - 1))
+                self._backoff[path] = (signature, failures, now + delay)
+            if self.on_result:
+                self.on_result(path, output, error, tokens_saved)
+        if changed:
+            save_manifest(self.manifest_path, self.manifest)
+            
+    def _start_observer(self):
+        """Start a watchdog observer that wakes the loop on any change, if installed."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return None
+        
+        wake = self._wake
+        
+        class WakeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake.set()
+        
+        observer = Observer()
+        observer.schedule(WakeHandler(), self.directory, recursive=True)
+        observer.start()
+        return observer
+        
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        """
+        Watch the directory until `stop` is set or the process is interrupted.
+        
+        Args:
+            stop: Optional event that ends the loop when set
+        """
+        stop = stop or threading.Event()
+        os.makedirs(self.out_dir, exist_ok=True)
+        observer = self._start_observer()
+        self.using_events = observer is not None
+        self._executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            while not stop.is_set():
+                self.poll_once()
+                if self._settling or self._in_flight or observer is None:
+                    timeout = self.poll_interval
+                else:
+                    timeout = IDLE_RESCAN_INTERVAL
+                self._wake.wait(timeout)
+                self._wake.clear()
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            self._executor.shutdown(wait=True)
+            self._collect()
+            
+    def wake(self) -> None:
+        """Make the watch loop rescan immediately, e.g. after setting its stop event."""
+        self._wake.set()